@@ -0,0 +1,56 @@
+"""
+Hatch build hook that stamps the git build identifier into the wheel.
+
+Adds a generated ``nexkit/_build.py`` containing the output of
+``git describe`` so that installed copies of nexkit can show their build
+without running git. When git or the repository history is unavailable
+(e.g. building from an sdist) nothing is added and nexkit falls back to its
+runtime cache.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class BuildInfoHook(BuildHookInterface):
+    """Stamp ``nexkit._build.BUILD_TAG`` into wheels at build time."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        self._temp_dir = None
+        # Editable installs are source checkouts: the runtime cache handles them
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        try:
+            result = subprocess.run(
+                ["git", "describe", "--tags", "--always", "--dirty"],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return
+
+        build_tag = result.stdout.strip()
+        if result.returncode != 0 or not build_tag:
+            return
+
+        self._temp_dir = tempfile.mkdtemp(prefix="nexkit-build-")
+        build_file = Path(self._temp_dir) / "_build.py"
+        build_file.write_text(
+            '"""Build information stamped by hatch_build.py. Do not edit."""\n\n'
+            f"BUILD_TAG = {build_tag!r}\n",
+            encoding="utf-8",
+        )
+        build_data["force_include"][str(build_file)] = "nexkit/_build.py"
+
+    def finalize(self, version, build_data, artifact_path):
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
@@ -27,46 +27,44 @@ Or install globally:
 import os
 import subprocess
 import sys
-import zipfile
-import tempfile
 import shutil
 import shlex
-import json
 from pathlib import Path
-from typing import Optional, Tuple
-from importlib import metadata
+from typing import Optional
 
 import typer
-import httpx
-from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
-from rich.table import Table
-from rich.tree import Tree
 from typer.core import TyperGroup
 
 # Nexkit modules
+# Network/TLS (``nexkit.network``), template download (``nexkit.template``),
+# interactive selection and Live rendering are imported lazily by the commands
+# that need them so hook-style invocations stay cheap.
 from . import gitignore
+from .output import OUTPUT_FORMATS, OUTPUT_HELP
+from .buildinfo import get_build_tag, get_git_tag, get_version
+from .ui import StepTracker, console, get_console, get_key, select_with_arrows
+
+# Names that moved into lazily imported submodules, kept importable from the
+# package root for backwards compatibility.
+_LAZY_ATTRS = {
+    "download_template_from_github": "template",
+    "download_and_extract_template": "template",
+    "_github_token": "network",
+    "_github_auth_headers": "network",
+}
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
-
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
 
-def _github_token(cli_token: str | None = None) -> str | None:
-    """Return sanitized GitHub token (cli arg takes precedence) or None."""
-    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+def __getattr__(name: str):
+    """Resolve moved names on first access without importing them eagerly."""
+    if name in _LAZY_ATTRS:
+        import importlib
 
-def _github_auth_headers(cli_token: str | None = None) -> dict:
-    """Return Authorization header dict only when a non-empty token exists."""
-    token = _github_token(cli_token)
-    return {"Authorization": f"Bearer {token}"} if token else {}
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 AI_CHOICES = {
     "copilot": "GitHub Copilot",
@@ -98,212 +96,14 @@ BANNER = """
 
 TAGLINE = "Nexkit - Spec-Driven Development Toolkit"
 
-def get_version() -> str:
-    """Get the package version from metadata."""
-    try:
-        return metadata.version("nexkit")
-    except metadata.PackageNotFoundError:
-        return "unknown"
-
-def get_git_tag() -> str:
-    """Get the current git tag or commit hash."""
-    try:
-        result = subprocess.run(
-            ["git", "describe", "--tags", "--always", "--dirty"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=Path(__file__).parent
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return "unknown"
-    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return "unknown"
-
-class StepTracker:
-    """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
-    Supports live auto-refresh via an attached refresh callback.
-    """
-    def __init__(self, title: str):
-        self.title = title
-        self.steps = []  # list of dicts: {key, label, status, detail}
-        self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
-        self._refresh_cb = None  # callable to trigger UI refresh
-
-    def attach_refresh(self, cb):
-        self._refresh_cb = cb
-
-    def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
-
-    def start(self, key: str, detail: str = ""):
-        self._update(key, status="running", detail=detail)
-
-    def complete(self, key: str, detail: str = ""):
-        self._update(key, status="done", detail=detail)
-
-    def error(self, key: str, detail: str = ""):
-        self._update(key, status="error", detail=detail)
-
-    def skip(self, key: str, detail: str = ""):
-        self._update(key, status="skipped", detail=detail)
-
-    def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-        # If not present, add it
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
-        self._maybe_refresh()
-
-    def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
-
-    def render(self):
-        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-
-            # Circles (unchanged styling)
-            status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
-
-            if status == "pending":
-                # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
-            else:
-                # Label white, detail (if any) light gray in parentheses
-                if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
-
-            tree.add(line)
-        return tree
-
-def get_key():
-    """Get a single keypress in a cross-platform way using readchar."""
-    key = readchar.readkey()
-
-    if key == readchar.key.UP or key == readchar.key.CTRL_P:
-        return 'up'
-    if key == readchar.key.DOWN or key == readchar.key.CTRL_N:
-        return 'down'
-
-    if key == readchar.key.ENTER:
-        return 'enter'
-
-    if key == readchar.key.ESC:
-        return 'escape'
-
-    if key == readchar.key.CTRL_C:
-        raise KeyboardInterrupt
-
-    return key
-
-def select_with_arrows(options: dict, prompt_text: str = "Select an option", default_key: str = None) -> str:
-    """
-    Interactive selection using arrow keys with Rich Live display.
-    
-    Args:
-        options: Dict with keys as option keys and values as descriptions
-        prompt_text: Text to show above the options
-        default_key: Default option key to start with
-        
-    Returns:
-        Selected option key
-    """
-    option_keys = list(options.keys())
-    if default_key and default_key in option_keys:
-        selected_index = option_keys.index(default_key)
-    else:
-        selected_index = 0
-
-    selected_key = None
-
-    def create_selection_panel():
-        """Create the selection panel with current selection highlighted."""
-        table = Table.grid(padding=(0, 2))
-        table.add_column(style="cyan", justify="left", width=3)
-        table.add_column(style="white", justify="left")
-
-        for i, key in enumerate(option_keys):
-            if i == selected_index:
-                table.add_row("▶", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
-            else:
-                table.add_row(" ", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
-
-        table.add_row("", "")
-        table.add_row("", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
+# Set by --no-banner; NEXKIT_NO_BANNER is honoured as well (see banner_disabled)
+_no_banner = False
 
-        return Panel(
-            table,
-            title=f"[bold]{prompt_text}[/bold]",
-            border_style="cyan",
-            padding=(1, 2)
-        )
-
-    console.print()
-
-    def run_selection_loop():
-        nonlocal selected_key, selected_index
-        with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
-            while True:
-                try:
-                    key = get_key()
-                    if key == 'up':
-                        selected_index = (selected_index - 1) % len(option_keys)
-                    elif key == 'down':
-                        selected_index = (selected_index + 1) % len(option_keys)
-                    elif key == 'enter':
-                        selected_key = option_keys[selected_index]
-                        break
-                    elif key == 'escape':
-                        console.print("\n[yellow]Selection cancelled[/yellow]")
-                        raise typer.Exit(1)
-
-                    live.update(create_selection_panel(), refresh=True)
-
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Selection cancelled[/yellow]")
-                    raise typer.Exit(1)
-
-    run_selection_loop()
-
-    if selected_key is None:
-        console.print("\n[red]Selection failed.[/red]")
-        raise typer.Exit(1)
-
-    # Suppress explicit selection print; tracker / later logic will report consolidated status
-    return selected_key
-
-console = Console()
+def banner_disabled() -> bool:
+    """Return True when the banner is turned off via --no-banner or NEXKIT_NO_BANNER."""
+    if _no_banner:
+        return True
+    return os.getenv("NEXKIT_NO_BANNER", "").strip().lower() in ("1", "true", "yes", "on")
 
 class BannerGroup(TyperGroup):
     """Custom group that shows banner before help."""
@@ -324,6 +124,9 @@ app = typer.Typer(
 
 def show_banner():
     """Display the ASCII art banner with version information."""
+    if banner_disabled():
+        return
+
     # Create gradient effect with different colors
     banner_lines = BANNER.strip().split('\n')
     colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
@@ -338,7 +141,7 @@ def show_banner():
     
     # Display version and git tag information
     version = get_version()
-    git_tag = get_git_tag()
+    git_tag = get_build_tag()
     version_info = Text()
     version_info.append("Version: ", style="bright_black")
     version_info.append(version, style="bright_white")
@@ -351,11 +154,16 @@ def version_callback(value: bool):
     """Callback for --version flag."""
     if value:
         version = get_version()
-        git_tag = get_git_tag()
+        git_tag = get_build_tag()
         console.print(f"nexkit version [bright_white]{version}[/bright_white]")
         console.print(f"Build: [bright_white]{git_tag}[/bright_white]")
         raise typer.Exit()
 
+def no_banner_callback(value: bool):
+    """Callback for --no-banner flag (eager so it also applies to --help)."""
+    global _no_banner
+    _no_banner = bool(value)
+
 @app.callback()
 def callback(
     ctx: typer.Context,
@@ -366,12 +174,22 @@ def callback(
         callback=version_callback,
         is_eager=True,
         help="Show version information and exit."
-    )
+    ),
+    no_banner: bool = typer.Option(
+        False,
+        "--no-banner",
+        envvar="NEXKIT_NO_BANNER",
+        callback=no_banner_callback,
+        is_eager=True,
+        help="Skip the banner (for scripted use). Also enabled by NEXKIT_NO_BANNER=1."
+    ),
 ):
     """Show banner when no subcommand is provided."""
     # Show banner only when no subcommand and no help flag
     # (help is handled by BannerGroup)
     if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
+        if banner_disabled():
+            return
         show_banner()
         console.print(Align.center("[dim]Run 'nexkit --help' for usage information[/dim]"))
         console.print()
@@ -394,14 +212,9 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
             raise
         return None
 
-def check_tool_for_tracker(tool: str, tracker: StepTracker) -> bool:
-    """Check if a tool is installed and update tracker."""
-    if shutil.which(tool):
-        tracker.complete(tool, "available")
-        return True
-    else:
-        tracker.error(tool, "not found")
-        return False
+def probe_tool(tool: str) -> tuple[bool, str]:
+    """Probe for a tool on PATH, returning (found, tracker detail). Never blocks."""
+    return (True, "available") if shutil.which(tool) else (False, "not found")
 
 def check_tool(tool: str, install_hint: str) -> bool:
     """Check if a tool is installed."""
@@ -420,71 +233,58 @@ def check_tool(tool: str, install_hint: str) -> bool:
     else:
         return False
 
-def _read_mcp_servers_from_path(path: Path) -> dict:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("servers", {}) if isinstance(data, dict) else {}
-    except Exception:
-        return {}
-
-
-def check_mcp_server(package: str, repo_tokens: list[str] | None = None) -> tuple[bool, str]:
+def check_mcp_server(package: str, repo_tokens: list[str] | None = None, *, timeout: float = 10, probe_npx: bool = False) -> tuple[bool, str]:
     """Check if an MCP server is configured.
 
     Strategy:
-    1. Look for matching repo token(s) in project `.vscode/mcp.json` servers args.
+    1. Look up repo token(s) in the project `.vscode/mcp.json` server args index.
     2. Look in user-level mcp.json (`%APPDATA%/Code/User/mcp.json` or ~/.config/Code/User/mcp.json).
-    3. Fall back to an npx probe (best-effort but not relied on).
+    3. Resolve the npm package from local state only (global node_modules, npx and npm caches).
+    4. Only with probe_npx: fall back to an npx probe, bounded by timeout seconds. This may
+       download and run the package.
     """
+    from .mcp import find_configured_server
+
     repo_tokens = repo_tokens or [package]
 
-    # 1) Project-level .vscode/mcp.json
-    project_mcp = Path.cwd() / ".vscode" / "mcp.json"
-    servers = _read_mcp_servers_from_path(project_mcp) if project_mcp.exists() else {}
-    for sname, svalue in servers.items():
-        args = svalue.get("args", []) if isinstance(svalue, dict) else []
-        for a in args:
-            for token in repo_tokens:
-                if token and token in str(a):
-                    return True, "project"
-
-    # 2) User-level mcp.json
-    appdata = os.getenv("APPDATA")
-    if appdata:
-        user_mcp = Path(appdata) / "Code" / "User" / "mcp.json"
-    else:
-        user_mcp = Path.home() / ".config" / "Code" / "User" / "mcp.json"
+    # 1) + 2) Project-level, then user-level mcp.json (parsed once, cached by mtime/size)
+    location = find_configured_server(repo_tokens)
+    if location:
+        return True, location
 
-    servers = _read_mcp_servers_from_path(user_mcp) if user_mcp.exists() else {}
-    for sname, svalue in servers.items():
-        args = svalue.get("args", []) if isinstance(svalue, dict) else []
-        for a in args:
-            for token in repo_tokens:
-                if token and token in str(a):
-                    return True, "user"
+    # 3) Offline npm resolution (no subprocess, no network)
+    from .npm import resolve_package_offline
 
-    # 3) Fallback to npx probe (best-effort)
+    location = resolve_package_offline(package)
+    if location:
+        return True, location
+
+    if not probe_npx:
+        return (False, "")
+
+    # 4) Opt-in npx probe (best-effort)
     try:
         result = subprocess.run(
             ["npx", "-y", "--quiet", package, "--help"],
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=timeout,
         )
         return (result.returncode == 0, "npx")
     except Exception:
         return (False, "")
 
-def install_mcp_server(package: str, server_key: str, description: str) -> bool:
-    """Add or update an MCP server entry in the user's VS Code mcp.json.
+def plan_mcp_server(package: str, server_key: str, description: str):
+    """Prompt for one MCP server and return the entry to write (None if declined).
 
     Instead of installing an npm package globally, MCP servers for VS Code are
     configured in the `mcp.json` file under the user's VS Code settings folder
-    (Windows: %APPDATA%/Code/User/mcp.json). This function will prompt the
-    user for permission and required parameters (for Azure DevOps) and then
-    create/update the mcp.json servers and inputs accordingly.
+    (Windows: %APPDATA%/Code/User/mcp.json), or the project's `.vscode/mcp.json`
+    for Azure DevOps. This asks the user for permission and required
+    parameters but does not write anything.
     """
+    from .mcp import McpServerPlan, get_project_mcp_path, get_user_mcp_path
+
     console.print(f"\n[yellow]Configuring MCP Server:[/yellow] {description}")
     console.print(f"[dim]Package:[/dim] {package}")
 
@@ -492,44 +292,17 @@ def install_mcp_server(package: str, server_key: str, description: str) -> bool:
     is_azure = ("azure-devops" in package or server_key.lower().startswith("ado") or "azure" in server_key.lower())
 
     if is_azure:
-        mcp_path = Path.cwd() / ".vscode" / "mcp.json"
+        mcp_path = get_project_mcp_path()
         console.print(f"[dim]Configuring project-level MCP (will write to: {mcp_path})[/dim]")
     else:
-        # Determine user-level mcp.json path (cross-platform fallback)
-        appdata = os.getenv("APPDATA")
-        if appdata:
-            mcp_path = Path(appdata) / "Code" / "User" / "mcp.json"
-        else:
-            # Fallback for non-Windows: use standard VS Code user settings location
-            mcp_path = Path.home() / ".config" / "Code" / "User" / "mcp.json"
-
+        mcp_path = get_user_mcp_path()
         console.print(f"[dim]mcp.json path: {mcp_path}[/dim]")
 
     if not typer.confirm(f"Would you like to add {description} to {mcp_path}?", default=True):
         console.print(f"[yellow]Skipping MCP server configuration for {description}[/yellow]")
-        return False
-
-    # Load existing mcp.json if present
-    data = {"inputs": [], "servers": {}}
-    if mcp_path.exists():
-        try:
-            with open(mcp_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            console.print(f"[red]Failed to read existing mcp.json:[/red] {e}")
-            return False
-
-    # Ensure top-level keys
-    data.setdefault("inputs", [])
-    data.setdefault("servers", {})
+        return None
 
-    # Helper to add input metadata only if missing
-    def ensure_input(input_id: str, description_text: str):
-        inputs = data["inputs"]
-        for inp in inputs:
-            if inp.get("id") == input_id:
-                return
-        inputs.append({"id": input_id, "type": "promptString", "description": description_text})
+    inputs = []
 
     # Build server entry depending on package
     args = ["-y", package]
@@ -546,7 +319,7 @@ def install_mcp_server(package: str, server_key: str, description: str) -> bool:
         else:
             # Use an input placeholder so VS Code will prompt when starting the server
             args.append("${input:ado_org}")
-            ensure_input("ado_org", "Azure DevOps organization name (e.g. 'contoso')")
+            inputs.append({"id": "ado_org", "type": "promptString", "description": "Azure DevOps organization name (e.g. 'contoso')"})
 
         # Add authentication mode used in examples; default to azcli in examples
         args.extend(["--authentication", "azcli"])
@@ -559,23 +332,46 @@ def install_mcp_server(package: str, server_key: str, description: str) -> bool:
 
     # Final server entry
     server_entry = {"type": "stdio", "command": "npx", "args": args}
+    return McpServerPlan(key=server_key, entry=server_entry, path=mcp_path, inputs=inputs)
 
-    # Use the provided server_key as the key in the JSON (keep existing casing)
-    data["servers"][server_key] = server_entry
+def install_mcp_servers(servers: list[tuple[str, str, str]]) -> dict[str, bool]:
+    """Configure several MCP servers, writing each mcp.json once.
 
-    # Backup existing file then write
-    try:
-        if mcp_path.exists():
-            backup = mcp_path.with_suffix(".bak")
-            shutil.copy2(mcp_path, backup)
-        mcp_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(mcp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        console.print(f"[green]Wrote MCP configuration to {mcp_path}[/green]")
-        return True
-    except Exception as e:
-        console.print(f"[red]Failed to write mcp.json:[/red] {e}")
-        return False
+    All prompts happen first; the collected entries are then written with a
+    single read-modify-write, backup and atomic replace per file.
+
+    Args:
+        servers: (npm_package, server_key, description) for each server
+
+    Returns:
+        Mapping of server_key to whether it was configured
+    """
+    from .mcp import McpConfigError, write_mcp_servers
+
+    results = {key: False for _, key, _ in servers}
+    plans_by_path = {}
+    for package, key, description in servers:
+        plan = plan_mcp_server(package, key, description)
+        if plan:
+            plans_by_path.setdefault(plan.path, []).append(plan)
+
+    for mcp_path, plans in plans_by_path.items():
+        try:
+            write_mcp_servers(mcp_path, plans)
+        except McpConfigError as e:
+            console.print(f"[red]Failed to update {mcp_path}:[/red] {e}")
+            continue
+        except Exception as e:
+            console.print(f"[red]Failed to write mcp.json:[/red] {e}")
+            continue
+        console.print(f"[green]Wrote MCP configuration to {mcp_path}[/green] ({', '.join(p.key for p in plans)})")
+        for plan in plans:
+            results[plan.key] = True
+    return results
+
+def install_mcp_server(package: str, server_key: str, description: str) -> bool:
+    """Add or update a single MCP server entry in mcp.json (see install_mcp_servers)."""
+    return install_mcp_servers([(package, server_key, description)])[server_key]
 
 def is_git_repo(path: Path = None) -> bool:
     """Check if the specified path is inside a git repository."""
@@ -620,320 +416,6 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
     finally:
         os.chdir(original_cwd)
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
-    repo_owner = "NexusInnovation"
-    repo_name = "nexkit"
-    if client is None:
-        client = httpx.Client(verify=ssl_context)
-
-    if verbose:
-        console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
-    console.print(f"[cyan]Fetching from: {api_url}[/cyan]")
-    
-    try:
-        response = client.get(
-            api_url,
-            timeout=30,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        )
-        status = response.status_code
-        if status != 200:
-            msg = f"GitHub API returned {status} for {api_url}"
-            if debug:
-                msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
-            raise RuntimeError(msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
-    except Exception as e:
-        console.print(f"[red]Error fetching release information[/red]")
-        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
-        raise typer.Exit(1)
-
-    # Find the template asset for the specified AI assistant
-    assets = release_data.get("assets", [])
-    pattern = f"nexkit-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
-
-    asset = matching_assets[0] if matching_assets else None
-
-    if asset is None:
-        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
-        asset_names = [a.get('name', '?') for a in assets]
-        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
-        raise typer.Exit(1)
-
-    download_url = asset["browser_download_url"]
-    filename = asset["name"]
-    file_size = asset["size"]
-
-    if verbose:
-        console.print(f"[cyan]Found template:[/cyan] {filename}")
-        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
-
-    zip_path = download_dir / filename
-    if verbose:
-        console.print(f"[cyan]Downloading template...[/cyan]")
-
-    try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
-    except Exception as e:
-        console.print(f"[red]Error downloading template[/red]")
-        detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
-        console.print(Panel(detail, title="Download Error", border_style="red"))
-        raise typer.Exit(1)
-    if verbose:
-        console.print(f"Downloaded: {filename}")
-    metadata = {
-        "filename": filename,
-        "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
-    }
-    return zip_path, metadata
-
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
-    """Download the latest release and extract it to create a new project.
-    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
-    """
-    current_dir = Path.cwd()
-
-    # Step: fetch + download combined
-    if tracker:
-        tracker.start("fetch", "contacting GitHub API")
-    try:
-        zip_path, meta = download_template_from_github(
-            ai_assistant,
-            current_dir,
-            script_type=script_type,
-            verbose=verbose and tracker is None,
-            show_progress=(tracker is None),
-            client=client,
-            debug=debug,
-            github_token=github_token
-        )
-        if tracker:
-            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
-            tracker.add("download", "Download template")
-            tracker.complete("download", meta['filename'])
-    except Exception as e:
-        if tracker:
-            tracker.error("fetch", str(e))
-        else:
-            if verbose:
-                console.print(f"[red]Error downloading template:[/red] {e}")
-        raise
-
-    if tracker:
-        tracker.add("extract", "Extract template")
-        tracker.start("extract")
-    elif verbose:
-        console.print("Extracting template...")
-
-    try:
-        # Create project directory only if not using current directory
-        if not is_current_dir:
-            project_path.mkdir(parents=True)
-
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # List all files in the ZIP for debugging
-            zip_contents = zip_ref.namelist()
-            if tracker:
-                tracker.start("zip-list")
-                tracker.complete("zip-list", f"{len(zip_contents)} entries")
-            elif verbose:
-                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
-
-            # For current directory, extract to a temp location first
-            if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-
-                    # Check what was extracted
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"temp {len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-
-                    # Handle GitHub-style ZIP with a single root directory
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-                        if tracker:
-                            tracker.add("flatten", "Flatten nested directory")
-                            tracker.complete("flatten")
-                        elif verbose:
-                            console.print(f"[cyan]Found nested directory structure[/cyan]")
-
-                    # Copy contents to current directory
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            if dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                # Recursively copy directory contents
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print(f"[cyan]Template files merged into current directory[/cyan]")
-            else:
-                # Extract directly to project directory (original behavior)
-                zip_ref.extractall(project_path)
-
-                # Check what was extracted
-                extracted_items = list(project_path.iterdir())
-                if tracker:
-                    tracker.start("extracted-summary")
-                    tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
-                elif verbose:
-                    console.print(f"[cyan]Extracted {len(extracted_items)} items to {project_path}:[/cyan]")
-                    for item in extracted_items:
-                        console.print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
-
-                # Handle GitHub-style ZIP with a single root directory
-                if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                    # Move contents up one level
-                    nested_dir = extracted_items[0]
-                    temp_move_dir = project_path.parent / f"{project_path.name}_temp"
-                    # Move the nested directory contents to temp location
-                    shutil.move(str(nested_dir), str(temp_move_dir))
-                    # Remove the now-empty project directory
-                    project_path.rmdir()
-                    # Rename temp directory to project directory
-                    shutil.move(str(temp_move_dir), str(project_path))
-                    if tracker:
-                        tracker.add("flatten", "Flatten nested directory")
-                        tracker.complete("flatten")
-                    elif verbose:
-                        console.print(f"[cyan]Flattened nested directory structure[/cyan]")
-
-    except Exception as e:
-        if tracker:
-            tracker.error("extract", str(e))
-        else:
-            if verbose:
-                console.print(f"[red]Error extracting template:[/red] {e}")
-                if debug:
-                    console.print(Panel(str(e), title="Extraction Error", border_style="red"))
-        # Clean up project directory if created and not current directory
-        if not is_current_dir and project_path.exists():
-            shutil.rmtree(project_path)
-        raise typer.Exit(1)
-    else:
-        if tracker:
-            tracker.complete("extract")
-    finally:
-        if tracker:
-            tracker.add("cleanup", "Remove temporary archive")
-        # Clean up downloaded ZIP file
-        if zip_path.exists():
-            zip_path.unlink()
-            if tracker:
-                tracker.complete("cleanup")
-            elif verbose:
-                console.print(f"Cleaned up: {zip_path.name}")
-
-    return project_path
-
-
-def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
-    """Ensure POSIX .sh scripts under .nexkit/scripts (recursively) have execute bits (no-op on Windows)."""
-    if os.name == "nt":
-        return  # Windows: skip silently
-    scripts_root = project_path / ".nexkit" / "scripts"
-    if not scripts_root.is_dir():
-        return
-    failures: list[str] = []
-    updated = 0
-    for script in scripts_root.rglob("*.sh"):
-        try:
-            if script.is_symlink() or not script.is_file():
-                continue
-            try:
-                with script.open("rb") as f:
-                    if f.read(2) != b"#!":
-                        continue
-            except Exception:
-                continue
-            st = script.stat(); mode = st.st_mode
-            if mode & 0o111:
-                continue
-            new_mode = mode
-            if mode & 0o400: new_mode |= 0o100
-            if mode & 0o040: new_mode |= 0o010
-            if mode & 0o004: new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
-            updated += 1
-        except Exception as e:
-            failures.append(f"{script.relative_to(scripts_root)}: {e}")
-    if tracker:
-        detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
-        tracker.add("chmod", "Set script permissions recursively")
-        (tracker.error if failures else tracker.complete)("chmod", detail)
-    else:
-        if updated:
-            console.print(f"[cyan]Updated execute permissions on {updated} script(s) recursively[/cyan]")
-        if failures:
-            console.print("[yellow]Some scripts could not be updated:[/yellow]")
-            for f in failures:
-                console.print(f"  - {f}")
-
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
@@ -947,6 +429,7 @@ def init(
     skip_check: bool = typer.Option(False, "--skip-check", help="Skip running the environment check before initialization"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always download the template instead of using the local template cache"),
 ):
     """
     Initialize a new Nexkit project from the latest template.
@@ -970,6 +453,7 @@ def init(
         nexkit init --here --ai codex
         nexkit init --here
         nexkit init --here --force  # Skip confirmation when current directory not empty
+        nexkit init my-project --no-cache # Bypass the local template cache
     """
 
     show_banner()
@@ -1121,7 +605,7 @@ def init(
     # Run environment checks (MCP, tools) as part of init unless explicitly skipped
     if not skip_check:
         try:
-            check()
+            check(timeout=20.0, probe_npx=False, output="text")
         except typer.Exit:
             console.print("[red]Environment check failed — aborting initialization.[/red]")
             raise
@@ -1138,48 +622,50 @@ def init(
     tracker.complete("ai-select", f"{selected_ai}")
     tracker.add("script-select", "Select script type")
     tracker.complete("script-select", selected_script)
-    for key, label in [
-        ("fetch", "Fetch latest release"),
-        ("download", "Download template"),
-        ("extract", "Extract template"),
-        ("zip-list", "Archive contents"),
-        ("extracted-summary", "Extraction summary"),
-        ("chmod", "Ensure scripts executable"),
-        ("cleanup", "Cleanup"),
-        ("git", "Initialize git repository"),
-        ("final", "Finalize")
+    for key, label, parent in [
+        ("fetch", "Fetch latest release", None),
+        ("download", "Download template", None),
+        ("extract", "Extract template", None),
+        ("zip-list", "Archive contents", "extract"),
+        ("extracted-summary", "Extraction summary", "extract"),
+        ("chmod", "Ensure scripts executable", "extract"),
+        ("cleanup", "Cleanup", None),
+        ("git", "Initialize git repository", None),
+        ("final", "Finalize", None)
     ]:
-        tracker.add(key, label)
+        tracker.add(key, label, parent)
+
+    # Network, TLS and Live rendering are only needed from here on
+    from rich.live import Live
+    from .network import create_client
+    from .template import download_and_extract_template
 
     # Use transient so live tree is replaced by the final static render (avoids duplicate output)
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    # The tracker is rendered lazily by Live's refresh thread, so bursts of
+    # updates during download/extraction cost one render per frame
+    with Live(tracker, console=get_console(), refresh_per_second=8, transient=True):
         try:
             # Create a httpx client with verify based on skip_tls
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
-
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
+            local_client = create_client(verify=not skip_tls)
 
-            # Ensure scripts are executable (POSIX)
-            ensure_executable_scripts(project_path, tracker=tracker)
+            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, use_cache=not no_cache)
 
             # Git step
             git_initialized = False
             if not no_git:
-                tracker.start("git")
-                if is_git_repo(project_path):
-                    tracker.complete("git", "existing repo detected")
-                    git_initialized = True
-                elif should_init_git:
-                    if init_git_repo(project_path, quiet=True):
-                        tracker.complete("git", "initialized")
+                # Timed as a step; an unexpected exception is recorded on it
+                with tracker.step("git"):
+                    if is_git_repo(project_path):
+                        tracker.complete("git", "existing repo detected")
                         git_initialized = True
+                    elif should_init_git:
+                        if init_git_repo(project_path, quiet=True):
+                            tracker.complete("git", "initialized")
+                            git_initialized = True
+                        else:
+                            tracker.error("git", "init failed")
                     else:
-                        tracker.error("git", "init failed")
-                else:
-                    tracker.skip("git", "git not available")
+                        tracker.skip("git", "git not available")
             else:
                 tracker.skip("git", "--no-git flag")
 
@@ -1296,72 +782,159 @@ def init(
     console.print()
     console.print(enhancements_panel)
 
+# Tools probed by `nexkit check`: (command, tracker label)
+CHECK_TOOLS = [
+    ("git", "Git version control"),
+    ("claude", "Claude Code CLI"),
+    ("gemini", "Gemini CLI"),
+    ("qwen", "Qwen Code CLI"),
+    ("code", "Visual Studio Code"),
+    ("code-insiders", "Visual Studio Code Insiders"),
+    ("cursor-agent", "Cursor IDE agent"),
+    ("windsurf", "Windsurf IDE"),
+    ("kilocode", "Kilo Code IDE"),
+    ("opencode", "opencode"),
+    ("codex", "Codex CLI"),
+    ("auggie", "Auggie CLI"),
+    ("q", "Amazon Q Developer CLI"),
+]
+
+# Required MCP servers: (npm_package, server_key, description, repo_tokens)
+MCP_SERVERS = [
+    ("@azure-devops/mcp", "AzureDevOps", "Azure DevOps MCP Server", ["@azure-devops/mcp", "azure-devops-mcp", "azure-devops"]),
+    ("@upstash/context7-mcp", "context7", "Context7 MCP Server", ["context7-mcp", "context7"]),
+    ("@modelcontextprotocol/server-sequential-thinking", "sequentialthinking", "Sequential Thinking MCP Server", ["server-sequential-thinking", "sequential-thinking", "sequentialthinking"])
+]
+
+# Tracker detail for each check_mcp_server location
+MCP_LOCATION_DETAILS = {
+    "project": "available (project)",
+    "user": "available (user)",
+    "global": "installed (global npm)",
+    "npx-cache": "installed (npx cache)",
+    "npm-cache": "installed (npm cache)",
+    "npx": "available (npx)",
+}
+
+def _mcp_probe(package: str, tokens: list[str], probe_npx: bool = False):
+    """Build a check probe for an MCP server, bounded by the probe deadline."""
+    from .probes import remaining_time
+
+    def probe(deadline: float) -> tuple[bool, str]:
+        found, location = check_mcp_server(package, repo_tokens=tokens, timeout=remaining_time(deadline), probe_npx=probe_npx)
+        if not found:
+            return False, "not found"
+        return True, MCP_LOCATION_DETAILS.get(location, "available")
+    return probe
+
+def _counted_probe(probe, tracker: StepTracker, group: str):
+    """Wrap a probe so its worker thread advances the group's "checked" counter."""
+    def counted(deadline: float) -> tuple[bool, str]:
+        try:
+            return probe(deadline)
+        finally:
+            tracker.advance(group, "checked")
+    return counted
+
+def _check_output_format(output: str, formats: tuple = OUTPUT_FORMATS) -> None:
+    """Exit with a usage error (status 2) for an unknown --output value."""
+    if output not in formats:
+        console.print(f"[red]Error:[/red] Invalid output format '{output}'. Choose from: {', '.join(formats)}")
+        raise typer.Exit(2)
+
+def _json_failure(output: str, error) -> None:
+    """In json/jsonl mode, print error as the command's result and exit with status 1."""
+    if output != "text":
+        from .output import emit, error_record
+        emit(error_record(error))
+        raise typer.Exit(1)
+
 @app.command()
-def check():
-    """Check that all required tools are installed."""
-    show_banner()
-    console.print("[bold]Checking for installed tools...[/bold]\n")
+def check(
+    timeout: float = typer.Option(20.0, "--timeout", help="Seconds to wait for all environment probes; probes still running are reported as timed out (not cancelled)"),
+    probe_npx: bool = typer.Option(False, "--probe-npx", help="Fall back to running 'npx <package> --help' for MCP servers not found locally (may download packages)"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """Check that all required tools are installed.
+
+    Probes run concurrently. After --timeout seconds, probes that have not
+    answered are reported as timed out; they are not cancelled, but their
+    subprocesses (e.g. --probe-npx) are bounded by the time that was left.
+
+    With --output json the probe results and step durations are printed as
+    one JSON document; missing MCP servers are reported, not configured, and
+    the exit status is 1 unless every required MCP server was found.
+    """
+    from .probes import run_probes
+
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+        console.print("[bold]Checking for installed tools...[/bold]\n")
 
     tracker = StepTracker("Check Available Tools")
+    tool_keys = [tool for tool, _ in CHECK_TOOLS]
+    mcp_keys = [key for _, key, _, _ in MCP_SERVERS]
 
     # Traditional CLI tools
-    tracker.add("git", "Git version control")
-    tracker.add("claude", "Claude Code CLI")
-    tracker.add("gemini", "Gemini CLI")
-    tracker.add("qwen", "Qwen Code CLI")
-    tracker.add("code", "Visual Studio Code")
-    tracker.add("code-insiders", "Visual Studio Code Insiders")
-    tracker.add("cursor-agent", "Cursor IDE agent")
-    tracker.add("windsurf", "Windsurf IDE")
-    tracker.add("kilocode", "Kilo Code IDE")
-    tracker.add("opencode", "opencode")
-    tracker.add("codex", "Codex CLI")
-    tracker.add("auggie", "Auggie CLI")
-    tracker.add("q", "Amazon Q Developer CLI")
-    
+    tracker.add("tools", "CLI tools")
+    for tool, label in CHECK_TOOLS:
+        tracker.add(tool, label, parent="tools")
+
     # Required MCP servers (use the canonical server keys so they appear once)
-    tracker.add("AzureDevOps", "Azure DevOps MCP Server")
-    tracker.add("context7", "Context7 MCP Server")
-    tracker.add("sequentialthinking", "Sequential Thinking MCP Server")
-
-    git_ok = check_tool_for_tracker("git", tracker)
-    claude_ok = check_tool_for_tracker("claude", tracker)  
-    gemini_ok = check_tool_for_tracker("gemini", tracker)
-    qwen_ok = check_tool_for_tracker("qwen", tracker)
-    code_ok = check_tool_for_tracker("code", tracker)
-    code_insiders_ok = check_tool_for_tracker("code-insiders", tracker)
-    cursor_ok = check_tool_for_tracker("cursor-agent", tracker)
-    windsurf_ok = check_tool_for_tracker("windsurf", tracker)
-    kilocode_ok = check_tool_for_tracker("kilocode", tracker)
-    opencode_ok = check_tool_for_tracker("opencode", tracker)
-    codex_ok = check_tool_for_tracker("codex", tracker)
-    auggie_ok = check_tool_for_tracker("auggie", tracker)
-    q_ok = check_tool_for_tracker("q", tracker)
-
-    # Check MCP servers
-    # Each entry: (npm_package, server_key, description, repo_tokens)
-    mcp_servers = [
-        ("@azure-devops/mcp", "AzureDevOps", "Azure DevOps MCP Server", ["@azure-devops/mcp", "azure-devops-mcp", "azure-devops"]),
-        ("@upstash/context7-mcp", "context7", "Context7 MCP Server", ["context7-mcp", "context7"]),
-        ("@modelcontextprotocol/server-sequential-thinking", "sequentialthinking", "Sequential Thinking MCP Server", ["server-sequential-thinking", "sequential-thinking", "sequentialthinking"])
-    ]
-    
-    mcp_results = {}
-    for package, key, description, tokens in mcp_servers:
-        found, location = check_mcp_server(package, repo_tokens=tokens)
-        if found:
-            detail = "available (project)" if location == "project" else ("available (user)" if location == "user" else "available (npx)")
-            tracker.complete(key, detail)
-            mcp_results[key] = True
+    tracker.add("mcp", "MCP servers")
+    for _, key, description, _ in MCP_SERVERS:
+        tracker.add(key, description, parent="mcp")
+
+    # PATH lookups do not block, so tool probes ignore the deadline
+    probes = {tool: _counted_probe(lambda deadline, tool=tool: probe_tool(tool), tracker, "tools") for tool in tool_keys}
+    for package, key, _, tokens in MCP_SERVERS:
+        probes[key] = _counted_probe(_mcp_probe(package, tokens, probe_npx), tracker, "mcp")
+    tracker.set_progress("tools", "checked", 0, len(tool_keys))
+    tracker.set_progress("mcp", "checked", 0, len(mcp_keys))
+
+    def run_check_probes():
+        results = run_probes(probes, tracker, deadline_seconds=timeout)
+        found = sum(results[tool].ok for tool in tool_keys)
+        tracker.complete("tools", f"{found} of {len(tool_keys)} available")
+        missing = sum(not results[key].ok for key in mcp_keys)
+        if missing:
+            tracker.error("mcp", f"{missing} missing")
         else:
-            tracker.error(key, "not found")
-            mcp_results[key] = False
+            tracker.complete("mcp", "all configured")
+        return results
+
+    if output != "text":
+        from .output import emit
+
+        results = run_check_probes()
+        mcp_results = {key: results[key] for _, key, _, _ in MCP_SERVERS}
+        ok = all(result.ok for result in mcp_results.values())
+        emit({
+            "ok": ok,
+            "tools": {tool: results[tool] for tool, _ in CHECK_TOOLS},
+            "mcp_servers": mcp_results,
+            "steps": tracker.snapshot(),
+        })
+        if not ok:
+            raise typer.Exit(1)
+        return
+
+    from rich.live import Live
+
+    # Probes run concurrently; the tree updates as each one finishes
+    with Live(tracker, console=get_console(), refresh_per_second=8, transient=True):
+        results = run_check_probes()
+
+    tool_ok = {tool: results[tool].ok for tool, _ in CHECK_TOOLS}
+    git_ok = tool_ok["git"]
+    mcp_results = {key: results[key].ok for _, key, _, _ in MCP_SERVERS}
 
     console.print(tracker.render())
 
     # Check if any required MCP servers are missing
     missing_mcp = [
-        (package, key, description, tokens) for (package, key, description, tokens) in mcp_servers 
+        (package, key, description, tokens) for (package, key, description, tokens) in MCP_SERVERS
         if not mcp_results[key]
     ]
     
@@ -1374,14 +947,10 @@ def check():
             console.print("[dim]Install Node.js from: https://nodejs.org/[/dim]")
             raise typer.Exit(1)
         
-        # Attempt to configure missing MCP servers in user's mcp.json
-        installation_success = True
-        for package, key, description, tokens in missing_mcp:
-            # Use the canonical server key provided in mcp_servers (e.g. 'AzureDevOps', 'context7')
-            server_key = key
-            success = install_mcp_server(package, server_key, description)
-            if not success:
-                installation_success = False
+        # Configure all missing MCP servers with one write per mcp.json,
+        # using the canonical server keys from MCP_SERVERS (e.g. 'AzureDevOps', 'context7')
+        installed = install_mcp_servers([(package, key, description) for package, key, description, _ in missing_mcp])
+        installation_success = all(installed.values())
         
         if not installation_success:
             console.print(f"\n[yellow]Some MCP servers could not be installed automatically.[/yellow]")
@@ -1393,15 +962,149 @@ def check():
 
     if not git_ok:
         console.print("[dim]Tip: Install git for repository management[/dim]")
-    if not (claude_ok or gemini_ok or cursor_ok or qwen_ok or windsurf_ok or kilocode_ok or opencode_ok or codex_ok or auggie_ok or q_ok):
+    if not any(tool_ok[t] for t in ("claude", "gemini", "cursor-agent", "qwen", "windsurf", "kilocode", "opencode", "codex", "auggie", "q")):
         console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
     if missing_mcp and not all(mcp_results.values()):
         console.print("[dim]Tip: MCP servers provide enhanced AI capabilities[/dim]")
 
+def _untrack_with_progress(path: Path, tracked_files: list[Path]) -> None:
+    """Remove tracked nexkit files from the index, rendering a progress bar."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=get_console(),
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Untracking nexkit files...", total=len(tracked_files))
+        removed = gitignore.untrack_files(
+            path, tracked_files,
+            on_progress=lambda done, total: progress.update(task, completed=done),
+        )
+    console.print(f"\n[green]✓[/green] Untracked {removed} nexkit file(s); local copies are kept")
+    console.print("[dim]Commit the change with:[/dim] git commit -m \"Stop tracking nexkit files\"")
+
+
+def _describe_outcome(outcome) -> tuple[str, str]:
+    """Return (result, tracked) table cells for one repository of a recursive run."""
+    from rich.markup import escape
+    
+    result = outcome.result
+    if not outcome.ok:
+        return f"[red]✗ {escape(outcome.error)}[/red]", ""
+    if outcome.operation == "status":
+        if not result.is_excluded:
+            text = "[yellow]not excluded[/yellow]"
+        elif result.missing_patterns:
+            text = f"[yellow]incomplete ({len(result.missing_patterns)} missing)[/yellow]"
+        else:
+            text = "[green]excluded[/green]"
+    elif outcome.operation == "remove":
+        text = "[green]removed[/green]" if result.patterns_affected else "[dim]not present[/dim]"
+    elif result.updated:
+        text = "[green]updated[/green]"
+    elif result.already_configured:
+        text = "[dim]up to date[/dim]"
+    else:
+        text = "[green]added[/green]"
+    tracked = str(len(result.tracked_files)) if outcome.operation != "remove" else ""
+    if outcome.untracked:
+        tracked += f" ({outcome.untracked} untracked)"
+    return text, tracked
+
+
+def _recursive_ok(operation: str, outcomes: list) -> bool:
+    """A recursive run fails if any repository failed or, for status, is not fully excluded."""
+    if any(not outcome.ok for outcome in outcomes):
+        return False
+    if operation == "status":
+        return all(o.result.is_excluded and not o.result.requires_cleanup for o in outcomes)
+    return True
+
+
+def _run_recursive(
+    root: Path,
+    operation: str,
+    agent: Optional[list[str]] = None,
+    *,
+    untrack: bool = False,
+    jobs: Optional[int] = None,
+    git_jobs: int = 8,
+    output: str = "text",
+) -> None:
+    """Run an exclusion operation on every repository under root and report each one."""
+    import time
+    from . import bulk
+    from .output import emit
+    
+    if not root.is_dir():
+        _json_failure(output, NotADirectoryError(f"Not a directory: {root}"))
+        console.print(f"[red]Error:[/red] Not a directory: {root}")
+        raise typer.Exit(1)
+    
+    repos = bulk.find_repositories(root)
+    outcomes = []
+    if output == "jsonl":
+        # One object per repository as soon as it finishes
+        for outcome in bulk.run_bulk(repos, operation, agent or None, untrack=untrack, jobs=jobs, git_jobs=git_jobs):
+            outcomes.append(outcome)
+            emit(bulk.outcome_to_dict(outcome))
+    elif output == "json":
+        outcomes = sorted(
+            bulk.run_bulk(repos, operation, agent or None, untrack=untrack, jobs=jobs, git_jobs=git_jobs),
+            key=lambda outcome: outcome.repo,
+        )
+        emit({
+            "ok": _recursive_ok(operation, outcomes),
+            "root": root,
+            "repositories": [bulk.outcome_to_dict(outcome) for outcome in outcomes],
+        })
+    else:
+        from rich.table import Table
+        
+        if not repos:
+            console.print(f"[yellow]ℹ[/yellow] No git repositories found under {root}")
+            return
+        # No spinner: its refresh thread must not be running when the pool forks
+        console.print(f"[cyan]Processing {len(repos)} repositories...[/cyan]\n")
+        start = time.perf_counter()
+        outcomes = sorted(
+            bulk.run_bulk(repos, operation, agent or None, untrack=untrack, jobs=jobs, git_jobs=git_jobs),
+            key=lambda outcome: outcome.repo,
+        )
+        elapsed = time.perf_counter() - start
+        
+        table = Table(show_edge=False, header_style="bold")
+        table.add_column("Repository")
+        table.add_column("Result")
+        if operation != "remove":
+            table.add_column("Tracked", justify="right")
+        table.add_column("Time", justify="right")
+        for outcome in outcomes:
+            result, tracked = _describe_outcome(outcome)
+            name = outcome.repo.relative_to(root).as_posix() if outcome.repo != root else "."
+            cells = [name, result] + ([tracked] if operation != "remove" else []) + [f"{outcome.seconds * 1000:.0f} ms"]
+            table.add_row(*cells)
+        console.print(table)
+        
+        failed = sum(not outcome.ok for outcome in outcomes)
+        console.print(f"\n[dim]{len(outcomes)} repositories, {failed} failed, {elapsed:.1f} s[/dim]")
+    
+    if not _recursive_ok(operation, outcomes):
+        raise typer.Exit(1)
+
+
 @app.command(name="add-exclusion")
 def add_exclusion(
-    path: Path = typer.Argument(Path.cwd(), help="Path to repository (defaults to current directory)"),
-    agent: str = typer.Option(None, "--agent", help="AI agent type (copilot, claude, gemini, cursor, etc.). Auto-detects if not specified.")
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    agent: Optional[list[str]] = typer.Option(None, "--agent", help="AI agent type (copilot, claude, gemini, cursor, etc.); repeat for several agents. Auto-detects if not specified."),
+    untrack: bool = typer.Option(False, "--untrack", help="Also remove already tracked nexkit files from the git index (local copies are kept)"),
+    recursive: Optional[Path] = typer.Option(None, "--recursive", help="Process every git repository under this workspace root instead of PATH"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Worker processes for --recursive (defaults to the CPU count)"),
+    git_jobs: int = typer.Option(8, "--git-jobs", help="Maximum git processes running at once with --recursive"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP + "; jsonl streams one object per repository with --recursive"),
 ):
     """
     Add nexkit exclusion patterns to .gitignore file.
@@ -1417,27 +1120,60 @@ def add_exclusion(
     - Commands and modes directories for the selected agent
     
     The patterns are added in a clearly marked section that can be managed
-    independently of other .gitignore entries.
+    independently of other .gitignore entries. If the section already
+    exists it is updated in place: --agent sets exactly the agents it
+    covers, auto-detection only adds patterns. Nothing is written when
+    the section is already up to date.
     
     Examples:
         nexkit add-exclusion
         nexkit add-exclusion /path/to/repo
         nexkit add-exclusion --agent copilot
         nexkit add-exclusion --agent claude /path/to/repo
+        nexkit add-exclusion --agent copilot --agent claude
+        nexkit add-exclusion --untrack
+        nexkit add-exclusion --recursive ~/workspace --output jsonl
+        nexkit add-exclusion --output json
     """
-    show_banner()
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
     
-    console.print("[cyan]Adding nexkit exclusions to .gitignore...[/cyan]\n")
+    # Validate agents if specified
+    for name in agent or []:
+        if name not in AI_CHOICES:
+            _json_failure(output, ValueError(f"Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}"))
+            console.print(f"[red]Error:[/red] Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}")
+            raise typer.Exit(1)
     
-    # Validate agent if specified
-    if agent and agent not in AI_CHOICES:
-        console.print(f"[red]Error:[/red] Invalid agent '{agent}'. Choose from: {', '.join(AI_CHOICES.keys())}")
-        raise typer.Exit(1)
+    if recursive is not None:
+        _run_recursive(recursive, "add", agent, untrack=untrack, jobs=jobs, git_jobs=git_jobs, output=output)
+        return
+    
+    if output != "text":
+        from .output import emit
+        
+        try:
+            result = gitignore.add_nexkit_exclusions(path, agent_type=agent or None)
+            untracked = gitignore.untrack_files(path, result.tracked_files) if untrack else 0
+        except Exception as e:
+            _json_failure(output, e)
+        emit({"ok": True, "result": result, "untracked": untracked})
+        return
+    
+    console.print("[cyan]Adding nexkit exclusions to .gitignore...[/cyan]\n")
     
     try:
-        result = gitignore.add_nexkit_exclusions(path, agent_type=agent)
+        result = gitignore.add_nexkit_exclusions(path, agent_type=agent or None)
         
-        if result.already_configured:
+        if result.updated:
+            console.print("[green]✓[/green] Updated nexkit exclusions")
+            console.print(f"[dim]Location:[/dim] {result.gitignore_path}")
+            if result.patterns_affected:
+                console.print(f"[dim]Patterns added:[/dim] {', '.join(result.patterns_affected)}")
+            if result.patterns_removed:
+                console.print(f"[dim]Patterns removed:[/dim] {', '.join(result.patterns_removed)}")
+        elif result.already_configured:
             console.print("[yellow]ℹ[/yellow] Nexkit exclusions are already configured")
             console.print(f"[dim]Location:[/dim] {result.gitignore_path}")
         else:
@@ -1445,9 +1181,10 @@ def add_exclusion(
             console.print(f"[dim]Location:[/dim] {result.gitignore_path}")
             console.print(f"[dim]Patterns:[/dim] {', '.join(result.patterns_affected)}")
         
-        # Show cleanup guidance if there are tracked files
-        if result.tracked_files:
-            from rich.markup import escape
+        # Untrack or show cleanup guidance if there are tracked files
+        if result.tracked_files and untrack:
+            _untrack_with_progress(path, result.tracked_files)
+        elif result.tracked_files:
             console.print(gitignore.format_cleanup_guidance(result.tracked_files, result.git_root))
         else:
             console.print("\n[green]✓[/green] No nexkit files are currently tracked by git")
@@ -1470,7 +1207,11 @@ def add_exclusion(
 
 @app.command(name="remove-exclusion")
 def remove_exclusion(
-    path: Path = typer.Argument(Path.cwd(), help="Path to repository (defaults to current directory)")
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    recursive: Optional[Path] = typer.Option(None, "--recursive", help="Process every git repository under this workspace root instead of PATH"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Worker processes for --recursive (defaults to the CPU count)"),
+    git_jobs: int = typer.Option(8, "--git-jobs", help="Maximum git processes running at once with --recursive"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP + "; jsonl streams one object per repository with --recursive"),
 ):
     """
     Remove nexkit exclusion patterns from .gitignore file.
@@ -1482,8 +1223,26 @@ def remove_exclusion(
     Examples:
         nexkit remove-exclusion
         nexkit remove-exclusion /path/to/repo
+        nexkit remove-exclusion --recursive ~/workspace
+        nexkit remove-exclusion --output json
     """
-    show_banner()
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+    
+    if recursive is not None:
+        _run_recursive(recursive, "remove", jobs=jobs, git_jobs=git_jobs, output=output)
+        return
+    
+    if output != "text":
+        from .output import emit
+        
+        try:
+            result = gitignore.remove_nexkit_exclusions(path)
+        except Exception as e:
+            _json_failure(output, e)
+        emit({"ok": True, "result": result})
+        return
     
     console.print("[cyan]Removing nexkit exclusions from .gitignore...[/cyan]\n")
     
@@ -1514,6 +1273,381 @@ def remove_exclusion(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
+exclusion_app = typer.Typer(
+    name="exclusion",
+    help="Inspect how nexkit files are excluded from git.",
+    add_completion=False,
+)
+app.add_typer(exclusion_app, name="exclusion")
+
+
+@exclusion_app.command(name="status")
+def exclusion_status(
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    agent: Optional[list[str]] = typer.Option(None, "--agent", help="AI agent type (copilot, claude, gemini, cursor, etc.); repeat for several agents. Auto-detects if not specified."),
+    recursive: Optional[Path] = typer.Option(None, "--recursive", help="Check every git repository under this workspace root instead of PATH"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", help="Worker processes for --recursive (defaults to the CPU count)"),
+    git_jobs: int = typer.Option(8, "--git-jobs", help="Maximum git processes running at once with --recursive"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP + "; jsonl streams one object per repository with --recursive"),
+):
+    """
+    Show whether the nexkit exclusions are configured.
+    
+    Reports the .gitignore section, missing patterns for the detected (or
+    given) agents and nexkit files that are still tracked. Exits with
+    status 1 if the section is missing or nexkit files are tracked.
+    
+    Examples:
+        nexkit exclusion status
+        nexkit exclusion status --recursive ~/workspace --jobs 16
+        nexkit exclusion status --output json
+    """
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+    
+    for name in agent or []:
+        if name not in AI_CHOICES:
+            _json_failure(output, ValueError(f"Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}"))
+            console.print(f"[red]Error:[/red] Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}")
+            raise typer.Exit(1)
+    
+    if recursive is not None:
+        _run_recursive(recursive, "status", agent, jobs=jobs, git_jobs=git_jobs, output=output)
+        return
+    
+    try:
+        status = gitignore.check_exclusion_status(path, agent or None)
+    except gitignore.NotGitRepositoryError as e:
+        _json_failure(output, e)
+        console.print("[red]Error:[/red] Not a git repository")
+        console.print("[dim]Initialize git first with:[/dim] git init")
+        raise typer.Exit(1)
+    except Exception as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    
+    ok = status.is_excluded and not status.requires_cleanup
+    if output != "text":
+        from .output import emit
+        
+        emit({"ok": ok, "status": status})
+        if not ok:
+            raise typer.Exit(1)
+        return
+    
+    if status.agents:
+        console.print(f"[dim]Agents:[/dim] {', '.join(found.agent for found in status.agents)}")
+    if not status.is_excluded:
+        console.print("[yellow]✗[/yellow] Nexkit exclusions are not configured")
+        console.print("[dim]Add them with:[/dim] nexkit add-exclusion")
+    elif status.missing_patterns:
+        console.print(f"[yellow]![/yellow] Nexkit exclusions are missing: {', '.join(status.missing_patterns)}")
+        console.print("[dim]Update them with:[/dim] nexkit add-exclusion")
+    else:
+        console.print("[green]✓[/green] Nexkit exclusions are configured")
+    if status.gitignore_path:
+        console.print(f"[dim]Location:[/dim] {status.gitignore_path}")
+    
+    if status.tracked_files:
+        console.print(gitignore.format_cleanup_guidance(status.tracked_files, status.git_root))
+    
+    if not ok:
+        raise typer.Exit(1)
+
+
+@exclusion_app.command(name="verify")
+def exclusion_verify(
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    agent: Optional[list[str]] = typer.Option(None, "--agent", help="AI agent type (copilot, claude, gemini, cursor, etc.); repeat for several agents. Auto-detects if not specified."),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Verify that git really ignores every nexkit path in the working tree.
+    
+    Evaluates the nexkit paths against all ignore rules git uses - every
+    .gitignore (including negations and nested files), .git/info/exclude
+    and core.excludesFile - and lists any path git would still pick up.
+    Exits with status 1 if a nexkit path is not ignored or is tracked.
+    
+    Examples:
+        nexkit exclusion verify
+        nexkit exclusion verify --agent claude --agent gemini /path/to/repo
+        nexkit exclusion verify --output json
+    """
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+    
+    for name in agent or []:
+        if name not in AI_CHOICES:
+            _json_failure(output, ValueError(f"Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}"))
+            console.print(f"[red]Error:[/red] Invalid agent '{name}'. Choose from: {', '.join(AI_CHOICES.keys())}")
+            raise typer.Exit(1)
+    
+    try:
+        result = gitignore.verify_nexkit_exclusions(path, agent_type=agent or None)
+    except gitignore.NotGitRepositoryError as e:
+        _json_failure(output, e)
+        console.print("[red]Error:[/red] Not a git repository")
+        console.print("[dim]Initialize git first with:[/dim] git init")
+        raise typer.Exit(1)
+    except Exception as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    
+    if output != "text":
+        from .output import emit
+        
+        emit({"ok": result.is_effective, "verification": result})
+        if not result.is_effective:
+            raise typer.Exit(1)
+        return
+    
+    from rich.markup import escape
+    
+    console.print(f"[dim]Patterns:[/dim] {', '.join(result.patterns)}")
+    if not result.ignored and not result.not_ignored:
+        console.print("[yellow]ℹ[/yellow] No nexkit paths found in the working tree")
+    elif not result.not_ignored:
+        console.print(f"[green]✓[/green] All {len(result.ignored)} nexkit path(s) are ignored by git")
+    else:
+        console.print(f"[red]✗[/red] {len(result.not_ignored)} nexkit file(s) are not ignored by git:")
+        for file, rule in result.not_ignored:
+            reason = f" [dim](re-included by {escape(rule)})[/dim]" if rule else " [dim](no matching rule)[/dim]"
+            console.print(f"  • {escape(str(file))}{reason}")
+        if not gitignore.has_nexkit_section(result.git_root / ".gitignore"):
+            console.print("\n[dim]Add the exclusions with:[/dim] nexkit add-exclusion")
+    
+    if result.tracked_files:
+        console.print(gitignore.format_cleanup_guidance(result.tracked_files, result.git_root))
+    
+    if not result.is_effective:
+        raise typer.Exit(1)
+
+
+hook_app = typer.Typer(
+    name="hook",
+    help="Install git hooks that keep nexkit files out of commits.",
+    add_completion=False,
+)
+app.add_typer(hook_app, name="hook")
+
+
+@hook_app.command(name="install")
+def hook_install(
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Install a pre-commit hook that rejects staged nexkit files.
+    
+    The hook blocks commits that add or modify files under .specify/,
+    specs/ or any agent's nexkit paths. It runs a minimal guard script
+    rather than the nexkit CLI, so it adds only a few milliseconds to each
+    commit. An existing pre-commit hook is kept and run first.
+    
+    Examples:
+        nexkit hook install
+        nexkit hook install /path/to/repo
+    """
+    from . import hooks
+    
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+    
+    try:
+        result = hooks.install_precommit_hook(path)
+    except gitignore.NotGitRepositoryError as e:
+        _json_failure(output, e)
+        console.print("[red]Error:[/red] Not a git repository")
+        console.print("[dim]Initialize git first with:[/dim] git init")
+        raise typer.Exit(1)
+    except hooks.HookError as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    
+    if output != "text":
+        from .output import emit
+        
+        emit({"ok": True, "result": result})
+        return
+    
+    if result.changed:
+        console.print("[green]✓[/green] Installed nexkit pre-commit guard")
+    else:
+        console.print("[yellow]ℹ[/yellow] Nexkit pre-commit guard is already installed")
+    console.print(f"[dim]Location:[/dim] {result.hook_path}")
+    if result.chained_hook:
+        console.print(f"[dim]Existing hook kept and run first:[/dim] {result.chained_hook}")
+
+
+@hook_app.command(name="uninstall")
+def hook_uninstall(
+    path: Path = typer.Argument(Path("."), help="Path to repository (defaults to current directory)"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Remove the nexkit pre-commit hook, restoring any hook it replaced.
+    
+    Examples:
+        nexkit hook uninstall
+        nexkit hook uninstall /path/to/repo
+    """
+    from . import hooks
+    
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+    
+    try:
+        result = hooks.uninstall_precommit_hook(path)
+    except gitignore.NotGitRepositoryError as e:
+        _json_failure(output, e)
+        console.print("[red]Error:[/red] Not a git repository")
+        console.print("[dim]Initialize git first with:[/dim] git init")
+        raise typer.Exit(1)
+    except hooks.HookError as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    
+    if output != "text":
+        from .output import emit
+        
+        emit({"ok": True, "result": result})
+        return
+    
+    if not result.changed:
+        console.print("[yellow]ℹ[/yellow] Nexkit pre-commit guard is not installed")
+    elif result.chained_hook:
+        console.print("[green]✓[/green] Removed nexkit pre-commit guard and restored the previous hook")
+    else:
+        console.print("[green]✓[/green] Removed nexkit pre-commit guard")
+
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Inspect and manage the local template cache.",
+    add_completion=False,
+)
+app.add_typer(cache_app, name="cache")
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. '12.3 MB')."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@cache_app.command(name="stats")
+def cache_stats(
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Show the location, size and contents of the template cache.
+
+    Examples:
+        nexkit cache stats
+        nexkit cache stats --output json
+    """
+    from .cache import TemplateCache
+
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+
+    template_cache = TemplateCache()
+    stats = template_cache.stats()
+    if output != "text":
+        from .output import emit
+
+        emit({"ok": True, "stats": stats, "entries": template_cache.entries()})
+        return
+    console.print(f"[dim]Location:[/dim] {stats.cache_dir}")
+    console.print(f"[dim]Templates:[/dim] {stats.entries} ({stats.blobs} unique archive(s))")
+    console.print(f"[dim]Size:[/dim] {_format_bytes(stats.total_bytes)} of {_format_bytes(stats.max_bytes)}")
+    for entry in template_cache.entries():
+        console.print(f"  • {entry.release} {entry.asset} [dim]({_format_bytes(entry.size)}, sha256 {entry.sha256[:12]})[/dim]")
+
+
+@cache_app.command(name="prune")
+def cache_prune(
+    max_size: float = typer.Option(None, "--max-size", help="Size limit in MB (defaults to NEXKIT_CACHE_MAX_MB or 256)"),
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Evict least-recently-used templates until the cache fits its size limit.
+
+    Examples:
+        nexkit cache prune
+        nexkit cache prune --max-size 50
+    """
+    from .cache import TemplateCache, TemplateCacheError
+
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+
+    max_bytes = int(max_size * 1024 * 1024) if max_size is not None else None
+    try:
+        evicted = TemplateCache().prune(max_bytes=max_bytes)
+    except TemplateCacheError as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if output != "text":
+        from .output import emit
+
+        emit({"ok": True, "evicted": evicted})
+        return
+
+    if not evicted:
+        console.print("[yellow]ℹ[/yellow] Template cache is within its size limit")
+        return
+    console.print(f"[green]✓[/green] Evicted {len(evicted)} cached template(s)")
+    for entry in evicted:
+        console.print(f"  • {entry.release} {entry.asset}")
+
+
+@cache_app.command(name="clear")
+def cache_clear(
+    output: str = typer.Option("text", "--output", help=OUTPUT_HELP),
+):
+    """
+    Remove every cached template.
+
+    Examples:
+        nexkit cache clear
+    """
+    from .cache import TemplateCache, TemplateCacheError
+
+    _check_output_format(output)
+    if output == "text":
+        show_banner()
+
+    try:
+        freed = TemplateCache().clear()
+    except TemplateCacheError as e:
+        _json_failure(output, e)
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if output != "text":
+        from .output import emit
+
+        emit({"ok": True, "freed_bytes": freed})
+        return
+    console.print(f"[green]✓[/green] Cleared template cache ({_format_bytes(freed)} freed)")
+
 def main():
     app()
 
@@ -0,0 +1,149 @@
+"""
+Version and build identifier resolution for nexkit.
+
+The build identifier shown by the banner and ``--version`` is resolved in
+order from:
+
+1. ``nexkit._build.BUILD_TAG``, stamped into the wheel at build time by the
+   hatch build hook in ``hatch_build.py``.
+2. A small JSON cache in the user cache directory, keyed by the install
+   location and invalidated when the enclosing git repository changes.
+3. ``git describe`` (the result is written back to the cache).
+
+Installed runs therefore spawn no subprocess to render the banner.
+"""
+
+import json
+import os
+import subprocess
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import List, Optional
+
+PACKAGE_DIR = Path(__file__).parent
+BUILD_CACHE_FILENAME = "build-info.json"
+
+
+def get_version() -> str:
+    """Get the package version from metadata."""
+    try:
+        return metadata.version("nexkit")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_git_tag() -> str:
+    """Get the current git tag or commit hash."""
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--tags", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            cwd=PACKAGE_DIR
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return "unknown"
+    except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return "unknown"
+
+
+def find_git_dir(start: Path) -> Optional[Path]:
+    """
+    Find the ``.git`` entry governing a path without running git.
+
+    Args:
+        start: Directory to search upwards from
+
+    Returns:
+        Path to the ``.git`` directory or gitdir file, or None if not found
+    """
+    for directory in (start, *start.parents):
+        candidate = directory / ".git"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _git_fingerprint(git_dir: Path) -> List[float]:
+    """Return mtimes that change whenever HEAD, refs, tags or the index change."""
+    if git_dir.is_file():
+        # Worktree or submodule: follow the "gitdir: <path>" pointer
+        try:
+            pointer = git_dir.read_text(encoding="utf-8").strip()
+        except OSError:
+            return []
+        if pointer.startswith("gitdir:"):
+            git_dir = (git_dir.parent / pointer[len("gitdir:"):].strip()).resolve()
+
+    fingerprint = []
+    for name in ("HEAD", "index", "packed-refs", "refs/heads", "refs/tags"):
+        try:
+            fingerprint.append((git_dir / name).stat().st_mtime)
+        except OSError:
+            fingerprint.append(0.0)
+    return fingerprint
+
+
+def get_build_cache_path() -> Path:
+    """Return the path of the on-disk build identifier cache."""
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("nexkit")) / BUILD_CACHE_FILENAME
+
+
+def _read_build_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_build_cache(cache_path: Path, data: dict) -> None:
+    # Best effort: a read-only cache directory must never break the CLI
+    temp_file = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        temp_file.replace(cache_path)
+    except OSError:
+        if temp_file.exists():
+            temp_file.unlink()
+
+
+@lru_cache(maxsize=None)
+def get_build_tag() -> str:
+    """
+    Get the build identifier without spawning git on installed runs.
+
+    Returns:
+        Stamped build tag, cached ``git describe`` output, or "unknown"
+    """
+    try:
+        from ._build import BUILD_TAG
+        return BUILD_TAG
+    except ImportError:
+        pass
+
+    git_dir = find_git_dir(PACKAGE_DIR)
+    if git_dir is None:
+        # Not a source checkout and nothing stamped: git would have nothing to describe
+        return "unknown"
+
+    cache_path = get_build_cache_path()
+    cache = _read_build_cache(cache_path)
+    key = str(PACKAGE_DIR.resolve())
+    fingerprint = _git_fingerprint(git_dir)
+
+    entry = cache.get(key)
+    if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint and entry.get("build"):
+        return entry["build"]
+
+    build = get_git_tag()
+    cache[key] = {"fingerprint": fingerprint, "build": build}
+    _write_build_cache(cache_path, cache)
+    return build
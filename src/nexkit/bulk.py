@@ -0,0 +1,180 @@
+"""
+Exclusion management across many repositories at once.
+
+``--recursive ROOT`` on the exclusion commands finds every git repository
+below a workspace root and runs the per-repository operation
+(``add_nexkit_exclusions``, ``remove_nexkit_exclusions`` or
+``check_exclusion_status``) on a process pool. Workers share one semaphore
+that bounds how many git processes run at the same time, independently of
+the worker count; most operations start no git process at all, since the
+index and ``.gitignore`` are read directly.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from . import gitignore
+from .output import to_jsonable
+
+
+# Constants
+# Directories never searched for repositories
+SKIP_DIRS = frozenset({".git", "node_modules"})
+
+# Default number of git processes allowed to run at once across all workers
+DEFAULT_GIT_JOBS = 8
+
+OPERATIONS = ("add", "remove", "status")
+
+
+# Data Classes
+@dataclass
+class RepoOutcome:
+    """Result of one operation on one repository."""
+    repo: Path                 # Repository root as found under the workspace root
+    operation: str             # One of OPERATIONS
+    result: Union[gitignore.ExclusionResult, gitignore.ExclusionStatus, None]
+    untracked: int = 0         # Files removed from the index (add with untrack)
+    error: Optional[str] = None
+    seconds: float = 0.0       # Wall time spent on this repository
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Core Functions
+def outcome_to_dict(outcome: RepoOutcome) -> Dict[str, Any]:
+    """Return a JSON-serialisable record of an outcome (one JSON Lines row)."""
+    record = to_jsonable(outcome)
+    record["seconds"] = round(outcome.seconds, 6)
+    return record
+
+
+def find_repositories(root: Path) -> List[Path]:
+    """
+    Find git repositories at or below root.
+
+    A directory with a ``.git`` entry (directory, or file for worktrees) is
+    a repository. The search does not continue inside a repository - its
+    submodules and nested checkouts belong to it - except for root itself,
+    so a workspace that is a repository still has its checkouts found.
+    ``node_modules`` directories and symlinks are never entered.
+
+    Args:
+        root: Workspace root to search
+
+    Returns:
+        Repository roots, sorted
+    """
+    root = Path(root)
+    repos = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        if any(entry.name == ".git" for entry in entries):
+            repos.append(directory)
+            if directory != root:
+                continue
+        for entry in entries:
+            if entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+    return sorted(repos)
+
+
+def process_repository(
+    repo_path: Path,
+    operation: str,
+    agent_type: Union[str, Sequence[str], None] = None,
+    untrack: bool = False,
+) -> RepoOutcome:
+    """
+    Run one exclusion operation on one repository, capturing errors.
+
+    Args:
+        repo_path: Repository root
+        operation: "add", "remove" or "status"
+        agent_type: Agent type(s) for add/status; auto-detected if None
+        untrack: With "add", also remove tracked nexkit files from the index
+
+    Returns:
+        RepoOutcome; errors are reported in it rather than raised
+    """
+    start = time.perf_counter()
+    outcome = RepoOutcome(repo=repo_path, operation=operation, result=None)
+    try:
+        repo = gitignore.open_repository(repo_path)
+        if operation == "add":
+            outcome.result = gitignore.add_nexkit_exclusions(repo_path, agent_type, repo=repo)
+            if untrack and outcome.result.tracked_files:
+                outcome.untracked = gitignore.untrack_files(repo_path, outcome.result.tracked_files, repo=repo)
+        elif operation == "remove":
+            outcome.result = gitignore.remove_nexkit_exclusions(repo_path, repo=repo)
+        elif operation == "status":
+            outcome.result = gitignore.check_exclusion_status(repo_path, agent_type, repo=repo)
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+    except Exception as e:
+        outcome.error = str(e) or type(e).__name__
+    outcome.seconds = time.perf_counter() - start
+    return outcome
+
+
+def _init_worker(git_slots) -> None:
+    gitignore.set_git_process_limit(git_slots)
+
+
+def run_bulk(
+    repos: Sequence[Path],
+    operation: str,
+    agent_type: Union[str, Sequence[str], None] = None,
+    *,
+    untrack: bool = False,
+    jobs: Optional[int] = None,
+    git_jobs: int = DEFAULT_GIT_JOBS,
+) -> Iterator[RepoOutcome]:
+    """
+    Run an operation on every repository in a process pool.
+
+    Args:
+        repos: Repository roots (see find_repositories)
+        operation: "add", "remove" or "status"
+        agent_type: Agent type(s) for add/status; auto-detected per repository if None
+        untrack: With "add", also remove tracked nexkit files from the index
+        jobs: Worker processes (defaults to the CPU count)
+        git_jobs: Maximum git processes running at once across all workers
+
+    Yields:
+        RepoOutcome for each repository, in completion order
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {operation}")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(repos)))
+
+    # A pool costs more than it saves for a single worker
+    if jobs == 1:
+        for repo in repos:
+            yield process_repository(repo, operation, agent_type, untrack)
+        return
+
+    context = multiprocessing.get_context()
+    git_slots = context.BoundedSemaphore(max(1, git_jobs))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(git_slots,),
+    ) as pool:
+        futures = [pool.submit(process_repository, repo, operation, agent_type, untrack) for repo in repos]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,502 @@
+"""
+Content-addressed local cache for release template archives.
+
+Downloaded template zips are stored once per SHA-256 under the platformdirs
+user cache directory and indexed by release tag + asset name. The cache is
+bounded in size and evicts least-recently-used archives first, so repeated
+``nexkit init`` runs against the same release skip the download entirely and
+keep working offline.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+
+# Constants
+CACHE_INDEX_FILENAME = "index.json"
+CACHE_BLOBS_DIRNAME = "blobs"
+CACHE_DOWNLOADS_DIRNAME = "downloads"
+RELEASES_FILENAME = "releases.json"
+DEFAULT_MAX_CACHE_MB = 256
+DEFAULT_RELEASE_TTL_SECONDS = 600
+HASH_CHUNK_SIZE = 1024 * 1024
+# A lock file older than this is assumed to belong to a crashed process
+STALE_LOCK_SECONDS = 600
+# Index updates take milliseconds: wait this long for another process's lock
+INDEX_LOCK_TIMEOUT_SECONDS = 30
+INDEX_LOCK_STALE_SECONDS = 60
+
+
+# Exceptions
+class TemplateCacheError(Exception):
+    """Raised when the template cache cannot be read or updated."""
+    pass
+
+
+# Data Classes
+@dataclass
+class CacheEntry:
+    """A cached template archive."""
+    release: str
+    asset: str
+    sha256: str
+    size: int
+    last_used: float
+    path: Path
+
+
+@dataclass
+class CachedRelease:
+    """Release metadata persisted together with its HTTP validators."""
+    url: str
+    payload: dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Return True when the metadata was (re)validated less than ``ttl`` seconds ago."""
+        return 0 <= time.time() - self.fetched_at < ttl
+
+
+@dataclass
+class CacheStats:
+    """Summary of the template cache contents."""
+    cache_dir: Path
+    entries: int
+    blobs: int
+    total_bytes: int
+    max_bytes: int
+
+
+# Core Functions
+def get_template_cache_dir() -> Path:
+    """
+    Get the directory holding cached templates.
+
+    Honours ``NEXKIT_CACHE_DIR`` and otherwise uses the platformdirs user
+    cache directory.
+
+    Returns:
+        Path to the template cache directory (may not exist yet)
+    """
+    override = os.getenv("NEXKIT_CACHE_DIR")
+    if override:
+        return Path(override) / "templates"
+
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("nexkit")) / "templates"
+
+
+def get_max_cache_bytes() -> int:
+    """Return the configured cache size limit (``NEXKIT_CACHE_MAX_MB``) in bytes."""
+    try:
+        max_mb = float(os.getenv("NEXKIT_CACHE_MAX_MB", DEFAULT_MAX_CACHE_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_CACHE_MB
+    return int(max_mb * 1024 * 1024)
+
+
+def get_release_ttl() -> float:
+    """Return the release metadata freshness window (``NEXKIT_RELEASE_TTL``) in seconds."""
+    try:
+        return max(0.0, float(os.getenv("NEXKIT_RELEASE_TTL", DEFAULT_RELEASE_TTL_SECONDS)))
+    except ValueError:
+        return float(DEFAULT_RELEASE_TTL_SECONDS)
+
+
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _acquire_lock(lock_path: Path, stale_seconds: float = STALE_LOCK_SECONDS) -> bool:
+    """Create a lock file exclusively, stealing it when it is stale."""
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime < stale_seconds:
+                    return False
+                lock_path.unlink()
+            except OSError:
+                return False
+            continue
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+
+def _cache_key(release: str, asset: str) -> str:
+    return f"{release}/{asset}"
+
+
+class TemplateCache:
+    """Size-bounded, content-addressed store of template archives.
+
+    Layout::
+
+        <cache_dir>/index.json            {"<release>/<asset>": {sha256, size, last_used}}
+        <cache_dir>/index.lock            held while index.json, releases.json or blobs change
+        <cache_dir>/blobs/<sha256>.zip    archive bytes
+        <cache_dir>/downloads/            in-flight and resumable (.part) downloads
+        <cache_dir>/releases.json         {"<api url>": {payload, etag, last_modified, fetched_at}}
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or get_template_cache_dir()
+        self.max_bytes = get_max_cache_bytes() if max_bytes is None else max_bytes
+        self.index_path = self.cache_dir / CACHE_INDEX_FILENAME
+        self.blobs_dir = self.cache_dir / CACHE_BLOBS_DIRNAME
+        self.downloads_dir = self.cache_dir / CACHE_DOWNLOADS_DIRNAME
+        self.releases_path = self.cache_dir / RELEASES_FILENAME
+        self.lock_path = self.cache_dir / "index.lock"
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return the storage path for an archive with the given digest."""
+        return self.blobs_dir / f"{sha256}.zip"
+
+    def download_path(self, asset: str) -> Path:
+        """Return the path to download an archive into before storing it.
+
+        The path is stable across runs so interrupted downloads (kept as
+        ``<asset>.part``) can be resumed.
+        """
+        self.downloads_dir.mkdir(parents=True, exist_ok=True)
+        return self.downloads_dir / asset
+
+    def _read_json(self, path: Path) -> dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+            temp_file.replace(path)  # Atomic on POSIX and Windows
+        except OSError as e:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise TemplateCacheError(f"Failed to update template cache {path.name}: {e}")
+
+    @contextmanager
+    def _locked(self):
+        """Hold the cache lock so concurrent nexkit processes update the index in turn.
+
+        Raises:
+            TemplateCacheError: If another process holds the lock for too long
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + INDEX_LOCK_TIMEOUT_SECONDS
+        while not _acquire_lock(self.lock_path, INDEX_LOCK_STALE_SECONDS):
+            if time.monotonic() > deadline:
+                raise TemplateCacheError(f"Timed out waiting for the template cache lock {self.lock_path}")
+            time.sleep(0.05)
+        try:
+            yield
+        finally:
+            try:
+                self.lock_path.unlink()
+            except OSError:
+                pass
+
+    def _read_index(self) -> dict:
+        return self._read_json(self.index_path)
+
+    def _write_index(self, index: dict) -> None:
+        self._write_json(self.index_path, index)
+
+    def load_release(self, url: str) -> Optional[CachedRelease]:
+        """
+        Load persisted release metadata for an API URL.
+
+        Args:
+            url: GitHub API URL the metadata was fetched from
+
+        Returns:
+            CachedRelease, or None if nothing usable is stored
+        """
+        record = self._read_json(self.releases_path).get(url)
+        if not isinstance(record, dict) or not isinstance(record.get("payload"), dict):
+            return None
+        try:
+            fetched_at = float(record.get("fetched_at", 0))
+        except (TypeError, ValueError):
+            fetched_at = 0.0
+        return CachedRelease(
+            url=url,
+            payload=record["payload"],
+            etag=record.get("etag"),
+            last_modified=record.get("last_modified"),
+            fetched_at=fetched_at,
+        )
+
+    def save_release(self, url: str, payload: dict, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedRelease:
+        """
+        Persist release metadata with its validators, marking it fresh.
+
+        Args:
+            url: GitHub API URL the metadata was fetched from
+            payload: Parsed release JSON
+            etag: ``ETag`` response header, if any
+            last_modified: ``Last-Modified`` response header, if any
+
+        Returns:
+            The stored CachedRelease
+        """
+        release = CachedRelease(url=url, payload=payload, etag=etag, last_modified=last_modified, fetched_at=time.time())
+        with self._locked():
+            releases = self._read_json(self.releases_path)
+            releases[url] = {
+                "payload": payload,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": release.fetched_at,
+            }
+            self._write_json(self.releases_path, releases)
+        return release
+
+    def _entry(self, key: str, value: dict) -> Optional[CacheEntry]:
+        release, _, asset = key.rpartition("/")
+        try:
+            sha256 = value["sha256"]
+            entry = CacheEntry(
+                release=release,
+                asset=asset,
+                sha256=sha256,
+                size=int(value["size"]),
+                last_used=float(value.get("last_used", 0)),
+                path=self.blob_path(sha256),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        return entry if entry.path.is_file() else None
+
+    def entries(self) -> List[CacheEntry]:
+        """Return all valid cache entries, most recently used first."""
+        entries = [
+            entry for key, value in self._read_index().items()
+            if isinstance(value, dict) and (entry := self._entry(key, value))
+        ]
+        return sorted(entries, key=lambda e: e.last_used, reverse=True)
+
+    def lookup(self, release: str, asset: str, sha256: Optional[str] = None) -> Optional[CacheEntry]:
+        """
+        Find a cached archive and mark it as recently used.
+
+        Args:
+            release: Release tag (e.g. 'v1.2.0')
+            asset: Release asset file name
+            sha256: Expected digest, if known; a mismatching entry is a miss
+
+        Returns:
+            CacheEntry on hit, None on miss
+        """
+        key = _cache_key(release, asset)
+        if not self.index_path.exists():
+            return None
+        try:
+            with self._locked():
+                index = self._read_index()
+                entry = self._mark_used(index, key, sha256)
+                if entry:
+                    self._write_index(index)
+        except TemplateCacheError:
+            # Recency is best effort: serve the entry without recording it
+            entry = self._mark_used(self._read_index(), key, sha256)
+        return entry
+
+    def _mark_used(self, index: dict, key: str, sha256: Optional[str]) -> Optional[CacheEntry]:
+        value = index.get(key)
+        entry = self._entry(key, value) if isinstance(value, dict) else None
+        if entry is None or (sha256 and entry.sha256 != sha256.lower()):
+            return None
+        entry.last_used = value["last_used"] = time.time()
+        return entry
+
+    def latest(self, asset_pattern: str) -> Optional[CacheEntry]:
+        """Return the most recently used entry whose asset name contains a pattern."""
+        for entry in self.entries():
+            if asset_pattern in entry.asset:
+                return entry
+        return None
+
+    def store(self, release: str, asset: str, source: Path) -> CacheEntry:
+        """
+        Move a downloaded archive into the cache.
+
+        The archive is hashed, moved to its content-addressed location
+        (deduplicated when the same bytes are already cached) and the cache
+        is pruned to stay within its size limit.
+
+        Args:
+            release: Release tag
+            asset: Release asset file name
+            source: Path of the downloaded archive; it is consumed
+
+        Returns:
+            CacheEntry for the stored archive
+        """
+        sha256 = sha256_file(source)
+        size = source.stat().st_size
+        target = self.blob_path(sha256)
+        with self._locked():
+            started = time.time()
+            try:
+                self.blobs_dir.mkdir(parents=True, exist_ok=True)
+                if target.exists():
+                    source.unlink()
+                else:
+                    os.replace(source, target)
+                # Mark the blob as in use so no concurrent prune treats it as an orphan
+                os.utime(target)
+            except OSError as e:
+                raise TemplateCacheError(f"Failed to store template in cache: {e}")
+
+            index = self._read_index()
+            index[_cache_key(release, asset)] = {"sha256": sha256, "size": size, "last_used": started}
+            self._write_index(index)
+            self._prune(index, self.max_bytes, keep=sha256, started=started)
+        return CacheEntry(release=release, asset=asset, sha256=sha256, size=size, last_used=started, path=target)
+
+    def evict(self, release: str, asset: str) -> Optional[CacheEntry]:
+        """
+        Remove one entry, deleting its archive unless another entry shares it.
+
+        Args:
+            release: Release tag
+            asset: Release asset file name
+
+        Returns:
+            The evicted entry, or None if it was not cached
+        """
+        key = _cache_key(release, asset)
+        with self._locked():
+            index = self._read_index()
+            value = index.pop(key, None)
+            entry = self._entry(key, value) if isinstance(value, dict) else None
+            if value is None:
+                return None
+            self._write_index(index)
+            if entry and not any(isinstance(v, dict) and v.get("sha256") == entry.sha256 for v in index.values()):
+                try:
+                    entry.path.unlink()
+                except OSError:
+                    pass
+        return entry
+
+    def prune(self, max_bytes: Optional[int] = None, keep: Optional[str] = None) -> List[CacheEntry]:
+        """
+        Evict least-recently-used archives until the cache fits its limit.
+
+        Args:
+            max_bytes: Size limit to enforce (defaults to the configured limit)
+            keep: Digest that must not be evicted (e.g. the archive in use)
+
+        Returns:
+            List of evicted entries
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._locked():
+            return self._prune(self._read_index(), limit, keep=keep, started=time.time())
+
+    def _prune(self, index: dict, limit: int, *, keep: Optional[str], started: float) -> List[CacheEntry]:
+        """Evict entries from ``index`` (the caller holds the lock) and write it back."""
+        entries = sorted(
+            (entry for key, value in index.items() if isinstance(value, dict) and (entry := self._entry(key, value))),
+            key=lambda e: e.last_used,
+            reverse=True,
+        )
+
+        # Drop index entries whose blob disappeared
+        live_keys = {_cache_key(e.release, e.asset) for e in entries}
+        changed = len(live_keys) != len(index)
+        index = {k: v for k, v in index.items() if k in live_keys}
+
+        # Size is counted per blob: several tags/assets may share the same bytes
+        blob_sizes = {e.sha256: e.size for e in entries}
+        total = sum(blob_sizes.values())
+        evicted = []
+        for entry in reversed(entries):  # least recently used first
+            if total <= limit:
+                break
+            if entry.sha256 == keep:
+                continue
+            index.pop(_cache_key(entry.release, entry.asset), None)
+            evicted.append(entry)
+            changed = True
+            if not any(v.get("sha256") == entry.sha256 for v in index.values()):
+                total -= blob_sizes.pop(entry.sha256, 0)
+                try:
+                    entry.path.unlink()
+                except OSError:
+                    pass
+
+        if changed:
+            self._write_index(index)
+        self._remove_orphans(index, started)
+        return evicted
+
+    def _remove_orphans(self, index: dict, started: float) -> None:
+        """Delete blobs no index entry refers to.
+
+        Blobs modified since ``started`` are kept: they may have just been
+        stored by another process that has not indexed them yet.
+        """
+        if not self.blobs_dir.is_dir():
+            return
+        referenced = {f"{v.get('sha256')}.zip" for v in index.values() if isinstance(v, dict)}
+        for blob in self.blobs_dir.iterdir():
+            if blob.name in referenced:
+                continue
+            try:
+                if blob.is_file() and blob.stat().st_mtime < started:
+                    blob.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """
+        Remove every cached archive.
+
+        Returns:
+            Number of bytes freed
+        """
+        freed = self.stats().total_bytes
+        if self.cache_dir.exists():
+            try:
+                shutil.rmtree(self.cache_dir)
+            except OSError as e:
+                raise TemplateCacheError(f"Failed to clear template cache: {e}")
+        return freed
+
+    def stats(self) -> CacheStats:
+        """Return a summary of the cache contents."""
+        entries = self.entries()
+        blob_sizes = {e.sha256: e.size for e in entries}
+        return CacheStats(
+            cache_dir=self.cache_dir,
+            entries=len(entries),
+            blobs=len(blob_sizes),
+            total_bytes=sum(blob_sizes.values()),
+            max_bytes=self.max_bytes,
+        )
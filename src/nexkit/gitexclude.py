@@ -0,0 +1,302 @@
+"""
+Native evaluation of git's ignore rules.
+
+Answers "would git ignore this path?" the way ``git check-ignore`` does,
+without starting git. Rules come from ``core.excludesFile``,
+``$GIT_DIR/info/exclude`` and every ``.gitignore`` from the repository root
+down to the path. Each pattern is compiled once into an anchored regex;
+within one file the last matching rule wins, a deeper ``.gitignore``
+overrides a shallower one, and a path inside an ignored directory is
+ignored no matter what (git never looks inside it).
+
+Pattern format reference: https://git-scm.com/docs/gitignore
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Constants
+IGNORE_FILE = ".gitignore"
+
+_CONFIG_SECTION = re.compile(r'^\s*\[\s*([A-Za-z0-9.-]+)(?:\s+"[^"]*")?\s*\]')
+_CONFIG_EXCLUDES = re.compile(r"^\s*excludesfile\s*=\s*(.*)$", re.IGNORECASE)
+
+
+# Data Classes
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One compiled pattern from an ignore file."""
+    pattern: str              # Pattern as written (without the ``!`` prefix)
+    regex: "re.Pattern[str]"  # Full match against the path relative to base
+    negated: bool             # ``!pattern`` re-includes matching paths
+    directory_only: bool      # Trailing slash: only matches directories
+    source: Path              # File the rule was read from
+    line: int                 # 1-based line number in source
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        return self.regex.fullmatch(path) is not None
+
+    def describe(self, root: Optional[Path] = None) -> str:
+        """Return the rule as ``git check-ignore -v`` prints it (source:line:pattern).
+
+        Sources inside root are shown relative to it.
+        """
+        source = self.source
+        if root is not None and source.is_relative_to(root):
+            source = source.relative_to(root)
+        return f"{source.as_posix()}:{self.line}:{'!' if self.negated else ''}{self.pattern}{'/' if self.directory_only else ''}"
+
+
+# Pattern Compilation
+def glob_to_regex(glob: str) -> str:
+    """
+    Translate the wildcard syntax of an ignore pattern into a regex.
+
+    ``*`` and ``?`` never match ``/``; ``**/``, ``/**/`` and a trailing
+    ``/**`` span directories; ``[...]`` classes (``!`` or ``^`` negates)
+    and backslash escapes are supported.
+
+    Args:
+        glob: Pattern body without negation prefix or leading/trailing slash
+
+    Returns:
+        Regular expression source (unanchored; use ``fullmatch``)
+    """
+    parts = []
+    i = 0
+    while i < len(glob):
+        c = glob[i]
+        if glob.startswith("**/", i) and (i == 0 or glob[i - 1] == "/"):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("**", i) and i + 2 == len(glob) and (i == 0 or glob[i - 1] == "/"):
+            parts.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            start = i + 2 if glob[i + 1:i + 2] in ("!", "^") else i + 1
+            end = glob.find("]", start + 1)  # A "]" first in the class is literal
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                members = "".join("\\" + m if m in "\\[]^" else m for m in glob[start:end])
+                # A negated class never matches the path separator
+                parts.append(f"[^/{members}]" if start == i + 2 else f"[{members}]")
+                i = end + 1
+                continue
+        elif c == "\\" and i + 1 < len(glob):
+            parts.append(re.escape(glob[i + 1]))
+            i += 2
+            continue
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return "".join(parts)
+
+
+def _strip_trailing_spaces(line: str) -> str:
+    """Drop trailing spaces unless escaped with a backslash."""
+    stripped = line.rstrip(" ")
+    if stripped != line and stripped.endswith("\\") and not stripped.endswith("\\\\"):
+        stripped += " "
+    return stripped
+
+
+def compile_rule(line: str, source: Path, number: int) -> Optional[IgnoreRule]:
+    """
+    Compile one line of an ignore file.
+
+    Args:
+        line: Line without its newline
+        source: File the line comes from (reported by describe)
+        number: 1-based line number
+
+    Returns:
+        The compiled rule, or None for blank lines and comments
+    """
+    line = _strip_trailing_spaces(line.rstrip("\r"))
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+    directory_only = line.endswith("/") and not line.endswith("\\/")
+    body = line[:-1] if directory_only else line
+    if not body:
+        return None
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory
+    if "/" in body:
+        regex = glob_to_regex(body.lstrip("/"))
+    else:
+        regex = "(?:.*/)?" + glob_to_regex(body)
+    return IgnoreRule(body, re.compile(regex, re.DOTALL), negated, directory_only, source, number)
+
+
+def read_rules(path: Path) -> List[IgnoreRule]:
+    """Compile every rule in an ignore file (a missing or unreadable file has none)."""
+    try:
+        if path.is_symlink():
+            return []  # git refuses to follow symlinked ignore files
+        text = path.read_bytes().decode("utf-8", errors="surrogateescape")
+    except OSError:
+        return []
+    rules = []
+    for number, line in enumerate(text.split("\n"), start=1):
+        rule = compile_rule(line, path, number)
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+# Configuration
+def _config_files(common_dir: Path) -> List[Path]:
+    """Git config files in increasing order of precedence (system config excluded)."""
+    xdg = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    global_config = os.environ.get("GIT_CONFIG_GLOBAL")
+    user = [Path(global_config)] if global_config else [Path(xdg) / "git" / "config", Path.home() / ".gitconfig"]
+    return [*user, common_dir / "config"]
+
+
+def _read_excludes_file(config: Path) -> Optional[str]:
+    """Return the last core.excludesFile value set in one config file."""
+    try:
+        lines = config.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    value = None
+    section = None
+    for line in lines:
+        header = _CONFIG_SECTION.match(line)
+        if header:
+            section = header.group(1).lower()
+            line = line[header.end():]
+        if section != "core":
+            continue
+        setting = _CONFIG_EXCLUDES.match(line)
+        if setting:
+            raw = setting.group(1).strip()
+            if raw.startswith('"'):
+                raw = raw[1:raw.find('"', 1)] if '"' in raw[1:] else raw[1:]
+            else:
+                raw = re.split(r"\s[#;]", raw, maxsplit=1)[0].strip()
+            value = raw
+    return value
+
+
+def get_excludes_file(common_dir: Path) -> Path:
+    """
+    Return the global ignore file for a repository.
+
+    Uses ``core.excludesFile`` from the user or repository config, falling
+    back to git's default ``$XDG_CONFIG_HOME/git/ignore``.
+    """
+    value = None
+    for config in _config_files(common_dir):
+        value = _read_excludes_file(config) or value
+    if value:
+        return Path(os.path.expanduser(value))
+    xdg = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(xdg) / "git" / "ignore"
+
+
+# Core Functions
+class IgnoreMatcher:
+    """
+    Evaluate ignore rules for paths in one working tree.
+
+    ``.gitignore`` files are read lazily, once per directory, and directory
+    decisions are cached, so checking many paths in the same tree reads
+    each ignore file and evaluates each directory only once.
+    """
+
+    def __init__(self, root: Path, global_rules: Optional[List[IgnoreRule]] = None):
+        """
+        Args:
+            root: Top level of the working tree
+            global_rules: Rules that apply to the whole tree, lowest
+                precedence first (core.excludesFile, then info/exclude)
+        """
+        self.root = root
+        self.global_rules = list(global_rules or [])
+        self._rules: Dict[str, List[IgnoreRule]] = {}
+        self._dirs: Dict[str, Tuple[bool, Optional[IgnoreRule]]] = {"": (False, None)}
+
+    @classmethod
+    def for_repository(cls, root: Path, common_dir: Path) -> "IgnoreMatcher":
+        """Build a matcher with the repository's exclude file and global excludes file."""
+        global_rules = read_rules(get_excludes_file(common_dir)) + read_rules(common_dir / "info" / "exclude")
+        return cls(root, global_rules)
+
+    def _directory_rules(self, directory: str) -> List[IgnoreRule]:
+        rules = self._rules.get(directory)
+        if rules is None:
+            rules = read_rules(self.root / directory / IGNORE_FILE)
+            self._rules[directory] = rules
+        return rules
+
+    def _last_match(self, path: str, is_dir: bool) -> Optional[IgnoreRule]:
+        """Return the rule that decides path, ignoring its parent directories."""
+        directory = path.rpartition("/")[0]
+        while True:
+            relative = path[len(directory) + 1:] if directory else path
+            for rule in reversed(self._directory_rules(directory)):
+                if rule.matches(relative, is_dir):
+                    return rule
+            if not directory:
+                break
+            directory = directory.rpartition("/")[0]
+        for rule in reversed(self.global_rules):
+            if rule.matches(path, is_dir):
+                return rule
+        return None
+
+    def _directory_state(self, directory: str) -> Tuple[bool, Optional[IgnoreRule]]:
+        state = self._dirs.get(directory)
+        if state is None:
+            parent_state = self._directory_state(directory.rpartition("/")[0])
+            if parent_state[0]:
+                state = parent_state
+            else:
+                rule = self._last_match(directory, True)
+                state = (rule is not None and not rule.negated, rule)
+            self._dirs[directory] = state
+        return state
+
+    def explain(self, path: str, is_dir: bool = False) -> Tuple[bool, Optional[IgnoreRule]]:
+        """
+        Decide whether git would ignore path.
+
+        Args:
+            path: Path relative to the root, with ``/`` separators
+            is_dir: Whether path is a directory (``dir/`` rules only match directories)
+
+        Returns:
+            (ignored, rule) where rule is the deciding rule - the one that
+            ignored path or one of its parent directories, or the negation
+            that re-included it - or None if no rule matches
+        """
+        path = path.strip("/")
+        if is_dir:
+            return self._directory_state(path)
+        parent_state = self._directory_state(path.rpartition("/")[0])
+        if parent_state[0]:
+            return parent_state
+        rule = self._last_match(path, False)
+        return rule is not None and not rule.negated, rule
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Return True if git would ignore path (see explain)."""
+        return self.explain(path, is_dir)[0]
@@ -6,15 +6,30 @@ exclusion patterns from .gitignore files, helping users manage whether
 nexkit files are tracked in version control.
 """
 
+import contextlib
+import mmap
+import os
+import re
+import shutil
 import subprocess
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+
+from .gitexclude import IgnoreMatcher, glob_to_regex
+from .gitindex import UnsupportedIndexError, read_matching_paths
 
 
 # Constants
 NEXKIT_SECTION_MARKER = "# Nexkit - Spec-Driven Development Tools"
 NEXKIT_SECTION_END_MARKER = "# End Nexkit exclusions"
+_SECTION_MARKER = NEXKIT_SECTION_MARKER.encode("utf-8")
+_SECTION_END_MARKER = NEXKIT_SECTION_END_MARKER.encode("utf-8")
+_AGENT_COMMENT = "# Agent:"
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Optional semaphore bounding concurrent git processes (set by bulk operations)
+_git_process_limit = None
 
 # Base patterns that are always included
 BASE_PATTERNS = [
@@ -38,6 +53,25 @@ AGENT_MODE_PATTERNS = {
     "q": [".amazonq/prompts/nexkit.*", ".amazonq/modes/"],
 }
 
+# Directories whose presence indicates that an agent is used in a project
+AGENT_INDICATORS = {
+    "copilot": [".github/prompts", ".github/chatmodes"],
+    "claude": [".claude/commands", ".claude/modes"],
+    "gemini": [".gemini/commands", ".gemini/modes"],
+    "cursor": [".cursor/commands", ".cursor/modes"],
+    "qwen": [".qwen/commands", ".qwen/modes"],
+    "opencode": [".opencode/command", ".opencode/modes"],
+    "windsurf": [".windsurf/workflows", ".windsurf/modes"],
+    "codex": [".codex/prompts", ".codex/modes"],
+    "kilocode": [".kilocode/workflows", ".kilocode/modes"],
+    "auggie": [".augment/commands", ".augment/modes"],
+    "roo": [".roo/commands", ".roo/modes"],
+    "q": [".amazonq/prompts", ".amazonq/modes"],
+}
+
+# Number of tracked files listed by name in cleanup guidance
+GUIDANCE_SAMPLE_SIZE = 10
+
 # Legacy pattern list for backward compatibility
 NEXKIT_PATTERNS = [
     ".specify/",
@@ -63,6 +97,32 @@ class GitNotInstalledError(GitIgnoreError):
 
 
 # Data Classes
+@dataclass(frozen=True)
+class GitRepo:
+    """A resolved git repository, shared by all exclusion operations."""
+    root: Path                          # Top level of the working tree
+    git_dir: Path                       # Administrative directory (HEAD, index)
+    common_dir: Path                    # Shared directory (refs, info/exclude); differs for linked worktrees
+    gitdir_file: Optional[Path] = None  # The .git file, for worktrees and submodules
+
+    @property
+    def gitignore_path(self) -> Path:
+        return self.root / ".gitignore"
+
+    @property
+    def index_path(self) -> Path:
+        return self.git_dir / "index"
+
+    @property
+    def object_hash_size(self) -> int:
+        """Object id size in bytes: 32 for SHA-256 repositories, otherwise 20."""
+        try:
+            config = (self.common_dir / "config").read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return 20
+        return 32 if re.search(r"(?im)^\s*objectformat\s*=\s*sha256\s*$", config) else 20
+
+
 @dataclass
 class ExclusionResult:
     """Result of add/remove exclusion operations."""
@@ -73,6 +133,28 @@ class ExclusionResult:
     already_configured: bool
     tracked_files: List[Path]
     git_root: Path
+    patterns_removed: List[str] = field(default_factory=list)  # Set when an existing section was updated
+    
+    @property
+    def updated(self) -> bool:
+        """True if an existing section was changed."""
+        return self.already_configured and bool(self.patterns_affected or self.patterns_removed)
+
+
+@dataclass
+class DetectedAgent:
+    """An agent found in a project, with the indicator paths that matched."""
+    agent: str
+    evidence: List[str]
+
+
+@dataclass
+class NexkitSection:
+    """The nexkit section found in a .gitignore file."""
+    start: int             # Byte offset of the marker line
+    end: int               # Byte offset just past the end marker line
+    agents: List[str]      # Agents named on the "# Agent:" line
+    patterns: List[str]    # Pattern lines, in file order
 
 
 @dataclass
@@ -85,6 +167,21 @@ class ExclusionStatus:
     requires_cleanup: bool
     git_root: Path
     gitignore_path: Optional[Path]
+    agents: List[DetectedAgent] = field(default_factory=list)  # Agents detected in the project
+
+
+@dataclass
+class ExclusionVerification:
+    """Whether git really ignores the nexkit paths in a working tree."""
+    git_root: Path
+    patterns: List[str]
+    ignored: List[Path]                            # Ignored nexkit paths (topmost ignored directory only)
+    not_ignored: List[Tuple[Path, Optional[str]]]  # Nexkit files git would pick up, with the re-including rule
+    tracked_files: List[Path]                      # Tracked nexkit files; ignore rules do not apply to them
+    
+    @property
+    def is_effective(self) -> bool:
+        return not self.not_ignored and not self.tracked_files
 
 
 # Core Functions
@@ -107,6 +204,72 @@ def get_patterns_for_agent(agent_type: Optional[str] = None) -> List[str]:
     return patterns
 
 
+def get_patterns_for_agents(agent_types: Iterable[str]) -> List[str]:
+    """
+    Get gitignore patterns covering several agents.
+    
+    Args:
+        agent_types: Agent identifiers
+    
+    Returns:
+        Base patterns followed by each agent's patterns, without duplicates
+    """
+    patterns = BASE_PATTERNS.copy()
+    for agent_type in agent_types:
+        for pattern in AGENT_MODE_PATTERNS.get(agent_type, []):
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+def _agent_list(agent_type: Union[str, Sequence[str], None]) -> List[str]:
+    if not agent_type:
+        return []
+    return [agent_type] if isinstance(agent_type, str) else list(dict.fromkeys(agent_type))
+
+
+def _list_entries(path: Path) -> List[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries]
+    except OSError:
+        return []
+
+
+def detect_agents(repo_path: Path) -> List[DetectedAgent]:
+    """
+    Detect every agent used in a project.
+    
+    The repository root is listed once, then only the agent directories
+    present there are listed, instead of probing each indicator path.
+    
+    Args:
+        repo_path: Path to repository
+    
+    Returns:
+        Detected agents in AGENT_INDICATORS order, each with the indicator
+        paths found
+    """
+    root_entries = set(_list_entries(repo_path))
+    children = {}
+    for paths in AGENT_INDICATORS.values():
+        for path in paths:
+            parent = path.partition("/")[0]
+            if parent in root_entries and parent not in children:
+                children[parent] = set(_list_entries(repo_path / parent))
+    
+    detected = []
+    for agent, paths in AGENT_INDICATORS.items():
+        evidence = []
+        for path in paths:
+            parent, _, name = path.partition("/")
+            if name in children.get(parent, ()):
+                evidence.append(path)
+        if evidence:
+            detected.append(DetectedAgent(agent=agent, evidence=evidence))
+    return detected
+
+
 def detect_agent_from_project(repo_path: Path) -> Optional[str]:
     """
     Attempt to detect which agent is being used in a project.
@@ -115,30 +278,29 @@ def detect_agent_from_project(repo_path: Path) -> Optional[str]:
         repo_path: Path to repository
     
     Returns:
-        Agent type string if detected, None otherwise
-    """
-    # Check for agent-specific directories
-    agent_indicators = {
-        "copilot": [".github/prompts", ".github/chatmodes"],
-        "claude": [".claude/commands", ".claude/modes"],
-        "gemini": [".gemini/commands", ".gemini/modes"],
-        "cursor": [".cursor/commands", ".cursor/modes"],
-        "qwen": [".qwen/commands", ".qwen/modes"],
-        "opencode": [".opencode/command", ".opencode/modes"],
-        "windsurf": [".windsurf/workflows", ".windsurf/modes"],
-        "codex": [".codex/prompts", ".codex/modes"],
-        "kilocode": [".kilocode/workflows", ".kilocode/modes"],
-        "auggie": [".augment/commands", ".augment/modes"],
-        "roo": [".roo/commands", ".roo/modes"],
-        "q": [".amazonq/prompts", ".amazonq/modes"],
-    }
-    
-    for agent, paths in agent_indicators.items():
-        for path in paths:
-            if (repo_path / path).exists():
-                return agent
+        First detected agent type (see detect_agents for all), None if none found
+    """
+    detected = detect_agents(repo_path)
+    return detected[0].agent if detected else None
+
+
+def set_git_process_limit(semaphore) -> None:
+    """
+    Make every git process started by this module hold semaphore while it runs.
     
-    return None
+    Used when many repositories are processed in parallel so that the number
+    of concurrent git processes stays bounded regardless of the worker count.
+    
+    Args:
+        semaphore: Any context manager, typically a multiprocessing
+            Semaphore shared by the workers; None removes the limit
+    """
+    global _git_process_limit
+    _git_process_limit = semaphore
+
+
+def _git_slot():
+    return _git_process_limit if _git_process_limit is not None else contextlib.nullcontext()
 
 
 def is_git_repository(path: Path) -> bool:
@@ -192,63 +354,295 @@ def get_git_root(path: Path) -> Optional[Path]:
         return None
 
 
-def get_tracked_nexkit_files(repo_path: Path, agent_type: Optional[str] = None) -> List[Path]:
+def _read_gitdir_file(dot_git: Path) -> Optional[Path]:
+    """Return the directory a ``.git`` file points to ("gitdir: <path>")."""
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    target = Path(content[len("gitdir:"):].strip())
+    if not target.is_absolute():
+        target = dot_git.parent / target
+    return target.resolve()
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Return the common directory of git_dir (linked worktrees have a commondir file)."""
+    try:
+        common = Path((git_dir / "commondir").read_text(encoding="utf-8").strip())
+    except (OSError, UnicodeDecodeError):
+        return git_dir
+    return (common if common.is_absolute() else git_dir / common).resolve()
+
+
+def _discover_repository(path: Path) -> Optional[GitRepo]:
+    """Find the repository containing path by walking up to a ``.git`` entry (no subprocess)."""
+    start = path.resolve()
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir, gitdir_file = dot_git, None
+        elif dot_git.is_file():
+            git_dir, gitdir_file = _read_gitdir_file(dot_git), dot_git
+            if git_dir is None:
+                return None
+        else:
+            continue
+        if not (git_dir / "HEAD").is_file():
+            return None
+        return GitRepo(root=directory, git_dir=git_dir, common_dir=_common_dir(git_dir), gitdir_file=gitdir_file)
+    return None
+
+
+def _query_repository(path: Path) -> Optional[GitRepo]:
+    """Resolve the repository with a single ``git rev-parse`` call."""
+    try:
+        with _git_slot():
+            result = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir", "--git-common-dir"],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+    except FileNotFoundError:
+        raise GitNotInstalledError("Git is not installed or not in PATH")
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    lines = result.stdout.splitlines()
+    if len(lines) < 3:
+        return None
+    root, git_dir = Path(lines[0]), Path(lines[1])
+    common_dir = Path(lines[2])
+    if not common_dir.is_absolute():
+        common_dir = (path / common_dir).resolve()
+    dot_git = root / ".git"
+    return GitRepo(root=root, git_dir=git_dir, common_dir=common_dir,
+                   gitdir_file=dot_git if dot_git.is_file() else None)
+
+
+def open_repository(path: Path) -> GitRepo:
+    """
+    Resolve the git repository containing path, once, for reuse.
+
+    The ``.git`` directory (or ``gitdir:`` file for worktrees and
+    submodules) is found by walking up from path in pure Python. Git itself
+    is only asked, with a single subprocess, when ``GIT_DIR`` or
+    ``GIT_WORK_TREE`` override discovery.
+
+    Args:
+        path: Any path within the repository
+
+    Returns:
+        GitRepo handle to pass to the other functions in this module
+
+    Raises:
+        NotGitRepositoryError: If path is not in a git repository
+        GitNotInstalledError: If git is needed but not available
+    """
+    if os.environ.get("GIT_DIR") or os.environ.get("GIT_WORK_TREE"):
+        repo = _query_repository(path)
+    else:
+        repo = _discover_repository(path)
+    if repo is None:
+        raise NotGitRepositoryError(
+            "Not a git repository. Initialize git first with: git init"
+        )
+    return repo
+
+
+def pattern_to_pathspecs(pattern: str) -> List[str]:
+    """
+    Translate a .gitignore pattern into git pathspecs matching the same paths.
+    
+    A pattern with a slash before its end is anchored at the repository
+    root; otherwise it matches at any depth. A pattern matching a directory
+    also matches everything below it, so a second ``/**`` pathspec is added
+    unless the pattern can only name a directory (trailing slash).
+    
+    Args:
+        pattern: Pattern as written in .gitignore (e.g. ".github/prompts/nexkit.*")
+    
+    Returns:
+        ``:(glob)`` pathspecs for ``git ls-files``
+    """
+    directory_only = pattern.endswith("/")
+    body = pattern.rstrip("/")
+    anchored = "/" in body
+    body = body.lstrip("/")
+    if not anchored:
+        body = f"**/{body}"
+    if directory_only:
+        return [f":(glob){body}/**"]
+    return [f":(glob){body}", f":(glob){body}/**"]
+
+
+def pattern_to_regex(pattern: str) -> str:
+    """
+    Translate a .gitignore pattern into a regex matching the same tracked paths.
+    
+    Equivalent to the pathspecs from pattern_to_pathspecs: the result matches
+    a full repo-relative path (use ``fullmatch``) that the pattern names or
+    that lies below a directory the pattern names.
+    
+    Args:
+        pattern: Pattern as written in .gitignore (e.g. ".github/prompts/nexkit.*")
+    
+    Returns:
+        Regular expression source
+    """
+    directory_only = pattern.endswith("/")
+    body = pattern.rstrip("/")
+    anchored = "/" in body
+    regex = glob_to_regex(body.lstrip("/"))
+    if not anchored:
+        regex = f"(?:.*/)?{regex}"
+    if directory_only:
+        return f"{regex}/.*"
+    return f"{regex}(?:/.*)?"
+
+
+def _nexkit_patterns(agent_type: Union[str, Sequence[str], None]) -> List[str]:
+    """Agent-specific patterns if an agent is known, otherwise the common (copilot) locations."""
+    agents = [agent for agent in _agent_list(agent_type) if agent in AGENT_MODE_PATTERNS]
+    if agents:
+        return get_patterns_for_agents(agents)
+    return BASE_PATTERNS + AGENT_MODE_PATTERNS["copilot"]
+
+
+def _read_tracked_from_index(repo: GitRepo, patterns: List[str]) -> List[str]:
+    """
+    List tracked paths matching patterns by parsing the index directly.
+    
+    Raises:
+        UnsupportedIndexError: If the index must be read by git instead
+    """
+    if os.environ.get("GIT_INDEX_FILE"):
+        raise UnsupportedIndexError("GIT_INDEX_FILE is set")
+    regex = re.compile("|".join(f"(?:{pattern_to_regex(p)})" for p in patterns).encode("utf-8"), re.DOTALL)
+    try:
+        return read_matching_paths(repo.index_path, regex, hash_size=repo.object_hash_size)
+    except OSError as e:
+        raise UnsupportedIndexError(str(e))
+
+
+def get_tracked_nexkit_files(repo_path: Path, agent_type: Union[str, Sequence[str], None] = None, *, repo: Optional[GitRepo] = None, patterns: Optional[List[str]] = None) -> List[Path]:
     """
     Get list of nexkit files currently tracked by git.
     
+    The index is parsed in-process, so git does not need to be installed;
+    split or sparse indexes are listed with ``git ls-files`` instead.
+    
     Args:
         repo_path: Path to repository (any path within repo)
-        agent_type: Optional agent type to check agent-specific patterns
+        agent_type: Optional agent type (or types) to check agent-specific patterns
+        repo: Already resolved repository (skips discovery)
+        patterns: Exact patterns to check (overrides agent_type)
     
     Returns:
         List of relative paths (from repo root) of tracked nexkit files
     
     Raises:
         NotGitRepositoryError: If not in a git repository
-        GitNotInstalledError: If git is not available
+        GitNotInstalledError: If git is needed to read the index but is not available
     """
-    if not is_git_repository(repo_path):
-        raise NotGitRepositoryError("Not a git repository")
+    repo = repo or open_repository(repo_path)
+    git_root = repo.root
     
-    git_root = get_git_root(repo_path)
-    if not git_root:
-        raise NotGitRepositoryError("Cannot determine git repository root")
+    patterns = patterns or _nexkit_patterns(agent_type)
     
-    tracked_files = []
+    try:
+        # Unmerged paths appear once per stage; keep the first
+        names = dict.fromkeys(_read_tracked_from_index(repo, patterns))
+        return [Path(name) for name in names]
+    except UnsupportedIndexError:
+        pass
     
-    # Base patterns to check
-    patterns_to_check = [".specify", "specs"]
+    pathspecs = [spec for pattern in patterns for spec in pattern_to_pathspecs(pattern)]
     
-    # Add agent-specific patterns if agent is specified
-    if agent_type and agent_type in AGENT_MODE_PATTERNS:
-        for pattern in AGENT_MODE_PATTERNS[agent_type]:
-            # Extract directory path from pattern (remove wildcards)
-            clean_pattern = pattern.rstrip("*").rstrip("/")
-            if clean_pattern:
-                patterns_to_check.append(clean_pattern)
-    else:
-        # If no agent specified, check common locations
-        patterns_to_check.extend([".github/prompts", ".github/chatmodes"])
-    
-    for pattern in patterns_to_check:
-        try:
+    # One index scan for all patterns; -z output is NUL-delimited and never quoted
+    try:
+        with _git_slot():
             result = subprocess.run(
-                ["git", "ls-files", pattern],
+                ["git", "ls-files", "-z", "--", *pathspecs],
                 cwd=git_root,
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            if result.stdout.strip():
-                files = result.stdout.strip().split("\n")
-                tracked_files.extend([Path(f) for f in files if f])
-        except FileNotFoundError:
-            raise GitNotInstalledError("Git is not installed or not in PATH")
-        except subprocess.CalledProcessError:
-            # Pattern not found or error - continue
-            continue
+    except FileNotFoundError:
+        raise GitNotInstalledError("Git is not installed or not in PATH")
+    except subprocess.CalledProcessError:
+        return []
     
-    return tracked_files
+    return [Path(os.fsdecode(name)) for name in result.stdout.split(b"\0") if name]
+
+
+def find_nexkit_section(gitignore_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Locate the nexkit section without reading the file into memory.
+    
+    Args:
+        gitignore_path: Path to .gitignore file
+    
+    Returns:
+        (start, end) byte offsets of the section's lines, from the start of
+        the marker line to just after the end marker line (or to the end of
+        the file if the end marker is missing); None if there is no section
+    
+    Raises:
+        OSError: If the file exists but cannot be read
+    """
+    try:
+        f = open(gitignore_path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            marker = buf.find(_SECTION_MARKER)
+            if marker == -1:
+                return None
+            start = buf.rfind(b"\n", 0, marker) + 1
+            end_marker = buf.find(_SECTION_END_MARKER, marker)
+            end = buf.find(b"\n", end_marker) if end_marker != -1 else -1
+            return start, (end + 1 if end != -1 else len(buf))
+
+
+def read_nexkit_section(gitignore_path: Path) -> Optional[NexkitSection]:
+    """
+    Parse the nexkit section of a .gitignore file.
+    
+    Only the section's bytes are read.
+    
+    Args:
+        gitignore_path: Path to .gitignore file
+    
+    Returns:
+        NexkitSection, or None if the file has no section
+    
+    Raises:
+        OSError: If the file exists but cannot be read
+    """
+    span = find_nexkit_section(gitignore_path)
+    if span is None:
+        return None
+    start, end = span
+    with open(gitignore_path, "rb") as f:
+        f.seek(start)
+        block = f.read(end - start).decode("utf-8", errors="surrogateescape")
+    
+    agents: List[str] = []
+    patterns: List[str] = []
+    for line in block.splitlines():
+        line = line.strip()
+        if line.startswith(_AGENT_COMMENT):
+            agents = [a.strip() for a in line[len(_AGENT_COMMENT):].split(",") if a.strip()]
+        elif line and not line.startswith("#"):
+            patterns.append(line)
+    return NexkitSection(start=start, end=end, agents=agents, patterns=patterns)
 
 
 def has_nexkit_section(gitignore_path: Path) -> bool:
@@ -261,26 +655,115 @@ def has_nexkit_section(gitignore_path: Path) -> bool:
     Returns:
         True if nexkit section exists, False otherwise
     """
-    if not gitignore_path.exists():
-        return False
-    
     try:
-        content = gitignore_path.read_text(encoding="utf-8")
-        return NEXKIT_SECTION_MARKER in content
+        return find_nexkit_section(gitignore_path) is not None
     except Exception:
         return False
 
 
-def get_nexkit_section_content(agent_type: Optional[str] = None) -> str:
+def _append_section(gitignore_path: Path, section: bytes) -> None:
+    """
+    Append section to .gitignore (creating it if needed) without reading it.
+    
+    Only the last byte is inspected, to start the section on a new line.
+    A failed write is rolled back by truncating to the original size.
+    """
+    created = not gitignore_path.exists()
+    try:
+        with open(gitignore_path, "a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    section = b"\n" + section
+            try:
+                f.write(section)  # Append mode: always lands at the end
+                f.flush()
+            except BaseException:
+                f.truncate(size)
+                raise
+    except PermissionError as e:
+        raise PermissionError(
+            f"Cannot write to .gitignore: {e}. Check file permissions."
+        )
+    except Exception as e:
+        if created:
+            gitignore_path.unlink(missing_ok=True)
+        raise OSError(f"Failed to update .gitignore: {e}")
+
+
+def _replace_section(gitignore_path: Path, start: int, end: int, section: bytes) -> None:
+    """
+    Replace bytes [start, end) of .gitignore with section, atomically.
+    
+    The content around the section is streamed into a temporary file, so
+    memory use is bounded by the section, not the file.
+    """
+    temp_file = gitignore_path.with_name(gitignore_path.name + ".tmp")
+    try:
+        with open(gitignore_path, "rb") as source, open(temp_file, "wb") as target:
+            remaining = start
+            while remaining:
+                chunk = source.read(min(remaining, _COPY_CHUNK_SIZE))
+                if not chunk:
+                    break
+                target.write(chunk)
+                remaining -= len(chunk)
+            target.write(section)
+            source.seek(end)
+            shutil.copyfileobj(source, target, _COPY_CHUNK_SIZE)
+        temp_file.replace(gitignore_path)  # Atomic on POSIX and Windows
+    except PermissionError as e:
+        temp_file.unlink(missing_ok=True)
+        raise PermissionError(
+            f"Cannot write to .gitignore: {e}. Check file permissions."
+        )
+    except Exception as e:
+        temp_file.unlink(missing_ok=True)
+        raise OSError(f"Failed to update .gitignore: {e}")
+
+
+def _copy_without_section(source, target) -> None:
+    """
+    Copy .gitignore line by line, dropping nexkit sections and trailing blank lines.
+    
+    Blank lines are held back until a non-blank line follows, so memory use
+    is bounded by the longest line or run of blank lines, not the file size.
+    """
+    in_section = False
+    blank_run: List[bytes] = []
+    last_line = b""
+    for line in source:
+        if in_section:
+            if _SECTION_END_MARKER in line:
+                in_section = False
+            continue
+        if _SECTION_MARKER in line:
+            in_section = True
+            continue
+        if not line.strip():
+            blank_run.append(line)
+            continue
+        target.writelines(blank_run)
+        blank_run.clear()
+        target.write(line)
+        last_line = line
+    if last_line and not last_line.endswith(b"\n"):
+        target.write(b"\n")  # Ensure file ends with newline
+
+
+def get_nexkit_section_content(agent_type: Union[str, Sequence[str], None] = None, *, patterns: Optional[List[str]] = None) -> str:
     """
     Generate the complete nexkit exclusion section content.
     
     Args:
-        agent_type: Optional agent type for agent-specific patterns
+        agent_type: Optional agent type (or types) for agent-specific patterns
+        patterns: Exact patterns to write (overrides the agent patterns)
     
     Returns:
         Formatted section with markers and patterns
     """
+    agents = _agent_list(agent_type)
     lines = [
         "",
         NEXKIT_SECTION_MARKER,
@@ -288,14 +771,13 @@ def get_nexkit_section_content(agent_type: Optional[str] = None) -> str:
         "# To remove: nexkit remove-exclusion",
     ]
     
-    if agent_type:
-        lines.append(f"# Agent: {agent_type}")
+    if agents:
+        lines.append(f"{_AGENT_COMMENT} {', '.join(agents)}")
     
     lines.append("")
     
-    # Get patterns for the specified agent
-    patterns = get_patterns_for_agent(agent_type)
-    lines.extend(patterns)
+    # Get patterns for the specified agents
+    lines.extend(patterns if patterns is not None else get_patterns_for_agents(agents))
     lines.append("")
     lines.append(NEXKIT_SECTION_END_MARKER)
     lines.append("")
@@ -303,14 +785,21 @@ def get_nexkit_section_content(agent_type: Optional[str] = None) -> str:
     return "\n".join(lines)
 
 
-def add_nexkit_exclusions(repo_path: Path, agent_type: Optional[str] = None) -> ExclusionResult:
+def add_nexkit_exclusions(repo_path: Path, agent_type: Union[str, Sequence[str], None] = None, *, repo: Optional[GitRepo] = None) -> ExclusionResult:
     """
     Add nexkit exclusion patterns to repository's .gitignore file.
     
+    If a nexkit section already exists it is updated in place: with
+    explicit agents it is made to match exactly their patterns (switching
+    agents); with auto-detection the detected agent's patterns are added
+    to the ones already there. The file is only written when the pattern
+    set actually changes.
+    
     Args:
         repo_path: Path to repository (can be any path within repo)
-        agent_type: Optional agent type for agent-specific patterns.
+        agent_type: Optional agent type (or types) for agent-specific patterns.
                    If None, attempts to detect from project structure.
+        repo: Already resolved repository (skips discovery)
     
     Returns:
         ExclusionResult with operation details
@@ -321,91 +810,81 @@ def add_nexkit_exclusions(repo_path: Path, agent_type: Optional[str] = None) ->
         PermissionError: If cannot read or write .gitignore
         OSError: If file operation fails
     """
-    # Validate git repository
-    if not is_git_repository(repo_path):
-        raise NotGitRepositoryError(
-            "Not a git repository. Initialize git first with: git init"
-        )
-    
-    git_root = get_git_root(repo_path)
-    if not git_root:
-        raise NotGitRepositoryError("Cannot determine git repository root")
+    # Validate git repository (resolved once, reused below)
+    repo = repo or open_repository(repo_path)
+    git_root = repo.root
     
     # Auto-detect agent if not specified
-    if agent_type is None:
-        agent_type = detect_agent_from_project(git_root)
+    detected = not agent_type
+    if detected:
+        agent_type = [found.agent for found in detect_agents(git_root)]
+    agents = _agent_list(agent_type)
     
     gitignore_path = git_root / ".gitignore"
+    section = read_nexkit_section(gitignore_path)
     
-    # Check if already configured
-    if has_nexkit_section(gitignore_path):
-        tracked = get_tracked_nexkit_files(repo_path, agent_type)
+    if section is None:
+        # Get patterns that will be added
+        patterns_added = get_patterns_for_agents(agents)
+        
+        # Append only the new section; existing content is never read or rewritten
+        _append_section(gitignore_path, get_nexkit_section_content(agents).encode("utf-8"))
+        
+        # Check for tracked files
+        tracked = get_tracked_nexkit_files(repo_path, agents, repo=repo)
+        
         return ExclusionResult(
             success=True,
-            message="Nexkit exclusions already configured",
+            message="Successfully added nexkit exclusions to .gitignore",
             gitignore_path=gitignore_path,
-            patterns_affected=[],
-            already_configured=True,
+            patterns_affected=patterns_added,
+            already_configured=False,
             tracked_files=tracked,
             git_root=git_root,
         )
     
-    # Read existing content
-    existing_content = ""
-    if gitignore_path.exists():
-        try:
-            existing_content = gitignore_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError as e:
-            raise OSError(f".gitignore file encoding issue: {e}")
-    
-    # Prepare new content with agent-specific patterns
-    nexkit_section = get_nexkit_section_content(agent_type)
-    
-    # Get patterns that will be added
-    patterns_added = get_patterns_for_agent(agent_type)
-    
-    # Ensure proper spacing
-    if existing_content and not existing_content.endswith("\n"):
-        existing_content += "\n"
+    # Upsert: diff the existing section against the desired pattern set
+    desired = get_patterns_for_agents(agents)
+    if detected:
+        agents = list(dict.fromkeys(section.agents + agents))
+        desired = section.patterns + [p for p in desired if p not in section.patterns]
+    added = [p for p in desired if p not in section.patterns]
+    removed = [p for p in section.patterns if p not in desired]
     
-    new_content = existing_content + nexkit_section
+    if added or removed:
+        content = get_nexkit_section_content(agents, patterns=desired).lstrip("\n")
+        _replace_section(gitignore_path, section.start, section.end, content.encode("utf-8"))
     
-    # Atomic write using temporary file
-    temp_file = gitignore_path.with_name(gitignore_path.name + '.tmp')
-    try:
-        temp_file.write_text(new_content, encoding="utf-8")
-        temp_file.replace(gitignore_path)  # Atomic on POSIX and Windows
-    except PermissionError as e:
-        if temp_file.exists():
-            temp_file.unlink()
-        raise PermissionError(
-            f"Cannot write to .gitignore: {e}. Check file permissions."
+    tracked = get_tracked_nexkit_files(repo_path, repo=repo, patterns=desired)
+    if not (added or removed):
+        return ExclusionResult(
+            success=True,
+            message="Nexkit exclusions already configured",
+            gitignore_path=gitignore_path,
+            patterns_affected=[],
+            already_configured=True,
+            tracked_files=tracked,
+            git_root=git_root,
         )
-    except Exception as e:
-        if temp_file.exists():
-            temp_file.unlink()
-        raise OSError(f"Failed to update .gitignore: {e}")
-    
-    # Check for tracked files
-    tracked = get_tracked_nexkit_files(repo_path, agent_type)
-    
     return ExclusionResult(
         success=True,
-        message="Successfully added nexkit exclusions to .gitignore",
+        message="Updated nexkit exclusions in .gitignore",
         gitignore_path=gitignore_path,
-        patterns_affected=patterns_added,
-        already_configured=False,
+        patterns_affected=added,
+        already_configured=True,
         tracked_files=tracked,
         git_root=git_root,
+        patterns_removed=removed,
     )
 
 
-def remove_nexkit_exclusions(repo_path: Path) -> ExclusionResult:
+def remove_nexkit_exclusions(repo_path: Path, *, repo: Optional[GitRepo] = None) -> ExclusionResult:
     """
     Remove nexkit exclusion section from repository's .gitignore file.
     
     Args:
         repo_path: Path to repository (can be any path within repo)
+        repo: Already resolved repository (skips discovery)
     
     Returns:
         ExclusionResult with operation details
@@ -416,14 +895,8 @@ def remove_nexkit_exclusions(repo_path: Path) -> ExclusionResult:
         OSError: If file operation fails
     """
     # Validate git repository
-    if not is_git_repository(repo_path):
-        raise NotGitRepositoryError(
-            "Not a git repository. Initialize git first with: git init"
-        )
-    
-    git_root = get_git_root(repo_path)
-    if not git_root:
-        raise NotGitRepositoryError("Cannot determine git repository root")
+    repo = repo or open_repository(repo_path)
+    git_root = repo.root
     
     gitignore_path = git_root / ".gitignore"
     
@@ -451,53 +924,19 @@ def remove_nexkit_exclusions(repo_path: Path) -> ExclusionResult:
             git_root=git_root,
         )
     
-    # Read and process content
+    # Stream into a temporary file, skipping the section, then replace atomically
+    temp_file = gitignore_path.with_name(gitignore_path.name + ".tmp")
     try:
-        content = gitignore_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError as e:
-        raise OSError(f".gitignore file encoding issue: {e}")
-    
-    # Remove nexkit section
-    lines = content.split("\n")
-    new_lines = []
-    in_nexkit_section = False
-    
-    for line in lines:
-        if NEXKIT_SECTION_MARKER in line:
-            in_nexkit_section = True
-            continue
-        
-        if in_nexkit_section:
-            if NEXKIT_SECTION_END_MARKER in line:
-                in_nexkit_section = False
-                continue
-            # Skip lines within nexkit section
-            continue
-        
-        new_lines.append(line)
-    
-    # Remove trailing empty lines that might have been left
-    while new_lines and not new_lines[-1].strip():
-        new_lines.pop()
-    
-    new_content = "\n".join(new_lines)
-    if new_content:
-        new_content += "\n"  # Ensure file ends with newline
-    
-    # Atomic write using temporary file
-    temp_file = gitignore_path.with_suffix(".gitignore.tmp")
-    try:
-        temp_file.write_text(new_content, encoding="utf-8")
+        with open(gitignore_path, "rb") as source, open(temp_file, "wb") as target:
+            _copy_without_section(source, target)
         temp_file.replace(gitignore_path)  # Atomic on POSIX and Windows
     except PermissionError as e:
-        if temp_file.exists():
-            temp_file.unlink()
+        temp_file.unlink(missing_ok=True)
         raise PermissionError(
             f"Cannot write to .gitignore: {e}. Check file permissions."
         )
     except Exception as e:
-        if temp_file.exists():
-            temp_file.unlink()
+        temp_file.unlink(missing_ok=True)
         raise OSError(f"Failed to update .gitignore: {e}")
     
     return ExclusionResult(
@@ -511,13 +950,14 @@ def remove_nexkit_exclusions(repo_path: Path) -> ExclusionResult:
     )
 
 
-def check_exclusion_status(repo_path: Path, agent_type: Optional[str] = None) -> ExclusionStatus:
+def check_exclusion_status(repo_path: Path, agent_type: Union[str, Sequence[str], None] = None, *, repo: Optional[GitRepo] = None) -> ExclusionStatus:
     """
     Check current status of nexkit git exclusion.
     
     Args:
         repo_path: Path to repository
-        agent_type: Optional agent type for agent-specific pattern checking
+        agent_type: Optional agent type (or types); all detected agents if not specified
+        repo: Already resolved repository (skips discovery)
     
     Returns:
         ExclusionStatus with current state
@@ -525,30 +965,30 @@ def check_exclusion_status(repo_path: Path, agent_type: Optional[str] = None) ->
     Raises:
         NotGitRepositoryError: If not in a git repository
     """
-    if not is_git_repository(repo_path):
-        raise NotGitRepositoryError("Not a git repository")
-    
-    git_root = get_git_root(repo_path)
-    if not git_root:
-        raise NotGitRepositoryError("Cannot determine git repository root")
+    repo = repo or open_repository(repo_path)
+    git_root = repo.root
     
-    # Auto-detect agent if not specified
+    # Auto-detect agents if not specified
+    detected = detect_agents(git_root)
     if agent_type is None:
-        agent_type = detect_agent_from_project(git_root)
+        agent_type = [found.agent for found in detected]
+    agents = _agent_list(agent_type)
     
     gitignore_path = git_root / ".gitignore"
     has_gitignore = gitignore_path.exists()
-    is_excluded = has_nexkit_section(gitignore_path) if has_gitignore else False
+    try:
+        section = read_nexkit_section(gitignore_path) if has_gitignore else None
+    except OSError:
+        section = None
+    is_excluded = section is not None
     
-    # Determine missing patterns based on agent
-    missing_patterns = []
-    if not is_excluded:
-        missing_patterns = get_patterns_for_agent(agent_type)
+    # Determine missing patterns for every agent
+    missing_patterns = [p for p in get_patterns_for_agents(agents) if not section or p not in section.patterns]
     
     # Check tracked files
     tracked_files = []
     try:
-        tracked_files = get_tracked_nexkit_files(repo_path, agent_type)
+        tracked_files = get_tracked_nexkit_files(repo_path, agent_type, repo=repo)
     except Exception:
         pass  # If we can't check, just leave empty
     
@@ -560,9 +1000,158 @@ def check_exclusion_status(repo_path: Path, agent_type: Optional[str] = None) ->
         requires_cleanup=len(tracked_files) > 0,
         git_root=git_root,
         gitignore_path=gitignore_path if has_gitignore else None,
+        agents=detected,
+    )
+
+
+def verify_nexkit_exclusions(repo_path: Path, agent_type: Union[str, Sequence[str], None] = None, *, repo: Optional[GitRepo] = None) -> ExclusionVerification:
+    """
+    Check that every nexkit path in the working tree is actually ignored.
+    
+    The marker in .gitignore is not enough: a later negation, a nested
+    .gitignore, info/exclude or core.excludesFile can change the outcome.
+    The tree is walked once and each nexkit path is evaluated with the
+    same rules git applies; directories git ignores are not entered.
+    
+    Args:
+        repo_path: Path to repository
+        agent_type: Optional agent type (or types); all detected agents if not specified
+        repo: Already resolved repository (skips discovery)
+    
+    Returns:
+        ExclusionVerification listing ignored and not-ignored nexkit paths
+    
+    Raises:
+        NotGitRepositoryError: If not in a git repository
+    """
+    repo = repo or open_repository(repo_path)
+    if agent_type is None:
+        agent_type = [found.agent for found in detect_agents(repo.root)]
+    patterns = _nexkit_patterns(agent_type)
+    nexkit = re.compile("|".join(f"(?:{pattern_to_regex(p)})" for p in patterns), re.DOTALL)
+    matcher = IgnoreMatcher.for_repository(repo.root, repo.common_dir)
+    
+    ignored: List[Path] = []
+    not_ignored: List[Tuple[Path, Optional[str]]] = []
+    reincluded = {"": None}  # Directory -> negation that re-included it or a parent
+    pending = [""]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(repo.root / directory) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name == ".git":
+                continue
+            path = f"{directory}/{entry.name}" if directory else entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            # A directory matches a pattern if anything below it would
+            is_nexkit = nexkit.fullmatch(path + "/" if is_dir else path) is not None
+            is_ignored, rule = matcher.explain(path, is_dir)
+            if is_ignored:
+                if is_nexkit:
+                    ignored.append(Path(path))
+            elif is_dir:
+                # Nested repositories are not part of this working tree
+                if not os.path.lexists(os.path.join(entry.path, ".git")):
+                    reincluded[path] = rule if rule is not None and rule.negated else reincluded[directory]
+                    pending.append(path)
+            elif is_nexkit:
+                rule = rule or reincluded[directory]
+                not_ignored.append((Path(path), rule.describe(repo.root) if rule else None))
+    
+    try:
+        tracked_files = get_tracked_nexkit_files(repo.root, agent_type, repo=repo)
+    except GitIgnoreError:
+        tracked_files = []
+    
+    return ExclusionVerification(
+        git_root=repo.root,
+        patterns=patterns,
+        ignored=sorted(ignored),
+        not_ignored=sorted(not_ignored),
+        tracked_files=tracked_files,
     )
 
 
+def untrack_files(
+    repo_path: Path,
+    files: List[Path],
+    *,
+    repo: Optional[GitRepo] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Remove files from the git index, keeping the working tree copies.
+    
+    All paths are streamed NUL-separated to a single
+    ``git rm --cached --pathspec-from-file=- --pathspec-file-nul``, so the
+    number of files is not limited by the command line length. Paths are
+    taken literally (no glob expansion).
+    
+    Args:
+        repo_path: Path to repository (any path within repo)
+        files: Paths relative to the repository root
+        repo: Already resolved repository (skips discovery)
+        on_progress: Optional callback receiving (untracked, total) as git
+            reports each removed file
+    
+    Returns:
+        Number of files removed from the index
+    
+    Raises:
+        NotGitRepositoryError: If not in a git repository
+        GitNotInstalledError: If git is not available
+        GitIgnoreError: If git fails (nothing is removed in that case)
+    """
+    repo = repo or open_repository(repo_path)
+    if not files:
+        return 0
+    
+    with _git_slot():
+        try:
+            process = subprocess.Popen(
+                ["git", "--literal-pathspecs", "rm", "--cached", "-r",
+                 "--pathspec-from-file=-", "--pathspec-file-nul"],
+                cwd=repo.root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # One pipe: a burst of warnings on a separate stderr pipe
+                # could fill it while we block reading stdout
+                stderr=subprocess.STDOUT,
+            )
+        except FileNotFoundError:
+            raise GitNotInstalledError("Git is not installed or not in PATH")
+        
+        # git reads every pathspec before it starts removing, so writing all
+        # of stdin first cannot deadlock against its output
+        with process:
+            try:
+                process.stdin.write(b"".join(os.fsencode(f.as_posix()) + b"\0" for f in files))
+                process.stdin.close()
+            except BrokenPipeError:
+                # git exited before reading every path (locked index, bad
+                # pathspec, too old for --pathspec-from-file); report its output
+                with contextlib.suppress(BrokenPipeError):
+                    process.stdin.close()
+            removed = 0
+            messages = []
+            for line in process.stdout:
+                if line.startswith(b"rm '"):
+                    removed += 1
+                    if on_progress:
+                        on_progress(removed, len(files))
+                else:
+                    messages.append(line)
+            error = b"".join(messages[-20:]).decode("utf-8", errors="replace").strip()
+    
+    if process.returncode != 0:
+        raise GitIgnoreError(f"git rm --cached failed: {error or f'exit status {process.returncode}'}")
+    return removed
+
+
 def format_cleanup_guidance(tracked_files: List[Path], git_root: Path) -> str:
     """
     Generate user-friendly instructions for removing tracked files.
@@ -585,19 +1174,25 @@ def format_cleanup_guidance(tracked_files: List[Path], git_root: Path) -> str:
         "",
     ]
     
-    # Show first 10 files
-    for file in tracked_files[:10]:
+    # Show a bounded sample; the full list can run to thousands of files
+    for file in tracked_files[:GUIDANCE_SAMPLE_SIZE]:
         lines.append(f"  • {file}")
     
-    if len(tracked_files) > 10:
-        lines.append(f"  ... and {len(tracked_files) - 10} more")
+    if len(tracked_files) > GUIDANCE_SAMPLE_SIZE:
+        lines.append(f"  ... and {len(tracked_files) - GUIDANCE_SAMPLE_SIZE} more")
     
     lines.extend([
         "",
         "[cyan]To remove these files from git tracking:[/cyan]",
         "",
         "  1. Run this command to untrack files (keeps local copies):",
-        f"     [white]git rm --cached {' '.join(str(f) for f in tracked_files)}[/white]",
+        "     [white]nexkit add-exclusion --untrack[/white]",
+    ])
+    if len(tracked_files) <= GUIDANCE_SAMPLE_SIZE:
+        lines.append(f"     [dim]or:[/dim] [white]git rm --cached {' '.join(str(f) for f in tracked_files)}[/white]")
+    else:
+        lines.append("     [dim]or feed the paths NUL-separated to:[/dim] [white]git rm --cached --pathspec-from-file=- --pathspec-file-nul[/white]")
+    lines.extend([
         "",
         "  2. Commit the change:",
         "     [white]git commit -m \"Stop tracking nexkit files\"[/white]",
@@ -0,0 +1,139 @@
+"""
+Read-only parser for the git index (``.git/index``).
+
+Lists tracked paths matching a regular expression without starting git.
+The index is memory-mapped and entry headers are walked with ``struct``;
+a path is only turned into a Python string when it matches, so scanning a
+large index costs little more than the regex matches themselves.
+
+Supported: index versions 2, 3 and 4 (with v4 path prefix compression),
+SHA-1 and SHA-256 repositories. Split indexes (``link`` extension) and
+sparse indexes (``sdir`` extension) raise UnsupportedIndexError so callers
+can fall back to ``git ls-files``.
+
+Format reference: https://git-scm.com/docs/index-format
+"""
+
+import mmap
+import os
+import re
+import struct
+from pathlib import Path
+from typing import List
+
+
+# Constants
+INDEX_SIGNATURE = b"DIRC"
+SUPPORTED_VERSIONS = (2, 3, 4)
+# Extensions this reader cannot interpret correctly
+UNSUPPORTED_EXTENSIONS = {b"link": "split index", b"sdir": "sparse index"}
+
+# ctime, mtime (sec + nsec each), dev, ino, mode, uid, gid, size
+_STAT_SIZE = 40
+_FLAG_EXTENDED = 0x4000
+_NAME_MASK = 0x0FFF
+
+_HEADER = struct.Struct(">4sII")
+_FLAGS = struct.Struct(">H")
+_EXTENSION = struct.Struct(">4sI")
+
+
+# Exceptions
+class UnsupportedIndexError(Exception):
+    """Raised when the index uses a format or extension this reader does not handle."""
+    pass
+
+
+# Core Functions
+def _read_varint(buf, pos: int):
+    """Decode git's offset varint (as used by OFS_DELTA and index v4) at pos."""
+    byte = buf[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = buf[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _check_extensions(buf, pos: int, hash_size: int) -> None:
+    """Walk the extension headers after the entries, rejecting unsupported ones."""
+    end = len(buf) - hash_size
+    while pos + _EXTENSION.size <= end:
+        signature, size = _EXTENSION.unpack_from(buf, pos)
+        if signature in UNSUPPORTED_EXTENSIONS:
+            raise UnsupportedIndexError(f"{UNSUPPORTED_EXTENSIONS[signature]} is not supported")
+        pos += _EXTENSION.size + size
+
+
+def read_matching_paths(index_path: Path, pattern: "re.Pattern[bytes]", *, hash_size: int = 20) -> List[str]:
+    """
+    Return the tracked paths in an index that match pattern.
+
+    Args:
+        index_path: Path to the index file (a missing file means nothing is tracked)
+        pattern: Compiled bytes regex, matched against each full repo-relative
+            path with ``fullmatch``
+        hash_size: Object id size in bytes (20 for SHA-1, 32 for SHA-256)
+
+    Returns:
+        Matching paths in index order, decoded with the filesystem encoding
+
+    Raises:
+        UnsupportedIndexError: If the index version or an extension is not supported
+        OSError: If the index cannot be read
+    """
+    try:
+        f = open(index_path, "rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _scan(buf, pattern, hash_size)
+
+
+def _scan(buf, pattern: "re.Pattern[bytes]", hash_size: int) -> List[str]:
+    if len(buf) < _HEADER.size:
+        raise UnsupportedIndexError("index file is truncated")
+    signature, version, count = _HEADER.unpack_from(buf, 0)
+    if signature != INDEX_SIGNATURE:
+        raise UnsupportedIndexError("not a git index file")
+    if version not in SUPPORTED_VERSIONS:
+        raise UnsupportedIndexError(f"index version {version} is not supported")
+
+    fullmatch = pattern.fullmatch
+    flags_offset = _STAT_SIZE + hash_size
+    matches: List[str] = []
+    pos = _HEADER.size
+
+    if version == 4:
+        previous = bytearray()
+        for _ in range(count):
+            (flags,) = _FLAGS.unpack_from(buf, pos + flags_offset)
+            name_pos = pos + flags_offset + _FLAGS.size + (2 if flags & _FLAG_EXTENDED else 0)
+            strip, name_pos = _read_varint(buf, name_pos)
+            name_end = buf.find(b"\0", name_pos)
+            # Prefix compression: drop `strip` bytes from the previous path, append the suffix
+            del previous[len(previous) - strip:]
+            previous += buf[name_pos:name_end]
+            if fullmatch(previous):
+                matches.append(os.fsdecode(bytes(previous)))
+            pos = name_end + 1
+    else:
+        for _ in range(count):
+            (flags,) = _FLAGS.unpack_from(buf, pos + flags_offset)
+            name_pos = pos + flags_offset + _FLAGS.size
+            if flags & _FLAG_EXTENDED:
+                name_pos += 2
+            name_length = flags & _NAME_MASK
+            name_end = name_pos + name_length if name_length < _NAME_MASK else buf.find(b"\0", name_pos)
+            if fullmatch(buf, name_pos, name_end):
+                matches.append(os.fsdecode(buf[name_pos:name_end]))
+            # Entries are NUL-padded to a multiple of 8 bytes
+            pos += (name_end - pos + 8) & ~7
+
+    _check_extensions(buf, pos, hash_size)
+    return matches
@@ -0,0 +1,230 @@
+"""
+Git hook management for nexkit.
+
+``nexkit hook install`` writes a pre-commit hook that rejects staged files
+under the nexkit exclusion paths (``BASE_PATTERNS`` and every agent in
+``AGENT_MODE_PATTERNS``). The hook is a small shell script that runs
+``precommit.py`` by path on the output of ``git diff --cached``, so a
+commit pays for a bare interpreter start and one ``git diff``, not for
+loading the CLI. An existing pre-commit hook is kept and run first. If the
+interpreter or ``precommit.py`` recorded in the hook no longer exists
+(nexkit uninstalled or moved to another environment), the guard prints a
+warning and lets the commit through.
+
+The patterns are translated into ``prefix:``/``contains:``/``exact:``/
+``suffix:`` rules that the guard checks with plain byte-string operations
+(see ``precommit.py``), so it does not even need to import ``re``.
+"""
+
+import os
+import shlex
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .gitignore import AGENT_MODE_PATTERNS, BASE_PATTERNS, GitRepo, open_repository, pattern_to_regex
+
+
+# Constants
+HOOK_NAME = "pre-commit"
+HOOK_MARKER = "# nexkit pre-commit guard"
+# An existing hook is moved here and run before the guard
+CHAINED_HOOK_NAME = "pre-commit.nexkit-chained"
+GUARD_SCRIPT = Path(__file__).with_name("precommit.py")
+
+_GLOB_CHARS = frozenset("*?[\\")
+
+_HOOK_TEMPLATE = """#!/bin/sh
+{marker} - installed by `nexkit hook install`, remove with `nexkit hook uninstall`
+# Rejects staged files under the nexkit exclusion paths.
+chained="${{0%/*}}/{chained}"
+if [ -x "$chained" ]; then
+    "$chained" "$@" || exit $?
+fi
+python={python}
+script={script}
+# nexkit was uninstalled or moved: do not block every commit
+if [ ! -x "$python" ] || [ ! -f "$script" ]; then
+    echo "nexkit hook: $python or $script not found, skipping (run 'nexkit hook install' to refresh)" >&2
+    exit 0
+fi
+git diff --cached --name-only -z --no-renames --diff-filter=d |
+    "$python" -I -S "$script" {rules}
+"""
+
+
+# Exceptions
+class HookError(Exception):
+    """Raised when a git hook cannot be installed or removed."""
+    pass
+
+
+# Data Classes
+@dataclass
+class HookResult:
+    """Outcome of installing or removing the pre-commit guard."""
+    hook_path: Path
+    changed: bool                       # False if the hook was already in the requested state
+    chained_hook: Optional[Path] = None  # Pre-existing hook run before the guard
+
+
+# Core Functions
+def guard_patterns() -> List[str]:
+    """Return every pattern the guard enforces: base patterns plus all agents'."""
+    patterns = BASE_PATTERNS.copy()
+    for agent_patterns in AGENT_MODE_PATTERNS.values():
+        patterns.extend(p for p in agent_patterns if p not in patterns)
+    return patterns
+
+
+def _has_glob(text: str) -> bool:
+    return any(c in _GLOB_CHARS for c in text)
+
+
+def compile_guard_rules(patterns: Optional[List[str]] = None) -> List[str]:
+    """
+    Translate .gitignore patterns into guard rules.
+    
+    Each rule set matches exactly the paths pattern_to_regex matches (the
+    named path and everything below it). Literal names and names ending
+    in a single ``*`` become string tests; anything else falls back to a
+    ``regex:`` rule.
+    
+    Args:
+        patterns: Patterns to enforce (defaults to guard_patterns())
+    
+    Returns:
+        Rule arguments for precommit.py, without duplicates
+    """
+    rules: List[str] = []
+    for pattern in patterns or guard_patterns():
+        directory_only = pattern.endswith("/")
+        body = pattern.rstrip("/")
+        anchored = "/" in body
+        body = body.lstrip("/")
+        if not _has_glob(body):
+            new = [f"prefix:{body}/"] if directory_only else [f"exact:{body}", f"prefix:{body}/"]
+            if not anchored:
+                new += [f"contains:/{body}/"] if directory_only else [f"suffix:/{body}", f"contains:/{body}/"]
+        elif not directory_only and body.endswith("*") and not _has_glob(body[:-1]):
+            # "stem*" also matches everything below, so any path starting with the stem
+            stem = body[:-1]
+            new = [f"prefix:{stem}"] if anchored else [f"prefix:{stem}", f"contains:/{stem}"]
+        else:
+            new = [f"regex:{pattern_to_regex(pattern)}"]
+        rules.extend(rule for rule in new if rule not in rules)
+    return rules
+
+
+def render_hook(python: Optional[str] = None, script: Optional[Path] = None, patterns: Optional[List[str]] = None) -> str:
+    """Return the pre-commit hook script."""
+    return _HOOK_TEMPLATE.format(
+        marker=HOOK_MARKER,
+        chained=CHAINED_HOOK_NAME,
+        python=shlex.quote(python or sys.executable),
+        script=shlex.quote(str(script or GUARD_SCRIPT)),
+        rules=" ".join(shlex.quote(rule) for rule in compile_guard_rules(patterns)),
+    )
+
+
+def get_hooks_dir(repo: GitRepo) -> Path:
+    """Return the hooks directory, honouring ``core.hooksPath``."""
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", "core.hooksPath"],
+            cwd=repo.root,
+            capture_output=True,
+            text=True,
+        )
+        hooks_path = result.stdout.strip() if result.returncode == 0 else ""
+    except FileNotFoundError:
+        hooks_path = ""
+    if hooks_path:
+        return repo.root / Path(hooks_path).expanduser()
+    return repo.common_dir / "hooks"
+
+
+def _is_guard(hook: Path) -> bool:
+    try:
+        with open(hook, "r", encoding="utf-8", errors="replace") as f:
+            return HOOK_MARKER in f.read(512)
+    except OSError:
+        return False
+
+
+def install_precommit_hook(repo_path: Path, *, repo: Optional[GitRepo] = None) -> HookResult:
+    """
+    Install (or refresh) the nexkit pre-commit guard.
+
+    Args:
+        repo_path: Path to repository (any path within repo)
+        repo: Already resolved repository (skips discovery)
+
+    Returns:
+        HookResult; changed is False if the identical hook was already installed
+
+    Raises:
+        NotGitRepositoryError: If not in a git repository
+        HookError: If the hook cannot be written
+    """
+    repo = repo or open_repository(repo_path)
+    hooks_dir = get_hooks_dir(repo)
+    hook = hooks_dir / HOOK_NAME
+    chained = hooks_dir / CHAINED_HOOK_NAME
+    content = render_hook()
+
+    try:
+        if hook.exists() and not _is_guard(hook):
+            if chained.exists():
+                raise HookError(f"Both {hook} and {chained} exist; remove one of them first")
+            hook.rename(chained)
+        elif hook.exists() and hook.read_text(encoding="utf-8") == content:
+            return HookResult(hook, changed=False, chained_hook=chained if chained.exists() else None)
+
+        hooks_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = hook.with_name(hook.name + ".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8", newline="\n") as f:
+                f.write(content)
+            os.chmod(temp_file, 0o755)
+            temp_file.replace(hook)
+        finally:
+            temp_file.unlink(missing_ok=True)
+    except OSError as e:
+        raise HookError(f"Failed to install {hook}: {e}")
+
+    return HookResult(hook, changed=True, chained_hook=chained if chained.exists() else None)
+
+
+def uninstall_precommit_hook(repo_path: Path, *, repo: Optional[GitRepo] = None) -> HookResult:
+    """
+    Remove the nexkit pre-commit guard, restoring a hook it had chained.
+
+    Args:
+        repo_path: Path to repository (any path within repo)
+        repo: Already resolved repository (skips discovery)
+
+    Returns:
+        HookResult; changed is False if the guard was not installed
+
+    Raises:
+        NotGitRepositoryError: If not in a git repository
+        HookError: If the hook cannot be removed
+    """
+    repo = repo or open_repository(repo_path)
+    hooks_dir = get_hooks_dir(repo)
+    hook = hooks_dir / HOOK_NAME
+    chained = hooks_dir / CHAINED_HOOK_NAME
+
+    if not _is_guard(hook):
+        return HookResult(hook, changed=False)
+    try:
+        if chained.exists():
+            chained.replace(hook)
+            return HookResult(hook, changed=True, chained_hook=hook)
+        hook.unlink()
+    except OSError as e:
+        raise HookError(f"Failed to remove {hook}: {e}")
+    return HookResult(hook, changed=True)
@@ -0,0 +1,261 @@
+"""
+VS Code MCP configuration index for nexkit.
+
+The project (``.vscode/mcp.json``) and user-level ``mcp.json`` files are
+parsed at most once per process and re-read only when their modification
+time or size changes. Each parsed file carries a token -> server lookup
+built from the server ``args``, so checking whether a server is configured
+is a dictionary lookup rather than a scan of every server's arguments.
+Missing servers are added with one read-modify-write per file.
+"""
+
+import copy
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Constants
+# Characters that separate words inside a server argument
+_ARG_SEPARATORS = re.compile(r"[\s=,:]+")
+# Characters that separate name segments inside a package name
+_NAME_SEPARATORS = re.compile(r"[-_.]")
+# Re-merge attempts when the file changes between our read and our replace
+WRITE_ATTEMPTS = 3
+
+
+# Exceptions
+class McpConfigError(Exception):
+    """Raised when an mcp.json file cannot be parsed or safely updated."""
+    pass
+
+
+# Data Classes
+@dataclass
+class McpConfig:
+    """Parsed view of one mcp.json file."""
+    path: Path
+    signature: Optional[Tuple[int, int]]  # (mtime_ns, size), None if missing
+    data: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    tokens: Dict[str, str] = field(default_factory=dict)  # token -> server name
+
+    @property
+    def exists(self) -> bool:
+        return self.signature is not None
+
+    @property
+    def servers(self) -> dict:
+        servers = self.data.get("servers", {})
+        return servers if isinstance(servers, dict) else {}
+
+    def find_server(self, tokens: Iterable[str]) -> Optional[str]:
+        """Return the name of the first server whose args contain one of tokens."""
+        for token in tokens:
+            server = self.tokens.get(token.lower()) if token else None
+            if server is not None:
+                return server
+        return None
+
+    def editable_data(self) -> dict:
+        """Return a deep copy of the file contents with inputs/servers present."""
+        if self.error:
+            raise McpConfigError(self.error)
+        data = copy.deepcopy(self.data) if isinstance(self.data, dict) else {}
+        data.setdefault("inputs", [])
+        data.setdefault("servers", {})
+        return data
+
+
+@dataclass
+class McpServerPlan:
+    """A server entry (and the inputs it references) to write to one mcp.json."""
+    key: str
+    entry: dict
+    path: Path
+    inputs: List[dict] = field(default_factory=list)
+
+
+_CONFIGS: Dict[Path, McpConfig] = {}
+
+
+# Paths
+def get_project_mcp_path(project_dir: Optional[Path] = None) -> Path:
+    """Return the project-level mcp.json path (``.vscode/mcp.json``)."""
+    return (project_dir or Path.cwd()) / ".vscode" / "mcp.json"
+
+
+def get_user_mcp_path() -> Path:
+    """Return the VS Code user-level mcp.json path."""
+    appdata = os.getenv("APPDATA")
+    if appdata:
+        return Path(appdata) / "Code" / "User" / "mcp.json"
+    # Fallback for non-Windows: use standard VS Code user settings location
+    return Path.home() / ".config" / "Code" / "User" / "mcp.json"
+
+
+# Core Functions
+def arg_tokens(arg: str) -> List[str]:
+    """
+    Return the lookup tokens for one server argument.
+
+    An argument such as ``@upstash/context7-mcp@latest`` yields the full
+    word, the word without its version, each ``/`` part without a leading
+    ``@`` and every contiguous run of its ``-``/``_``/``.`` separated
+    segments (``context7``, ``mcp``, ``context7-mcp``, ...).
+    """
+    tokens = []
+    for word in _ARG_SEPARATORS.split(str(arg).lower()):
+        if not word:
+            continue
+        tokens.append(word)
+        at = word.rfind("@")
+        if at > 0:
+            word = word[:at]
+            tokens.append(word)
+        for part in word.split("/"):
+            part = part.lstrip("@")
+            if not part:
+                continue
+            pieces = _NAME_SEPARATORS.split(part)
+            seps = _NAME_SEPARATORS.findall(part)
+            for start in range(len(pieces)):
+                run = pieces[start]
+                tokens.append(run)
+                for end in range(start + 1, len(pieces)):
+                    run += seps[end - 1] + pieces[end]
+                    tokens.append(run)
+    return tokens
+
+
+def _build_token_index(servers: dict) -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for name, value in servers.items():
+        args = value.get("args", []) if isinstance(value, dict) else []
+        for arg in args if isinstance(args, list) else []:
+            for token in arg_tokens(arg):
+                index.setdefault(token, name)
+    return index
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_mcp_config(path: Path) -> McpConfig:
+    """
+    Return the parsed mcp.json at path, reusing the cached parse if unchanged.
+
+    Args:
+        path: mcp.json file (need not exist)
+
+    Returns:
+        McpConfig; a missing file is an empty config and a malformed one
+        has ``error`` set and no servers
+    """
+    signature = _signature(path)
+    cached = _CONFIGS.get(path)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    config = McpConfig(path=path, signature=signature)
+    if signature is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            config.data = data if isinstance(data, dict) else {}
+        except Exception as e:
+            config.error = str(e)
+        config.tokens = _build_token_index(config.servers)
+    _CONFIGS[path] = config
+    return config
+
+
+def invalidate(path: Optional[Path] = None) -> None:
+    """Drop the cached parse for path (or all paths)."""
+    if path is None:
+        _CONFIGS.clear()
+    else:
+        _CONFIGS.pop(path, None)
+
+
+def find_configured_server(tokens: Iterable[str], project_dir: Optional[Path] = None) -> Optional[str]:
+    """
+    Look up a server by tokens in the project, then the user mcp.json.
+
+    Returns:
+        "project" or "user" for the first config that has a matching server,
+        otherwise None
+    """
+    tokens = list(tokens)
+    if load_mcp_config(get_project_mcp_path(project_dir)).find_server(tokens):
+        return "project"
+    if load_mcp_config(get_user_mcp_path()).find_server(tokens):
+        return "user"
+    return None
+
+
+def _merge_plans(data: dict, plans: List[McpServerPlan]) -> None:
+    """Apply server entries and add any missing inputs to data, in place."""
+    input_ids = {inp.get("id") for inp in data["inputs"] if isinstance(inp, dict)}
+    for plan in plans:
+        for inp in plan.inputs:
+            if inp.get("id") not in input_ids:
+                data["inputs"].append(inp)
+                input_ids.add(inp.get("id"))
+        # Use the provided key as the key in the JSON (keep existing casing)
+        data["servers"][plan.key] = plan.entry
+
+
+def write_mcp_servers(path: Path, plans: List[McpServerPlan]) -> Path:
+    """
+    Add several servers to one mcp.json in a single transaction.
+
+    The file is read once, all entries are merged, the original is backed up
+    once to ``mcp.bak`` and the result is written to a temporary file that
+    atomically replaces the original. If another program (e.g. VS Code)
+    changes the file while we merge, the merge is redone against its new
+    contents so no concurrent edit is lost.
+
+    Args:
+        path: mcp.json to update (created if missing)
+        plans: Server entries to add or replace
+
+    Returns:
+        Path of the written file
+
+    Raises:
+        McpConfigError: If the existing file cannot be parsed or keeps
+            changing under us
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    backed_up = False
+    try:
+        for _ in range(WRITE_ATTEMPTS):
+            config = load_mcp_config(path)
+            data = config.editable_data()
+            _merge_plans(data, plans)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+
+            if _signature(path) != config.signature:
+                continue  # Changed while merging: start over from the new contents
+            if config.exists and not backed_up:
+                shutil.copy2(path, path.with_suffix(".bak"))
+                backed_up = True
+            os.replace(temp_file, path)
+            return path
+        raise McpConfigError(f"{path} kept changing while it was being updated")
+    finally:
+        temp_file.unlink(missing_ok=True)
+        invalidate(path)
@@ -0,0 +1,334 @@
+"""
+Network and TLS setup for nexkit.
+
+The TLS context (backed by the OS trust store via ``truststore``) and the
+``httpx`` client are expensive to import and build, so they live here and are
+only created on first use by commands that actually talk to GitHub. The
+module also provides resumable (HTTP Range) downloads of release assets.
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import httpx
+import truststore
+
+from .cache import _acquire_lock
+
+
+@lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide TLS context backed by the system trust store."""
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+def create_client(verify: bool = True) -> httpx.Client:
+    """Create an httpx client, optionally disabling TLS verification."""
+    return httpx.Client(verify=get_ssl_context() if verify else False)
+
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+# Resumable downloads
+DOWNLOAD_ATTEMPTS = 3
+# In-memory downloads spill to the temp directory above this size
+SPOOL_MAX_MEMORY = 16 * 1024 * 1024
+
+
+class IncompleteDownloadError(Exception):
+    """Raised when a response body ends before the expected size."""
+    pass
+
+
+def _read_sidecar(sidecar: Path) -> dict:
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_sidecar(sidecar: Path, data: dict) -> None:
+    temp_file = sidecar.with_name(sidecar.name + ".tmp")
+    temp_file.write_text(json.dumps(data), encoding="utf-8")
+    temp_file.replace(sidecar)
+
+
+def _range_validator(headers: httpx.Headers) -> Optional[str]:
+    """Return a validator usable in If-Range (strong ETag, else Last-Modified)."""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("last-modified")
+
+
+def _request_headers(headers: Optional[dict]) -> dict:
+    """Return download request headers asking for the body exactly as stored.
+
+    Content-Length, Range offsets and Content-Range all count bytes of the
+    encoded body, so downloads must not be content-encoded.
+    """
+    request_headers = dict(headers or {})
+    request_headers["Accept-Encoding"] = "identity"
+    return request_headers
+
+
+def _is_encoded(response: httpx.Response) -> bool:
+    """Return True when the server content-encoded the body despite ``identity``."""
+    return response.headers.get("content-encoding", "identity").strip().lower() not in ("", "identity")
+
+
+def _body_chunks(response: httpx.Response):
+    """Iterate over the body as sent, or decoded if the server encoded it anyway.
+
+    No chunk_size: a re-chunking buffer would lose the bytes received just
+    before a dropped connection.
+    """
+    if _is_encoded(response):
+        return response.iter_bytes()
+    return response.iter_raw()
+
+
+def _content_range_start(headers: httpx.Headers) -> Optional[int]:
+    """Return the first byte position of a ``Content-Range: bytes START-END/TOTAL`` header."""
+    value = headers.get("content-range", "")
+    unit, _, byte_range = value.partition(" ")
+    start, dash, _ = byte_range.partition("-")
+    if unit.strip().lower() != "bytes" or not dash or not start.strip().isdigit():
+        return None
+    return int(start)
+
+
+def download_resumable(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
+    *,
+    headers: Optional[dict] = None,
+    attempts: int = DOWNLOAD_ATTEMPTS,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    keep_partial: bool = True,
+) -> Path:
+    """
+    Download a URL to ``dest``, resuming interrupted transfers.
+
+    Bytes are written to ``<dest>.part``. A sidecar ``<dest>.part.json``
+    records the URL, expected size and validator (strong ETag or
+    Last-Modified) so that a later attempt - in this process or a future
+    run - continues with ``Range: bytes=N-`` and ``If-Range``. A server that
+    ignores the range (200 instead of 206), answers 206 for a different
+    offset, or serves a changed resource restarts the download from byte
+    zero. The body is requested with ``Accept-Encoding: identity`` and
+    counted as raw bytes, so sizes and offsets match the stored file.
+
+    If another process holds the ``.part`` lock, the download goes to a
+    process-private file instead and is not resumable.
+
+    Args:
+        client: HTTP client to use
+        url: URL to download
+        dest: Final path of the downloaded file
+        headers: Extra request headers (e.g. authorization)
+        attempts: Number of attempts before giving up
+        on_progress: Callback receiving (bytes downloaded, total bytes or 0)
+        keep_partial: Keep the ``.part`` file after the last failed attempt
+            so a future run can resume
+
+    Returns:
+        Path of the completed download (``dest`` unless another process
+        was downloading the same file)
+
+    Raises:
+        RuntimeError: If the server answers with an error status or all
+            attempts fail
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    lock = dest.with_name(dest.name + ".part.lock")
+    locked = _acquire_lock(lock)
+    if not locked:
+        dest = dest.with_name(f"{dest.name}.{os.getpid()}")
+    part = dest.with_name(dest.name + ".part")
+    sidecar = dest.with_name(dest.name + ".part.json")
+
+    try:
+        last_error: Optional[Exception] = None
+        for _ in range(max(1, attempts)):
+            state = _read_sidecar(sidecar)
+            offset = part.stat().st_size if part.exists() else 0
+            request_headers = _request_headers(headers)
+            if offset and state.get("url") == url and state.get("validator"):
+                request_headers["Range"] = f"bytes={offset}-"
+                request_headers["If-Range"] = state["validator"]
+            else:
+                offset = 0
+
+            try:
+                with client.stream("GET", url, timeout=60, follow_redirects=True, headers=request_headers) as response:
+                    if response.status_code == 416 and offset:
+                        # Our partial file is unusable (e.g. resource shrank): start over
+                        part.unlink(missing_ok=True)
+                        sidecar.unlink(missing_ok=True)
+                        last_error = RuntimeError("Server rejected resume range")
+                        continue
+                    if response.status_code == 206 and offset:
+                        if _content_range_start(response.headers) != offset or _is_encoded(response):
+                            # Not the continuation of our partial file: start over
+                            part.unlink(missing_ok=True)
+                            sidecar.unlink(missing_ok=True)
+                            last_error = RuntimeError(f"Server resumed at {response.headers.get('content-range')!r}, expected byte {offset}")
+                            continue
+                        mode = "ab"
+                        total = int(state.get("size") or 0)
+                    elif response.status_code == 200:
+                        # Full body: either a fresh download or the server ignored the range
+                        offset = 0
+                        mode = "wb"
+                        encoded = _is_encoded(response)
+                        # Content-Length counts encoded bytes; a decoded body cannot be checked or resumed
+                        total = 0 if encoded else int(response.headers.get("content-length", 0))
+                        _write_sidecar(sidecar, {
+                            "url": url,
+                            "size": total,
+                            "validator": None if encoded else _range_validator(response.headers),
+                        })
+                    else:
+                        body_sample = response.read()[:400]
+                        raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample!r}")
+
+                    downloaded = offset
+                    with open(part, mode) as f:
+                        for chunk in _body_chunks(response):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if on_progress:
+                                on_progress(downloaded, total)
+
+                if total and downloaded != total:
+                    raise IncompleteDownloadError(f"Received {downloaded:,} of {total:,} bytes")
+            except (httpx.TransportError, IncompleteDownloadError) as e:
+                # Keep the .part file and sidecar so the next attempt can resume
+                last_error = e
+                continue
+
+            part.replace(dest)
+            sidecar.unlink(missing_ok=True)
+            return dest
+
+        raise RuntimeError(f"Download failed after {attempts} attempt(s): {last_error}")
+    except BaseException:
+        # A process-private download can never be resumed by another run
+        if not (locked and keep_partial):
+            part.unlink(missing_ok=True)
+            sidecar.unlink(missing_ok=True)
+        raise
+    finally:
+        if locked:
+            lock.unlink(missing_ok=True)
+
+
+def download_to_spool(
+    client: httpx.Client,
+    url: str,
+    *,
+    headers: Optional[dict] = None,
+    attempts: int = DOWNLOAD_ATTEMPTS,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    max_memory: int = SPOOL_MAX_MEMORY,
+) -> Tuple[tempfile.SpooledTemporaryFile, str]:
+    """
+    Download a URL into a spooled temporary file, hashing it on the way in.
+
+    The body stays in memory up to ``max_memory`` bytes and spills to the
+    system temp directory beyond that, so nothing is written next to the
+    caller. Dropped connections are resumed with ``Range`` / ``If-Range``
+    from the bytes already buffered. As with ``download_resumable``, the
+    body is requested with ``Accept-Encoding: identity`` and buffered as
+    raw bytes.
+
+    Args:
+        client: HTTP client to use
+        url: URL to download
+        headers: Extra request headers (e.g. authorization)
+        attempts: Number of attempts before giving up
+        on_progress: Callback receiving (bytes downloaded, total bytes or 0)
+        max_memory: Size above which the buffer spills to disk
+
+    Returns:
+        Tuple of (buffer positioned at offset 0, SHA-256 hex digest). The
+        caller owns the buffer and must close it.
+
+    Raises:
+        RuntimeError: If the server answers with an error status or all
+            attempts fail
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    digest = hashlib.sha256()
+    validator: Optional[str] = None
+    total = 0
+    last_error: Optional[Exception] = None
+    try:
+        for _ in range(max(1, attempts)):
+            offset = spool.tell()
+            request_headers = _request_headers(headers)
+            if offset and validator:
+                request_headers["Range"] = f"bytes={offset}-"
+                request_headers["If-Range"] = validator
+            try:
+                with client.stream("GET", url, timeout=60, follow_redirects=True, headers=request_headers) as response:
+                    if response.status_code == 200:
+                        # Full body: either the first request or the server ignored the range
+                        spool.seek(0)
+                        spool.truncate()
+                        digest = hashlib.sha256()
+                        encoded = _is_encoded(response)
+                        # Content-Length counts encoded bytes; a decoded body cannot be checked or resumed
+                        total = 0 if encoded else int(response.headers.get("content-length", 0))
+                        validator = None if encoded else _range_validator(response.headers)
+                    elif response.status_code == 206 and offset:
+                        if _content_range_start(response.headers) != offset or _is_encoded(response):
+                            # Not the continuation of our buffer: start over
+                            spool.seek(0)
+                            spool.truncate()
+                            digest = hashlib.sha256()
+                            validator = None
+                            last_error = RuntimeError(f"Server resumed at {response.headers.get('content-range')!r}, expected byte {offset}")
+                            continue
+                    else:
+                        body_sample = response.read()[:400]
+                        raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample!r}")
+
+                    for chunk in _body_chunks(response):
+                        spool.write(chunk)
+                        digest.update(chunk)
+                        if on_progress:
+                            on_progress(spool.tell(), total)
+
+                if total and spool.tell() != total:
+                    raise IncompleteDownloadError(f"Received {spool.tell():,} of {total:,} bytes")
+            except (httpx.TransportError, IncompleteDownloadError) as e:
+                last_error = e
+                continue
+
+            spool.seek(0)
+            return spool, digest.hexdigest()
+
+        raise RuntimeError(f"Download failed after {attempts} attempt(s): {last_error}")
+    except BaseException:
+        spool.close()
+        raise
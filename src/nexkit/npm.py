@@ -0,0 +1,146 @@
+"""
+Offline npm package resolution for MCP server checks.
+
+Answers "is this npm package available locally?" from files on disk only:
+the global ``node_modules`` under the npm prefix, the ``_npx`` install cache
+and the npm content cache index. No subprocess is started and nothing is
+fetched from the registry.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# Constants
+DEFAULT_REGISTRY = "https://registry.npmjs.org/"
+# cacache key prefix used by npm's HTTP cache (make-fetch-happen)
+CACACHE_KEY_PREFIX = "make-fetch-happen:request-cache:"
+
+_ENV_VAR = re.compile(r"\$\{([^}]+)\}")
+
+
+# npm configuration
+def _parse_npmrc(path: Path) -> Dict[str, str]:
+    """Parse the key=value lines of an .npmrc file (missing files are empty)."""
+    config: Dict[str, str] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return config
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in "#;" or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        value = _ENV_VAR.sub(lambda m: os.environ.get(m.group(1), ""), value.strip().strip('"'))
+        config[key.strip().lower()] = value
+    return config
+
+
+@lru_cache(maxsize=None)
+def _npm_config() -> Dict[str, str]:
+    """Return npm settings relevant to resolution, with the environment taking precedence."""
+    userconfig = os.environ.get("npm_config_userconfig") or os.environ.get("NPM_CONFIG_USERCONFIG")
+    config = _parse_npmrc(Path(userconfig).expanduser() if userconfig else Path.home() / ".npmrc")
+    for key in ("prefix", "cache", "registry"):
+        value = os.environ.get(f"npm_config_{key}") or os.environ.get(f"NPM_CONFIG_{key.upper()}")
+        if value:
+            config[key] = value
+    return config
+
+
+def get_npm_prefix() -> Optional[Path]:
+    """Return the npm global prefix without running ``npm prefix -g``."""
+    prefix = _npm_config().get("prefix")
+    if prefix:
+        return Path(prefix).expanduser()
+    if os.name == "nt":
+        appdata = os.getenv("APPDATA")
+        return Path(appdata) / "npm" if appdata else None
+    # Default prefix is the node installation: <prefix>/bin/node
+    node = shutil.which("node")
+    return Path(node).resolve().parent.parent if node else None
+
+
+def get_npm_cache_dir() -> Path:
+    """Return the npm cache directory (``~/.npm`` unless configured)."""
+    cache = _npm_config().get("cache")
+    if cache:
+        return Path(cache).expanduser()
+    if os.name == "nt":
+        local = os.getenv("LOCALAPPDATA")
+        if local:
+            return Path(local) / "npm-cache"
+    return Path.home() / ".npm"
+
+
+# Resolution strategies
+def _global_module_dir(prefix: Path) -> Path:
+    return prefix / "node_modules" if os.name == "nt" else prefix / "lib" / "node_modules"
+
+
+def find_global_package(package: str) -> Optional[Path]:
+    """Return the package directory if installed with ``npm install -g``."""
+    prefix = get_npm_prefix()
+    if prefix is None:
+        return None
+    package_dir = _global_module_dir(prefix) / package
+    return package_dir if (package_dir / "package.json").is_file() else None
+
+
+def find_npx_package(package: str) -> Optional[Path]:
+    """Return the package directory if a previous ``npx`` run installed it."""
+    npx_root = get_npm_cache_dir() / "_npx"
+    try:
+        installs = list(npx_root.iterdir())
+    except OSError:
+        return None
+    for install in installs:
+        package_dir = install / "node_modules" / package
+        if (package_dir / "package.json").is_file():
+            return package_dir
+    return None
+
+
+def _packument_cache_key(package: str) -> str:
+    """Return the cacache key npm uses for a package's registry metadata."""
+    registry = _npm_config().get("registry") or DEFAULT_REGISTRY
+    if not registry.endswith("/"):
+        registry += "/"
+    return f"{CACACHE_KEY_PREFIX}{registry}{package.replace('/', '%2f')}"
+
+
+def find_cached_packument(package: str) -> Optional[Path]:
+    """Return the npm cache index bucket for the package metadata, if cached.
+
+    The bucket path is derived from the SHA-256 of the cache key, so this
+    is a single ``stat`` rather than a scan of the cache.
+    """
+    digest = hashlib.sha256(_packument_cache_key(package).encode("utf-8")).hexdigest()
+    bucket = get_npm_cache_dir() / "_cacache" / "index-v5" / digest[:2] / digest[2:4] / digest[4:]
+    return bucket if bucket.is_file() else None
+
+
+def resolve_package_offline(package: str) -> Optional[str]:
+    """
+    Find an npm package using local state only.
+
+    Args:
+        package: npm package name (scoped names supported)
+
+    Returns:
+        Where the package was found ("global", "npx-cache" or "npm-cache"),
+        or None if it is not available locally
+    """
+    if find_global_package(package):
+        return "global"
+    if find_npx_package(package):
+        return "npx-cache"
+    if find_cached_packument(package):
+        return "npm-cache"
+    return None
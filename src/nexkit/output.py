@@ -0,0 +1,62 @@
+"""
+Machine-readable command output.
+
+Commands that accept ``--output json`` write their result as one JSON
+document on stdout instead of rendering it with Rich: no banner, panel,
+tree, table or live display is built, so scripts neither pay for the
+layout nor have to parse it back. ``--output jsonl`` is the same for
+single-result commands; multi-item commands (``--recursive``) stream one
+JSON object per line as each item finishes.
+
+Every document has an ``ok`` field. Exit codes are the same in every
+format: 0 on success, 1 when the command failed or found a problem, 2 for
+invalid usage.
+"""
+
+import dataclasses
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+
+# Constants
+OUTPUT_FORMATS = ("text", "json", "jsonl")
+OUTPUT_HELP = "Output format: text, json (one document) or jsonl (one object per line)"
+
+
+# Core Functions
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a result object into JSON-compatible values.
+
+    Dataclasses become objects with their fields plus their read-only
+    properties (e.g. ``ExclusionResult.updated``), paths become POSIX
+    strings and tuples/sets become lists.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        record = {field.name: to_jsonable(getattr(value, field.name)) for field in dataclasses.fields(value)}
+        for name, attribute in vars(type(value)).items():
+            if isinstance(attribute, property) and not name.startswith("_"):
+                record[name] = to_jsonable(getattr(value, name))
+        return record
+    if isinstance(value, Path):
+        return value.as_posix()
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def emit(record: Any) -> None:
+    """Write one JSON document (a single line) to stdout."""
+    sys.stdout.write(json.dumps(to_jsonable(record), ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def error_record(error: Any) -> Dict[str, Any]:
+    """Return the document reported for a failed command."""
+    if isinstance(error, BaseException):
+        return {"ok": False, "error": {"type": type(error).__name__, "message": str(error)}}
+    return {"ok": False, "error": {"type": "Error", "message": str(error)}}
@@ -0,0 +1,81 @@
+"""
+Minimal git pre-commit guard for nexkit exclusions.
+
+Installed by ``nexkit hook install`` and run by git on every commit::
+
+    git diff --cached --name-only -z ... | python -I -S precommit.py RULE...
+
+The file is executed by path with site-packages disabled, so neither the
+``nexkit`` package - whose CLI loads typer and rich - nor any third-party
+module is imported. The installer precompiles the exclusion patterns into
+byte-string rules (``prefix:``, ``contains:``, ``exact:``, ``suffix:``)
+checked with ``startswith``/``in``; only a pattern that cannot be expressed
+that way becomes a ``regex:`` rule, the one case that imports ``re``.
+"""
+
+import sys
+
+
+# Number of offending paths printed before summarising the rest
+SAMPLE_SIZE = 10
+
+RULE_KINDS = ("prefix", "contains", "exact", "suffix", "regex")
+
+
+class Rules:
+    """Staged-path rules parsed from the hook's arguments."""
+
+    def __init__(self, args):
+        values = {kind: [] for kind in RULE_KINDS}
+        for arg in args:
+            kind, sep, value = arg.partition(":")
+            if not sep or kind not in values:
+                raise ValueError(f"invalid rule: {arg!r}")
+            values[kind].append(value.encode("utf-8"))
+        self.prefixes = tuple(values["prefix"])
+        self.contains = values["contains"]
+        self.exact = set(values["exact"])
+        self.suffixes = tuple(values["suffix"])
+        self.regex = None
+        if values["regex"]:
+            import re
+            self.regex = re.compile(b"|".join(b"(?:%s)" % r for r in values["regex"]), re.DOTALL)
+
+    def matches(self, path: bytes) -> bool:
+        return (
+            path.startswith(self.prefixes)
+            or path in self.exact
+            or path.endswith(self.suffixes)
+            or any(part in path for part in self.contains)
+            or (self.regex is not None and self.regex.fullmatch(path) is not None)
+        )
+
+
+def main(argv=None, stdin=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        rules = Rules(argv)
+    except ValueError as e:
+        print(f"nexkit: pre-commit guard misconfigured ({e}); reinstall with 'nexkit hook install'", file=sys.stderr)
+        return 2
+
+    data = (stdin or sys.stdin.buffer).read()
+    violations = [path for path in data.split(b"\0") if path and rules.matches(path)]
+    if not violations:
+        return 0
+
+    lines = [f"nexkit: refusing to commit {len(violations)} file(s) excluded by nexkit:"]
+    lines += [f"  {path.decode('utf-8', errors='replace')}" for path in violations[:SAMPLE_SIZE]]
+    if len(violations) > SAMPLE_SIZE:
+        lines.append(f"  ... and {len(violations) - SAMPLE_SIZE} more")
+    lines += [
+        "",
+        "Unstage them with 'nexkit add-exclusion --untrack' (keeps local copies),",
+        "or commit anyway with 'git commit --no-verify'.",
+    ]
+    print("\n".join(lines), file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Concurrent environment probes for ``nexkit check``.
+
+Each probe answers "is this tool / server available?" and may block on a
+subprocess. Probes run in a bounded thread pool under one overall deadline;
+the tracker is updated from the calling thread as each probe finishes, so
+the slowest probe - not the sum of all of them - sets the wall time.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+from .ui import StepTracker
+
+
+# Constants
+DEFAULT_DEADLINE_SECONDS = 20.0
+DEFAULT_MAX_WORKERS = 8
+
+# A probe receives the absolute time.monotonic() deadline and returns
+# (ok, detail). Probes that block on a subprocess should bound it with
+# remaining_time(deadline).
+Probe = Callable[[float], Tuple[bool, str]]
+
+
+# Data Classes
+@dataclass
+class ProbeResult:
+    """Outcome of a single probe."""
+    key: str
+    ok: bool
+    detail: str
+    timed_out: bool = False
+
+
+# Core Functions
+def remaining_time(deadline: float, minimum: float = 0.1) -> float:
+    """Return the seconds left until deadline (at least minimum)."""
+    return max(minimum, deadline - time.monotonic())
+
+
+def run_probes(
+    probes: Dict[str, Probe],
+    tracker: StepTracker | None = None,
+    *,
+    deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, ProbeResult]:
+    """
+    Run probes concurrently under a single deadline.
+
+    Probes still queued when the deadline passes are cancelled. Running
+    probes cannot be interrupted: they are reported as timed out and left
+    to finish in the background, so a probe is only bounded by the
+    subprocess timeout it derives from ``remaining_time(deadline)``.
+
+    Args:
+        probes: Mapping of tracker key to probe callable
+        tracker: Optional tracker updated as each probe finishes
+        deadline_seconds: Overall time budget for all probes
+        max_workers: Maximum number of probes running at once
+
+    Returns:
+        Mapping of key to ProbeResult, in the order of probes
+    """
+    deadline = time.monotonic() + deadline_seconds
+    results: Dict[str, ProbeResult] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(probes) or 1)),
+                                  thread_name_prefix="nexkit-probe")
+    try:
+        pending = {}
+        for key, probe in probes.items():
+            pending[executor.submit(probe, deadline)] = key
+            if tracker:
+                tracker.start(key, "checking")
+
+        while pending:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    ok, detail = future.result()
+                except Exception as e:
+                    ok, detail = False, f"probe failed: {e}"
+                results[key] = ProbeResult(key, ok, detail)
+                if tracker:
+                    (tracker.complete if ok else tracker.error)(key, detail)
+
+        for future, key in pending.items():
+            future.cancel()
+            results[key] = ProbeResult(key, False, "timed out", timed_out=True)
+            if tracker:
+                tracker.error(key, "timed out")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {key: results[key] for key in probes}
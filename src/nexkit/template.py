@@ -0,0 +1,527 @@
+"""
+Release template download and extraction for ``nexkit init``.
+
+This module pulls in the HTTP client stack and is therefore only imported by
+the commands that need to fetch a template from GitHub.
+"""
+
+import os
+import shutil
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Tuple
+
+import httpx
+import typer
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+from .cache import TemplateCache, TemplateCacheError, get_release_ttl
+from .network import _github_auth_headers, create_client, download_resumable, download_to_spool
+from .ui import StepTracker, console, get_console
+
+
+def _asset_sha256(asset: dict) -> str | None:
+    """Return the SHA-256 GitHub publishes for a release asset ('digest' field), if any."""
+    digest = asset.get("digest") or ""
+    return digest[len("sha256:"):] if digest.startswith("sha256:") else None
+
+
+def fetch_latest_release(client: httpx.Client, api_url: str, *, cache: TemplateCache | None = None, github_token: str = None, debug: bool = False) -> Tuple[dict, str]:
+    """Fetch release metadata, reusing the persisted copy whenever possible.
+
+    Metadata younger than the freshness TTL (``NEXKIT_RELEASE_TTL``) is used
+    without any request. Older metadata is revalidated with ``If-None-Match``
+    / ``If-Modified-Since``; a 304 answer does not count against the GitHub
+    rate limit and is treated as a cache hit.
+
+    Returns:
+        Tuple of (release JSON, source) where source is "fresh",
+        "revalidated" or "network"
+    """
+    cached = cache.load_release(api_url) if cache else None
+    if cached and cached.is_fresh(get_release_ttl()):
+        return cached.payload, "fresh"
+
+    headers = _github_auth_headers(github_token)
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    console.print(f"[cyan]Fetching from: {api_url}[/cyan]")
+    response = client.get(
+        api_url,
+        timeout=30,
+        follow_redirects=True,
+        headers=headers,
+    )
+    status = response.status_code
+    if status == 304 and cached:
+        _save_release(cache, api_url, cached.payload,
+                      response.headers.get("etag") or cached.etag,
+                      response.headers.get("last-modified") or cached.last_modified)
+        return cached.payload, "revalidated"
+    if status != 200:
+        msg = f"GitHub API returned {status} for {api_url}"
+        if debug:
+            msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
+        raise RuntimeError(msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+    if cache:
+        _save_release(cache, api_url, release_data,
+                      response.headers.get("etag"), response.headers.get("last-modified"))
+    return release_data, "network"
+
+
+def _save_release(cache: TemplateCache, api_url: str, payload: dict, etag: str | None, last_modified: str | None) -> None:
+    try:
+        cache.save_release(api_url, payload, etag, last_modified)
+    except TemplateCacheError:
+        pass  # Metadata caching is best effort
+
+
+def download_template_from_github(ai_assistant: str, download_dir: Path | None, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, use_cache: bool = True, on_progress: Callable[[int, int], None] | None = None) -> Tuple[Path | BinaryIO, dict]:
+    """Resolve the latest release template, downloading it unless it is cached.
+
+    With ``use_cache`` the archive is served from (and stored in) the local
+    template cache and ``download_dir`` is not used; the returned metadata's
+    ``cache`` key is ``"hit"``, ``"offline"`` or ``"stored"``. Without the
+    cache the archive is written to ``download_dir`` and the caller owns it.
+    If ``download_dir`` is None as well, the archive is buffered in a
+    spooled temporary file (hashed while it streams in) which is returned
+    open at offset 0 and must be closed by the caller.
+    """
+    repo_owner = "NexusInnovation"
+    repo_name = "nexkit"
+    if client is None:
+        client = create_client()
+    cache = TemplateCache() if use_cache else None
+    pattern = f"nexkit-template-{ai_assistant}-{script_type}"
+
+    if verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+
+    try:
+        release_data, release_source = fetch_latest_release(
+            client, api_url, cache=cache, github_token=github_token, debug=debug
+        )
+    except Exception as e:
+        # Offline: fall back to the most recently used cached template
+        cached = cache.latest(pattern) if cache else None
+        if cached:
+            if verbose:
+                console.print(f"[yellow]Could not reach GitHub; using cached template from {cached.release}[/yellow]")
+            return cached.path, {
+                "filename": cached.asset,
+                "size": cached.size,
+                "release": cached.release,
+                "asset_url": None,
+                "sha256": cached.sha256,
+                "cache": "offline",
+                "release_source": "offline",
+            }
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    # Find the template asset for the specified AI assistant
+    assets = release_data.get("assets", [])
+    matching_assets = [
+        asset for asset in assets
+        if pattern in asset["name"] and asset["name"].endswith(".zip")
+    ]
+
+    asset = matching_assets[0] if matching_assets else None
+
+    if asset is None:
+        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+        asset_names = [a.get('name', '?') for a in assets]
+        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
+        raise typer.Exit(1)
+
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    file_size = asset["size"]
+
+    if verbose:
+        console.print(f"[cyan]Found template:[/cyan] {filename}")
+        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
+        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+
+    release_tag = release_data["tag_name"]
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": release_tag,
+        "asset_url": download_url,
+        "sha256": _asset_sha256(asset),
+        "cache": None,
+        "release_source": release_source,
+    }
+
+    if cache:
+        cached = cache.lookup(release_tag, filename, metadata["sha256"])
+        if cached:
+            if verbose:
+                console.print(f"[cyan]Using cached template[/cyan] ({cached.sha256[:12]})")
+            metadata.update(sha256=cached.sha256, cache="hit")
+            return cached.path, metadata
+
+    if verbose:
+        console.print(f"[cyan]Downloading template...[/cyan]")
+
+    try:
+        with _download_progress(show_progress, file_size, on_progress) as on_progress:
+            if cache is None and download_dir is None:
+                # No cache and nowhere to keep the archive: buffer it in memory
+                zip_path, sha256 = download_to_spool(
+                    client,
+                    download_url,
+                    headers=_github_auth_headers(github_token),
+                    on_progress=on_progress,
+                )
+            else:
+                zip_path = download_resumable(
+                    client,
+                    download_url,
+                    cache.download_path(filename) if cache else download_dir / filename,
+                    headers=_github_auth_headers(github_token),
+                    on_progress=on_progress,
+                    keep_partial=cache is not None,
+                )
+    except Exception as e:
+        console.print(f"[red]Error downloading template[/red]")
+        console.print(Panel(str(e), title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+    if verbose:
+        console.print(f"Downloaded: {filename}")
+
+    if cache:
+        try:
+            entry = cache.store(release_tag, filename, zip_path)
+        except TemplateCacheError as e:
+            # Caching is an optimisation: keep using the downloaded file
+            if verbose:
+                console.print(f"[yellow]Warning:[/yellow] {e}")
+        else:
+            if metadata["sha256"] and entry.sha256 != metadata["sha256"]:
+                # Never leave a bad archive for the offline fallback to serve
+                try:
+                    cache.evict(release_tag, filename)
+                except TemplateCacheError:
+                    pass
+                console.print(f"[red]Downloaded template does not match the published SHA-256[/red]")
+                raise typer.Exit(1)
+            metadata.update(sha256=entry.sha256, cache="stored")
+            zip_path = entry.path
+    elif not isinstance(zip_path, Path):
+        if metadata["sha256"] and sha256 != metadata["sha256"]:
+            zip_path.close()
+            console.print(f"[red]Downloaded template does not match the published SHA-256[/red]")
+            raise typer.Exit(1)
+        metadata["sha256"] = sha256
+    return zip_path, metadata
+
+
+@contextmanager
+def _download_progress(show_progress: bool, file_size: int, on_progress: Callable[[int, int], None] | None = None):
+    """Yield a download progress callback, rendering a progress bar if requested.
+
+    Without a progress bar the caller's ``on_progress`` (if any) is used.
+    """
+    if not show_progress:
+        yield on_progress
+        return
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=get_console(),
+    ) as progress:
+        task = progress.add_task("Downloading...", total=file_size or None)
+        yield lambda done, total: progress.update(task, completed=done, total=total or None)
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting a template archive."""
+    root_prefix: str = ""
+    files: int = 0
+    created: int = 0
+    overwritten: List[str] = field(default_factory=list)
+    merged_dirs: List[str] = field(default_factory=list)
+    executables: int = 0
+    chmod_failures: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        detail = f"{self.files} files"
+        if self.overwritten:
+            detail += f" ({self.created} new, {len(self.overwritten)} overwritten)"
+        return detail
+
+    def merge_detail(self, limit: int = 5) -> str:
+        items = self.merged_dirs + self.overwritten
+        shown = ", ".join(items[:limit])
+        return shown + (f" +{len(items) - limit} more" if len(items) > limit else "")
+
+
+def _common_root_prefix(names: List[str]) -> str:
+    """Return the single top-level directory shared by all members ("" if none)."""
+    roots = {name.split("/", 1)[0] for name in names if name}
+    if len(roots) != 1:
+        return ""
+    prefix = roots.pop() + "/"
+    # A lone top-level file is not a root directory
+    return prefix if any(name.startswith(prefix) for name in names) else ""
+
+
+def _archive_mode(info: zipfile.ZipInfo) -> int | None:
+    """Return the Unix permission bits stored for a member, if the archive has them."""
+    if info.create_system != 3:  # Not created on a Unix system
+        return None
+    return (info.external_attr >> 16) & 0o777 or None
+
+
+def _apply_exec_bits(target: Path, info: zipfile.ZipInfo, head: bytes) -> bool:
+    """Set execute bits from the archive, falling back to a shebang check for .sh files.
+
+    Release archives are built with ``zip -r`` from scripts stored as 100644
+    in git, so a Unix mode without execute bits does not mean "not a
+    script": the shebang check applies whenever the archive sets none.
+    Execute bits are only added where the file is readable, so the user's
+    umask still applies. Returns True if the file was made executable.
+    """
+    if os.name == "nt":
+        return False
+    wanted = (_archive_mode(info) or 0) & 0o111
+    if not wanted and target.suffix == ".sh" and head == b"#!":
+        wanted = 0o111
+    if not wanted:
+        return False
+    mode = target.stat().st_mode
+    new_mode = mode | (((mode & 0o444) >> 2) & wanted) | 0o100
+    os.chmod(target, new_mode)
+    return True
+
+
+def extract_template_archive(zip_ref: zipfile.ZipFile, dest: Path, *, verbose: bool = False, on_progress: Callable[[int, int], None] | None = None) -> ExtractionResult:
+    """Extract a template archive into dest in a single pass.
+
+    The common root directory of GitHub-style archives is stripped from each
+    member name, so every file is written exactly once, at its final
+    location. Existing directories are merged and existing files are
+    overwritten, matching ``init --here`` semantics. Execute bits stored in
+    the archive are applied as each file is written; members without Unix
+    permissions fall back to a shebang check for ``.sh`` scripts.
+
+    Args:
+        zip_ref: Open template archive
+        dest: Directory to extract into (created if missing)
+        verbose: Print merge/overwrite decisions for top-level items
+        on_progress: Optional callback receiving (files written, total files)
+
+    Returns:
+        ExtractionResult describing what was written
+
+    Raises:
+        ValueError: If a member would be written outside dest
+    """
+    infos = zip_ref.infolist()
+    prefix = _common_root_prefix([info.filename for info in infos])
+    result = ExtractionResult(root_prefix=prefix)
+    dest.mkdir(parents=True, exist_ok=True)
+    dest_root = dest.resolve()
+    seen_roots = set()
+    total_files = sum(1 for info in infos if not info.is_dir()) if on_progress else 0
+
+    for info in infos:
+        name = info.filename[len(prefix):] if prefix else info.filename
+        parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+        if not parts:
+            continue
+        if ".." in parts or info.filename.startswith("/"):
+            raise ValueError(f"Unsafe path in template archive: {info.filename}")
+        target = dest_root.joinpath(*parts)
+
+        # Decide per top-level directory before anything is written into it
+        if parts[0] not in seen_roots:
+            seen_roots.add(parts[0])
+            if (len(parts) > 1 or info.is_dir()) and (dest_root / parts[0]).is_dir():
+                result.merged_dirs.append(parts[0] + "/")
+                if verbose:
+                    console.print(f"[yellow]Merging directory:[/yellow] {parts[0]}")
+
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+
+        rel = "/".join(parts)
+        if target.exists():
+            result.overwritten.append(rel)
+            if verbose and len(parts) == 1:
+                console.print(f"[yellow]Overwriting file:[/yellow] {rel}")
+        else:
+            result.created += 1
+            target.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as src, open(target, "wb") as out:
+            head = src.read(2)
+            out.write(head)
+            shutil.copyfileobj(src, out)
+        result.files += 1
+        if on_progress:
+            on_progress(result.files, total_files)
+        try:
+            if _apply_exec_bits(target, info, head):
+                result.executables += 1
+        except OSError as e:
+            result.chmod_failures.append(f"{rel}: {e}")
+
+    return result
+
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None, use_cache: bool = True) -> Path:
+    """Download the latest release and extract it to create a new project.
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    Archives served from or stored in the template cache are left in place;
+    otherwise the archive is only buffered in memory (or the temp directory)
+    and the current directory is never written to.
+    """
+    # Step: fetch + download combined
+    if tracker:
+        tracker.start("fetch", "contacting GitHub API")
+        tracker.add("download", "Download template")
+    try:
+        zip_path, meta = download_template_from_github(
+            ai_assistant,
+            None,
+            script_type=script_type,
+            verbose=verbose and tracker is None,
+            show_progress=(tracker is None),
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            use_cache=use_cache,
+            on_progress=(lambda done, total: tracker.set_progress("download", "bytes", done, total or None)) if tracker else None,
+        )
+        if tracker:
+            if meta["cache"] == "offline":
+                tracker.skip("fetch", f"offline, using cached release {meta['release']}")
+            else:
+                source_note = {"fresh": ", cached metadata", "revalidated": ", not modified"}.get(meta["release_source"], "")
+                tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes{source_note})")
+            if meta["cache"] in ("hit", "offline"):
+                tracker.skip("download", f"{meta['filename']} (cached)")
+            else:
+                tracker.complete("download", meta['filename'])
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        raise
+
+    if tracker:
+        tracker.add("extract", "Extract template")
+        tracker.start("extract")
+    elif verbose:
+        console.print("Extracting template...")
+
+    try:
+        # Create project directory only if not using current directory
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            # List all files in the ZIP for debugging
+            zip_contents = zip_ref.namelist()
+            if tracker:
+                tracker.add("zip-list", "Archive contents", parent="extract")
+                tracker.start("zip-list")
+                tracker.complete("zip-list", f"{len(zip_contents)} entries")
+            elif verbose:
+                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
+
+            # Write every member straight to its final location
+            result = extract_template_archive(
+                zip_ref,
+                project_path,
+                verbose=verbose and not tracker,
+                on_progress=(lambda done, total: tracker.set_progress("extract", "files", done, total)) if tracker else None,
+            )
+
+            if tracker:
+                tracker.add("extracted-summary", "Extraction summary", parent="extract")
+                tracker.start("extracted-summary")
+                tracker.complete("extracted-summary", result.summary())
+                if result.root_prefix:
+                    tracker.add("flatten", "Flatten nested directory", parent="extract")
+                    tracker.complete("flatten", result.root_prefix.rstrip("/"))
+                if result.overwritten or result.merged_dirs:
+                    tracker.add("merge", "Merge into existing files", parent="extract")
+                    tracker.complete("merge", result.merge_detail())
+            elif verbose:
+                console.print(f"[cyan]Extracted {result.summary()} to {project_path}[/cyan]")
+                if result.root_prefix:
+                    console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+                if is_current_dir:
+                    console.print(f"[cyan]Template files merged into current directory[/cyan]")
+
+            # Permissions were applied during extraction (POSIX only)
+            if os.name != "nt":
+                detail = f"{result.executables} executable" + (f", {len(result.chmod_failures)} failed" if result.chmod_failures else "")
+                if tracker:
+                    tracker.add("chmod", "Ensure scripts executable", parent="extract")
+                    (tracker.error if result.chmod_failures else tracker.complete)("chmod", detail)
+                else:
+                    if result.executables and verbose:
+                        console.print(f"[cyan]Set execute permissions on {result.executables} file(s)[/cyan]")
+                    if result.chmod_failures:
+                        console.print("[yellow]Some scripts could not be made executable:[/yellow]")
+                        for failure in result.chmod_failures:
+                            console.print(f"  - {failure}")
+            elif tracker:
+                tracker.add("chmod", "Ensure scripts executable", parent="extract")
+                tracker.skip("chmod", "not needed on Windows")
+
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error extracting template:[/red] {e}")
+                if debug:
+                    console.print(Panel(str(e), title="Extraction Error", border_style="red"))
+        # Clean up project directory if created and not current directory
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+    else:
+        if tracker:
+            tracker.complete("extract")
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+        # Clean up the downloaded archive (cached archives are kept for the next run)
+        if meta["cache"]:
+            if tracker:
+                tracker.complete("cleanup", "archive kept in cache")
+        elif isinstance(zip_path, Path):
+            zip_path.unlink(missing_ok=True)
+            if tracker:
+                tracker.complete("cleanup")
+            elif verbose:
+                console.print(f"Cleaned up: {zip_path.name}")
+        else:
+            zip_path.close()
+            if tracker:
+                tracker.complete("cleanup", "in-memory archive released")
+
+    return project_path
@@ -0,0 +1,403 @@
+"""
+Terminal UI helpers shared by nexkit commands.
+
+This module owns the shared Rich console, the ``StepTracker`` tree renderer
+and the interactive arrow-key selector. The interactive and live-rendering
+stacks (``readchar``, ``rich.live``, ``rich.table``) are imported inside the
+functions that use them so that lightweight commands such as
+``nexkit --version`` and ``nexkit add-exclusion`` never load them. The
+console itself is only created when something is printed, so
+``--output json`` runs never build one.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+@lru_cache(maxsize=None)
+def get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    return Console()
+
+
+class _LazyConsole:
+    """Stand-in for the shared console that creates it on first attribute access.
+
+    Pass ``get_console()`` where a real ``Console`` instance is required
+    (e.g. ``rich.live.Live``).
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
+
+
+def _format_counter(unit: str, done: int, total: int | None) -> str:
+    """Format a progress counter, e.g. ``12/40 files`` or ``1.5/3.0 MB``."""
+    if unit == "bytes":
+        scale, unit = (1024 * 1024, "MB") if max(done, total or 0) >= 1024 * 1024 else (1024, "KB")
+        done_text = f"{done / scale:.1f}"
+        total_text = f"{total / scale:.1f}" if total else ""
+    else:
+        done_text, total_text = f"{done:,}", f"{total:,}" if total else ""
+    return f"{done_text}/{total_text} {unit}" if total_text else f"{done_text} {unit}"
+
+
+class StepTracker:
+    """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
+
+    Steps live in an ordered dict keyed by step key, so updates are O(1), and
+    may be nested under a parent step. Each step can carry progress counters
+    (bytes, files, ...) and records monotonic start/finish times so its
+    duration can be reported.
+
+    Every method is safe to call from worker threads: state changes happen
+    under a lock and only mark the tracker dirty, and the tree is rebuilt
+    lazily when it is drawn. Pass the tracker itself to ``rich.live.Live``
+    and the live display's own refresh rate bounds the number of renders, or
+    attach a refresh callback, which is called at most once per
+    ``FRAME_INTERVAL`` (call ``flush()`` for the final render).
+    """
+    FRAME_INTERVAL = 1 / 8  # seconds; matches the 8 fps of the Live displays
+
+    def __init__(self, title: str):
+        self.title = title
+        # key -> {key, label, status, detail, started, finished, parent, children, progress}
+        self._steps = OrderedDict()
+        self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
+        self._refresh_cb = None  # callable to trigger UI refresh
+        self._frame_interval = self.FRAME_INTERVAL
+        self._last_refresh = float("-inf")
+        self._dirty = True
+        self._tree = None
+        self._lock = threading.Lock()
+
+    @property
+    def steps(self) -> list[dict]:
+        """Copies of the steps in insertion order (parents before their sub-steps)."""
+        with self._lock:
+            return [dict(s, children=list(s["children"]), progress=dict(s["progress"])) for s in self._steps.values()]
+
+    @property
+    def dirty(self) -> bool:
+        """True when steps changed since the last render."""
+        return self._dirty
+
+    def attach_refresh(self, cb, frame_interval: float | None = None):
+        """Call ``cb`` after updates, at most once per ``frame_interval`` seconds."""
+        with self._lock:
+            self._refresh_cb = cb
+            self._frame_interval = self.FRAME_INTERVAL if frame_interval is None else frame_interval
+            self._last_refresh = float("-inf")
+
+    def add(self, key: str, label: str, parent: str | None = None):
+        """Add a pending step, optionally as a sub-step of ``parent``."""
+        with self._lock:
+            if key in self._steps:
+                return
+            self._new_step(key, label, parent)
+            self._dirty = True
+        self._maybe_refresh()
+
+    def start(self, key: str, detail: str = ""):
+        self._update(key, status="running", detail=detail)
+
+    def complete(self, key: str, detail: str = ""):
+        self._update(key, status="done", detail=detail)
+
+    def error(self, key: str, detail: str = ""):
+        self._update(key, status="error", detail=detail)
+
+    def skip(self, key: str, detail: str = ""):
+        self._update(key, status="skipped", detail=detail)
+
+    def set_progress(self, key: str, unit: str, done: int, total: int | None = None):
+        """Set a step's ``unit`` counter (e.g. ``"bytes"``, ``"files"``).
+
+        A pending step is started by its first progress report.
+        """
+        with self._lock:
+            step = self._get_or_create(key)
+            step["progress"][unit] = (done, total if total is not None else step["progress"].get(unit, (0, None))[1])
+            self._start_if_pending(step)
+            self._dirty = True
+        self._maybe_refresh()
+
+    def advance(self, key: str, unit: str, amount: int = 1):
+        """Add ``amount`` to a step's ``unit`` counter."""
+        with self._lock:
+            step = self._get_or_create(key)
+            done, total = step["progress"].get(unit, (0, None))
+            step["progress"][unit] = (done + amount, total)
+            self._start_if_pending(step)
+            self._dirty = True
+        self._maybe_refresh()
+
+    @contextmanager
+    def step(self, key: str, label: str | None = None, parent: str | None = None):
+        """Run a block as a step: started on entry, completed on exit, error on exception."""
+        if label is not None:
+            self.add(key, label, parent)
+        self.start(key)
+        try:
+            yield self
+        except BaseException as e:
+            self.error(key, str(e) or type(e).__name__)
+            raise
+        else:
+            with self._lock:
+                finished = self._steps[key]["status"] != "running"
+            if not finished:
+                self.complete(key)
+
+    def _new_step(self, key: str, label: str, parent: str | None) -> dict:
+        if parent is not None:
+            parent_step = self._get_or_create(parent)
+            parent_step["children"].append(key)
+        step = self._steps[key] = {
+            "key": key, "label": label, "status": "pending", "detail": "",
+            "started": None, "finished": None, "parent": parent, "children": [], "progress": {},
+        }
+        return step
+
+    def _get_or_create(self, key: str) -> dict:
+        step = self._steps.get(key)
+        if step is None:
+            # If not present, add it
+            step = self._new_step(key, key, None)
+        return step
+
+    def _update(self, key: str, status: str, detail: str):
+        with self._lock:
+            step = self._get_or_create(key)
+            step["status"] = status
+            if detail:
+                step["detail"] = detail
+            self._stamp(step)
+            if status == "running" and step["parent"] is not None:
+                self._start_if_pending(self._steps[step["parent"]])
+            self._dirty = True
+        self._maybe_refresh()
+
+    def _start_if_pending(self, step: dict):
+        if step["status"] == "pending":
+            step["status"] = "running"
+            self._stamp(step)
+
+    @staticmethod
+    def _stamp(step: dict):
+        now = time.monotonic()
+        if step["status"] == "running":
+            step["started"], step["finished"] = now, None
+        elif step["status"] in ("done", "error", "skipped"):
+            step["finished"] = now
+
+    def snapshot(self) -> list[dict]:
+        """Return the steps as plain records for machine-readable output.
+
+        ``duration`` is in seconds: start to finish for finished steps, time so
+        far for running ones, None for steps that never started. ``parent`` is
+        the key of the enclosing step and ``progress`` maps each counter unit
+        to its ``done``/``total``.
+        """
+        now = time.monotonic()
+        records = []
+        for s in self.steps:
+            duration = None
+            if s["started"] is not None:
+                duration = round((s["finished"] or now) - s["started"], 6)
+            records.append({"key": s["key"], "label": s["label"], "status": s["status"],
+                            "detail": s["detail"], "duration": duration, "parent": s["parent"],
+                            "progress": {unit: {"done": done, "total": total} for unit, (done, total) in s["progress"].items()}})
+        return records
+
+    def _maybe_refresh(self):
+        with self._lock:
+            if not self._refresh_cb:
+                return
+            now = time.monotonic()
+            if now - self._last_refresh < self._frame_interval:
+                return  # coalesced into the next frame (or the final flush)
+            self._last_refresh = now
+            refresh_cb = self._refresh_cb
+        try:
+            refresh_cb()
+        except Exception:
+            pass
+
+    def flush(self):
+        """Run the refresh callback now if updates are still pending."""
+        with self._lock:
+            if not (self._refresh_cb and self._dirty):
+                return
+            self._last_refresh = float("-inf")
+        self._maybe_refresh()
+
+    def __rich__(self):
+        return self.render()
+
+    def render(self):
+        """Return the Rich tree, rebuilding it only if steps changed."""
+        with self._lock:
+            if self._dirty or self._tree is None:
+                self._tree = self._build_tree()
+                self._dirty = False
+            return self._tree
+
+    def _build_tree(self):
+        from rich.tree import Tree
+
+        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+        for step in self._steps.values():
+            if step["parent"] is None:
+                self._add_branch(tree, step)
+        return tree
+
+    def _add_branch(self, tree, step: dict):
+        label = step["label"]
+        details = [step["detail"].strip()] if step["detail"] else []
+        details += [_format_counter(unit, done, total) for unit, (done, total) in step["progress"].items()]
+        detail_text = ", ".join(d for d in details if d)
+
+        # Circles (unchanged styling)
+        status = step["status"]
+        if status == "done":
+            symbol = "[green]●[/green]"
+        elif status == "pending":
+            symbol = "[green dim]○[/green dim]"
+        elif status == "running":
+            symbol = "[cyan]○[/cyan]"
+        elif status == "error":
+            symbol = "[red]●[/red]"
+        elif status == "skipped":
+            symbol = "[yellow]○[/yellow]"
+        else:
+            symbol = " "
+
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
+            else:
+                line = f"{symbol} [bright_black]{label}[/bright_black]"
+        else:
+            # Label white, detail (if any) light gray in parentheses
+            if detail_text:
+                line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+            else:
+                line = f"{symbol} [white]{label}[/white]"
+
+        branch = tree.add(line)
+        for child in step["children"]:
+            self._add_branch(branch, self._steps[child])
+
+
+def get_key():
+    """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
+    key = readchar.readkey()
+
+    if key == readchar.key.UP or key == readchar.key.CTRL_P:
+        return 'up'
+    if key == readchar.key.DOWN or key == readchar.key.CTRL_N:
+        return 'down'
+
+    if key == readchar.key.ENTER:
+        return 'enter'
+
+    if key == readchar.key.ESC:
+        return 'escape'
+
+    if key == readchar.key.CTRL_C:
+        raise KeyboardInterrupt
+
+    return key
+
+
+def select_with_arrows(options: dict, prompt_text: str = "Select an option", default_key: str = None) -> str:
+    """
+    Interactive selection using arrow keys with Rich Live display.
+
+    Args:
+        options: Dict with keys as option keys and values as descriptions
+        prompt_text: Text to show above the options
+        default_key: Default option key to start with
+
+    Returns:
+        Selected option key
+    """
+    from rich.live import Live
+    from rich.table import Table
+
+    option_keys = list(options.keys())
+    if default_key and default_key in option_keys:
+        selected_index = option_keys.index(default_key)
+    else:
+        selected_index = 0
+
+    selected_key = None
+
+    def create_selection_panel():
+        """Create the selection panel with current selection highlighted."""
+        table = Table.grid(padding=(0, 2))
+        table.add_column(style="cyan", justify="left", width=3)
+        table.add_column(style="white", justify="left")
+
+        for i, key in enumerate(option_keys):
+            if i == selected_index:
+                table.add_row("▶", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+            else:
+                table.add_row(" ", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+
+        table.add_row("", "")
+        table.add_row("", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
+
+        return Panel(
+            table,
+            title=f"[bold]{prompt_text}[/bold]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+
+    console.print()
+
+    def run_selection_loop():
+        nonlocal selected_key, selected_index
+        with Live(create_selection_panel(), console=get_console(), transient=True, auto_refresh=False) as live:
+            while True:
+                try:
+                    key = get_key()
+                    if key == 'up':
+                        selected_index = (selected_index - 1) % len(option_keys)
+                    elif key == 'down':
+                        selected_index = (selected_index + 1) % len(option_keys)
+                    elif key == 'enter':
+                        selected_key = option_keys[selected_index]
+                        break
+                    elif key == 'escape':
+                        console.print("\n[yellow]Selection cancelled[/yellow]")
+                        raise typer.Exit(1)
+
+                    live.update(create_selection_panel(), refresh=True)
+
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Selection cancelled[/yellow]")
+                    raise typer.Exit(1)
+
+    run_selection_loop()
+
+    if selected_key is None:
+        console.print("\n[red]Selection failed.[/red]")
+        raise typer.Exit(1)
+
+    # Suppress explicit selection print; tracker / later logic will report consolidated status
+    return selected_key
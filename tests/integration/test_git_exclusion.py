@@ -283,3 +283,195 @@ def test_commands_show_banner(temp_repo, monkeypatch):
     # Banner should be displayed
     expected_banner = "=== NEXKIT CLI ==="
     assert expected_banner in result.stdout
+
+
+def test_no_banner_flag(temp_repo):
+    """Test that --no-banner suppresses the banner."""
+    result = runner.invoke(app, ["--no-banner", "add-exclusion", str(temp_repo)])
+
+    assert result.exit_code == 0
+    assert "Successfully added nexkit exclusions" in result.stdout
+    assert "Spec-Driven Development Toolkit" not in result.stdout
+
+
+def test_no_banner_env(temp_repo, monkeypatch):
+    """Test that NEXKIT_NO_BANNER suppresses the banner."""
+    monkeypatch.setenv("NEXKIT_NO_BANNER", "1")
+
+    result = runner.invoke(app, ["add-exclusion", str(temp_repo)])
+
+    assert result.exit_code == 0
+    assert "Spec-Driven Development Toolkit" not in result.stdout
+
+
+# Test: Subprocess usage
+@pytest.fixture
+def git_calls(monkeypatch):
+    """Record the git subcommands started via subprocess.run."""
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        if isinstance(cmd, (list, tuple)) and cmd and cmd[0] == "git":
+            calls.append(cmd[1])
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", counting_run)
+    return calls
+
+
+@pytest.mark.parametrize("command, configured", [
+    ("add-exclusion", False),
+    ("add-exclusion", True),
+    ("remove-exclusion", True),
+])
+def test_repository_resolved_without_subprocess(temp_repo, monkeypatch, git_calls, command, configured):
+    """Test that exclusion commands resolve the repository without spawning git."""
+    monkeypatch.chdir(temp_repo)
+    if configured:
+        gitignore.add_nexkit_exclusions(temp_repo)
+    git_calls.clear()
+
+    result = runner.invoke(app, ["--no-banner", command])
+
+    assert result.exit_code == 0
+    assert "rev-parse" not in git_calls
+    # At most one tracked-file query, whatever the number of patterns
+    assert git_calls in ([], ["ls-files"])
+
+
+# Test: exclusion verify command
+def write_nexkit_files(repo: Path):
+    for name in [".specify/memory/constitution.md", "specs/001/spec.md", ".github/prompts/nexkit.plan.prompt.md"]:
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+
+def test_exclusion_verify_effective(temp_repo):
+    """Test verify passes once the section is added."""
+    write_nexkit_files(temp_repo)
+    runner.invoke(app, ["add-exclusion", str(temp_repo)])
+    
+    result = runner.invoke(app, ["--no-banner", "exclusion", "verify", str(temp_repo)])
+    
+    assert result.exit_code == 0
+    assert "All 3 nexkit path(s) are ignored by git" in result.stdout
+
+
+def test_exclusion_verify_reports_negation(temp_repo):
+    """Test verify fails when a later rule re-includes nexkit files."""
+    write_nexkit_files(temp_repo)
+    runner.invoke(app, ["add-exclusion", str(temp_repo)])
+    with open(temp_repo / ".gitignore", "a", encoding="utf-8") as f:
+        f.write("!specs/\n")
+    
+    result = runner.invoke(app, ["--no-banner", "exclusion", "verify", str(temp_repo)])
+    
+    assert result.exit_code == 1
+    assert "specs/001/spec.md" in result.stdout
+    assert "!specs/" in result.stdout
+    verification = gitignore.verify_nexkit_exclusions(temp_repo)
+    assert [path for path, _ in verification.not_ignored] == [Path("specs/001/spec.md")]
+
+
+def test_exclusion_verify_without_section(temp_repo):
+    """Test verify lists every nexkit file when nothing excludes them."""
+    write_nexkit_files(temp_repo)
+    
+    result = runner.invoke(app, ["--no-banner", "exclusion", "verify", str(temp_repo)])
+    
+    assert result.exit_code == 1
+    assert "3 nexkit file(s) are not ignored by git" in result.stdout
+
+
+def test_exclusion_verify_not_git_repo(tmp_path):
+    """Test verify outside a repository."""
+    result = runner.invoke(app, ["--no-banner", "exclusion", "verify", str(tmp_path)])
+    
+    assert result.exit_code == 1
+    assert "Not a git repository" in result.stdout
+
+
+def test_add_exclusion_untrack(temp_repo):
+    """Test add-exclusion --untrack removes tracked nexkit files from the index."""
+    write_nexkit_files(temp_repo)
+    (temp_repo / "README.md").write_text("x", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=temp_repo, check=True, capture_output=True)
+    
+    result = runner.invoke(app, ["--no-banner", "add-exclusion", "--untrack", "--agent", "copilot", str(temp_repo)])
+    
+    assert result.exit_code == 0
+    assert "Untracked 3 nexkit file(s)" in result.stdout
+    tracked = subprocess.run(["git", "ls-files"], cwd=temp_repo, check=True, capture_output=True, text=True).stdout
+    assert tracked.split() == ["README.md"]
+    assert (temp_repo / "specs" / "001" / "spec.md").exists()
+
+
+# Test: --recursive
+@pytest.fixture
+def workspace(tmp_path):
+    """A workspace root with two service repositories."""
+    for name in ("svc-a", "svc-b"):
+        repo_path = tmp_path / "workspace" / name
+        repo_path.mkdir(parents=True)
+        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    write_nexkit_files(tmp_path / "workspace" / "svc-a")
+    subprocess.run(["git", "add", "."], cwd=tmp_path / "workspace" / "svc-a", check=True, capture_output=True)
+    return tmp_path / "workspace"
+
+
+def test_add_exclusion_recursive_table(workspace):
+    """Test add-exclusion --recursive updates every repository and prints a table."""
+    result = runner.invoke(app, ["--no-banner", "add-exclusion", "--recursive", str(workspace), "--jobs", "2"])
+    
+    assert result.exit_code == 0
+    assert "svc-a" in result.stdout and "svc-b" in result.stdout
+    assert "2 repositories, 0 failed" in result.stdout
+    assert gitignore.has_nexkit_section(workspace / "svc-a" / ".gitignore")
+    assert gitignore.has_nexkit_section(workspace / "svc-b" / ".gitignore")
+
+
+def test_exclusion_status_recursive_jsonl(workspace):
+    """Test status --recursive --output jsonl prints one JSON object per repository."""
+    import json
+    
+    runner.invoke(app, ["--no-banner", "add-exclusion", "--recursive", str(workspace), "--untrack"])
+    
+    result = runner.invoke(app, ["exclusion", "status", "--recursive", str(workspace), "--output", "jsonl"])
+    
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(Path(r["repo"]).name for r in records) == ["svc-a", "svc-b"]
+    assert all(r["ok"] and r["result"]["is_excluded"] and r["seconds"] >= 0 for r in records)
+
+
+def test_exclusion_status_recursive_fails_when_not_excluded(workspace):
+    """Test status --recursive exits 1 while a repository lacks the exclusions."""
+    result = runner.invoke(app, ["--no-banner", "exclusion", "status", "--recursive", str(workspace)])
+    
+    assert result.exit_code == 1
+    assert "not excluded" in result.stdout
+
+
+def test_remove_exclusion_recursive(workspace):
+    """Test remove-exclusion --recursive removes the section everywhere."""
+    runner.invoke(app, ["--no-banner", "add-exclusion", "--recursive", str(workspace)])
+    
+    result = runner.invoke(app, ["--no-banner", "remove-exclusion", "--recursive", str(workspace)])
+    
+    assert result.exit_code == 0
+    assert "removed" in result.stdout
+    assert not gitignore.has_nexkit_section(workspace / "svc-a" / ".gitignore")
+
+
+def test_exclusion_status_single_repo(temp_repo):
+    """Test status for one repository."""
+    result = runner.invoke(app, ["--no-banner", "exclusion", "status", str(temp_repo)])
+    assert result.exit_code == 1
+    assert "not configured" in result.stdout
+    
+    runner.invoke(app, ["--no-banner", "add-exclusion", str(temp_repo)])
+    result = runner.invoke(app, ["--no-banner", "exclusion", "status", str(temp_repo)])
+    assert result.exit_code == 0
+    assert "Nexkit exclusions are configured" in result.stdout
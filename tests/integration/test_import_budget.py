@@ -0,0 +1,95 @@
+"""
+Import-time budget tests for lightweight nexkit commands.
+
+Commands that run from git hooks and scripts (``--version`` and the
+exclusion commands) must not load the network, TLS, interactive-selection
+or Live-rendering stacks. These tests run the CLI under
+``python -X importtime`` and fail when a heavy module is imported or the
+total import time exceeds the configured ceiling.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Millisecond ceiling for all imports triggered by a lightweight command.
+# Override with NEXKIT_IMPORT_BUDGET_MS on slow CI runners.
+IMPORT_BUDGET_MS = float(os.getenv("NEXKIT_IMPORT_BUDGET_MS", "250"))
+
+# Modules that only the commands which need them may import
+FORBIDDEN_MODULES = {
+    "httpx",
+    "httpcore",
+    "truststore",
+    "readchar",
+    "rich.live",
+    "rich.progress",
+    "rich.table",
+    "nexkit.network",
+    "nexkit.template",
+}
+
+
+def run_with_importtime(args, cwd=None):
+    """Run the nexkit CLI with -X importtime and return (imported modules, total ms)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from nexkit import main; main()", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    modules = set()
+    total_us = 0
+    seen_nexkit = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        is_top_level = not name[1:].startswith(" ")
+        name = name.strip()
+        modules.add(name)
+        # Top-level entries before the nexkit package belong to interpreter startup
+        if is_top_level and name == "nexkit":
+            seen_nexkit = True
+        if is_top_level and seen_nexkit:
+            total_us += int(cumulative)
+    assert seen_nexkit, "nexkit import not found in -X importtime output"
+    return modules, total_us / 1000
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Create a temporary git repository."""
+    repo_path = tmp_path / "test_repo"
+    repo_path.mkdir()
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    return repo_path
+
+
+def test_version_import_budget():
+    """Test that --version stays within the import budget."""
+    modules, total_ms = run_with_importtime(["--version"])
+
+    assert not (modules & FORBIDDEN_MODULES)
+    assert total_ms < IMPORT_BUDGET_MS
+
+
+def test_add_exclusion_import_budget(temp_repo):
+    """Test that add-exclusion stays within the import budget."""
+    modules, total_ms = run_with_importtime(["add-exclusion", str(temp_repo)])
+
+    assert not (modules & FORBIDDEN_MODULES)
+    assert total_ms < IMPORT_BUDGET_MS
+
+
+def test_remove_exclusion_import_budget(temp_repo):
+    """Test that remove-exclusion stays within the import budget."""
+    modules, total_ms = run_with_importtime(["remove-exclusion", str(temp_repo)])
+
+    assert not (modules & FORBIDDEN_MODULES)
+    assert total_ms < IMPORT_BUDGET_MS
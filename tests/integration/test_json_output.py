@@ -0,0 +1,214 @@
+"""
+Integration tests for ``--output json`` / ``--output jsonl``.
+
+Each command must print nothing but JSON documents on stdout, report
+``ok`` and use exit status 0 on success, 1 on failure and 2 for an
+unknown output format.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import nexkit
+from nexkit import app, ui
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def temp_repo(tmp_path):
+    """Create a temporary git repository with a tracked nexkit file."""
+    repo_path = tmp_path / "test_repo"
+    (repo_path / "specs" / "001").mkdir(parents=True)
+    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    (repo_path / "specs" / "001" / "spec.md").write_text("# Spec\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+    return repo_path
+
+
+def invoke_json(args):
+    """Run a command and parse its whole stdout as one JSON document."""
+    result = runner.invoke(app, args)
+    return result, json.loads(result.stdout)
+
+
+def test_add_exclusion_json(temp_repo):
+    """Test add-exclusion serialises ExclusionResult."""
+    result, document = invoke_json(["add-exclusion", str(temp_repo), "--output", "json"])
+
+    assert result.exit_code == 0
+    assert document["ok"] is True
+    assert document["result"]["patterns_affected"][:2] == [".specify/", "specs/"]
+    assert document["result"]["tracked_files"] == ["specs/001/spec.md"]
+    assert document["result"]["updated"] is False
+    assert document["untracked"] == 0
+
+
+def test_add_exclusion_json_untrack(temp_repo):
+    """Test --untrack reports the number of files removed from the index."""
+    result, document = invoke_json(["add-exclusion", str(temp_repo), "--untrack", "--output", "json"])
+
+    assert result.exit_code == 0
+    assert document["untracked"] == 1
+
+
+def test_remove_exclusion_json(temp_repo):
+    """Test remove-exclusion serialises ExclusionResult."""
+    runner.invoke(app, ["add-exclusion", str(temp_repo), "--output", "json"])
+
+    result, document = invoke_json(["remove-exclusion", str(temp_repo), "--output", "json"])
+
+    assert result.exit_code == 0
+    assert "specs/" in document["result"]["patterns_affected"]
+
+
+def test_exclusion_status_json(temp_repo):
+    """Test status serialises ExclusionStatus and fails while files are tracked."""
+    result, document = invoke_json(["exclusion", "status", str(temp_repo), "--output", "json"])
+
+    assert result.exit_code == 1
+    assert document["ok"] is False
+    assert document["status"]["is_excluded"] is False
+    assert document["status"]["tracked_files"] == ["specs/001/spec.md"]
+
+
+def test_exclusion_verify_json(temp_repo):
+    """Test verify serialises ExclusionVerification."""
+    result, document = invoke_json(["exclusion", "verify", str(temp_repo), "--output", "json"])
+
+    assert result.exit_code == 1
+    assert document["verification"]["is_effective"] is False
+    assert document["verification"]["not_ignored"] == [["specs/001/spec.md", None]]
+
+
+def test_exclusion_verify_json_several_agents(temp_repo):
+    """Test verify accepts --agent more than once, like the other exclusion commands."""
+    (temp_repo / ".claude" / "modes").mkdir(parents=True)
+    (temp_repo / ".claude" / "modes" / "a.md").write_text("a", encoding="utf-8")
+    (temp_repo / ".gemini" / "modes").mkdir(parents=True)
+    (temp_repo / ".gemini" / "modes" / "b.md").write_text("b", encoding="utf-8")
+
+    result, document = invoke_json([
+        "exclusion", "verify", str(temp_repo), "--agent", "claude", "--agent", "gemini", "--output", "json",
+    ])
+
+    assert result.exit_code == 1
+    assert {".claude/modes/", ".gemini/modes/"} <= set(document["verification"]["patterns"])
+    not_ignored = {path for path, _ in document["verification"]["not_ignored"]}
+    assert any(path.startswith(".claude/modes") for path in not_ignored)
+    assert any(path.startswith(".gemini/modes") for path in not_ignored)
+
+
+def test_json_mode_creates_no_console(temp_repo):
+    """Test JSON output never builds the Rich console."""
+    ui.get_console.cache_clear()
+
+    result, document = invoke_json(["exclusion", "status", str(temp_repo), "--output", "json"])
+
+    assert "status" in document
+    assert ui.get_console.cache_info().currsize == 0
+
+    runner.invoke(app, ["exclusion", "status", str(temp_repo)])
+    assert ui.get_console.cache_info().currsize == 1
+
+
+def test_error_json(tmp_path):
+    """Test failures are reported as JSON with exit status 1."""
+    result, document = invoke_json(["add-exclusion", str(tmp_path), "--output", "json"])
+
+    assert result.exit_code == 1
+    assert document == {
+        "ok": False,
+        "error": {"type": "NotGitRepositoryError", "message": "Not a git repository. Initialize git first with: git init"},
+    }
+
+
+def test_invalid_agent_json(temp_repo):
+    """Test invalid arguments are reported as JSON too."""
+    result, document = invoke_json(["add-exclusion", str(temp_repo), "--agent", "nope", "--output", "json"])
+
+    assert result.exit_code == 1
+    assert "Invalid agent 'nope'" in document["error"]["message"]
+
+
+def test_invalid_output_format(temp_repo):
+    """Test an unknown format is a usage error."""
+    result = runner.invoke(app, ["--no-banner", "add-exclusion", str(temp_repo), "--output", "yaml"])
+
+    assert result.exit_code == 2
+    assert "Invalid output format 'yaml'" in result.stdout
+
+
+def test_hook_install_json(temp_repo):
+    """Test hook install serialises HookResult."""
+    result, document = invoke_json(["hook", "install", str(temp_repo), "--output", "json"])
+
+    assert result.exit_code == 0
+    assert document["result"]["changed"] is True
+    assert document["result"]["hook_path"].endswith(".git/hooks/pre-commit")
+
+
+def test_cache_stats_json(tmp_path, monkeypatch):
+    """Test cache stats serialises CacheStats."""
+    monkeypatch.setenv("NEXKIT_CACHE_DIR", str(tmp_path / "cache"))
+
+    result, document = invoke_json(["cache", "stats", "--output", "json"])
+
+    assert result.exit_code == 0
+    assert document["stats"]["entries"] == 0
+    assert document["entries"] == []
+
+
+@pytest.mark.parametrize("found, exit_code", [(True, 0), (False, 1)])
+def test_check_json(monkeypatch, found, exit_code):
+    """Test check reports probe results and step durations without configuring MCP servers."""
+    monkeypatch.setattr(nexkit, "check_mcp_server", lambda *args, **kwargs: (found, "project" if found else ""))
+    monkeypatch.setattr(nexkit, "install_mcp_servers", lambda servers: pytest.fail("must not configure servers"))
+
+    result, document = invoke_json(["check", "--output", "json", "--timeout", "5"])
+
+    assert result.exit_code == exit_code
+    assert document["ok"] is found
+    assert set(document["tools"]) == {tool for tool, _ in nexkit.CHECK_TOOLS}
+    assert all(server["ok"] is found for server in document["mcp_servers"].values())
+    steps = {step["key"]: step for step in document["steps"]}
+    assert steps["context7"]["status"] == ("done" if found else "error")
+    assert all(step["duration"] is not None and step["duration"] >= 0 for step in steps.values())
+    # Probes are grouped, and worker threads count them as they finish
+    assert steps["context7"]["parent"] == "mcp" and steps["git"]["parent"] == "tools"
+    assert steps["mcp"]["status"] == ("done" if found else "error")
+    assert steps["mcp"]["progress"]["checked"] == {"done": 3, "total": 3}
+    assert steps["tools"]["progress"]["checked"]["done"] == len(nexkit.CHECK_TOOLS)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    for name in ("svc-a", "svc-b"):
+        repo_path = tmp_path / "workspace" / name
+        repo_path.mkdir(parents=True)
+        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    return tmp_path / "workspace"
+
+
+def test_recursive_json_document(workspace):
+    """Test --recursive --output json prints one document with every repository."""
+    result, document = invoke_json(["add-exclusion", "--recursive", str(workspace), "--output", "json"])
+
+    assert result.exit_code == 0
+    assert document["ok"] is True
+    assert [Path(r["repo"]).name for r in document["repositories"]] == ["svc-a", "svc-b"]
+
+
+def test_recursive_jsonl_lines(workspace):
+    """Test --recursive --output jsonl prints one line per repository."""
+    result = runner.invoke(app, ["remove-exclusion", "--recursive", str(workspace), "--output", "jsonl"])
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 2
+    assert all(json.loads(line)["operation"] == "remove" for line in lines)
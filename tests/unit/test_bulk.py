@@ -0,0 +1,162 @@
+"""
+Unit tests for nexkit.bulk module.
+"""
+
+import json
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from nexkit import bulk, gitignore
+
+
+def make_repo(path: Path, *files: str) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    for name in files:
+        file = path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("x", encoding="utf-8")
+    if files:
+        subprocess.run(["git", "add", "-f", *files], cwd=path, check=True)
+    return path
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Three service repositories plus directories that must not be searched."""
+    make_repo(tmp_path / "svc-a", "specs/001/spec.md", "src/main.py")
+    make_repo(tmp_path / "svc-b", "src/main.py")
+    make_repo(tmp_path / "team" / "svc-c", ".specify/memory/constitution.md")
+    # Nested inside a repository: belongs to svc-a
+    make_repo(tmp_path / "svc-a" / "vendor" / "lib")
+    # Package managers check out repositories too
+    make_repo(tmp_path / "svc-b" / "node_modules" / "pkg")
+    make_repo(tmp_path / "node_modules" / "tool")
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+def test_find_repositories(workspace):
+    """Test repositories are found without entering repositories or node_modules."""
+    assert bulk.find_repositories(workspace) == [
+        workspace / "svc-a",
+        workspace / "svc-b",
+        workspace / "team" / "svc-c",
+    ]
+
+
+def test_find_repositories_root_is_repository(workspace):
+    """Test a workspace root that is itself a repository is still searched."""
+    subprocess.run(["git", "init", "-q", str(workspace)], check=True)
+
+    repos = bulk.find_repositories(workspace)
+
+    assert repos[0] == workspace
+    assert workspace / "svc-b" in repos
+
+
+def test_find_repositories_skips_symlinks(workspace, tmp_path_factory):
+    """Test symlinked directories are not followed."""
+    other = make_repo(tmp_path_factory.mktemp("other") / "svc-d")
+    (workspace / "link").symlink_to(other.parent)
+
+    assert not [repo for repo in bulk.find_repositories(workspace) if "link" in repo.parts]
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_run_bulk_status(workspace, jobs):
+    """Test every repository is checked, serially and in a process pool."""
+    repos = bulk.find_repositories(workspace)
+
+    outcomes = {o.repo: o for o in bulk.run_bulk(repos, "status", jobs=jobs)}
+
+    assert set(outcomes) == set(repos)
+    assert all(o.ok and o.seconds > 0 for o in outcomes.values())
+    assert outcomes[workspace / "svc-a"].result.tracked_files == [Path("specs/001/spec.md")]
+    assert outcomes[workspace / "svc-b"].result.tracked_files == []
+    assert not any(o.result.is_excluded for o in outcomes.values())
+
+
+def test_run_bulk_add_and_remove(workspace):
+    """Test exclusions are added (untracking files) and removed in every repository."""
+    repos = bulk.find_repositories(workspace)
+
+    added = list(bulk.run_bulk(repos, "add", untrack=True, jobs=2))
+
+    assert all(o.ok for o in added)
+    assert sum(o.untracked for o in added) == 2
+    for repo in repos:
+        assert gitignore.has_nexkit_section(repo / ".gitignore")
+        assert gitignore.get_tracked_nexkit_files(repo) == []
+
+    removed = list(bulk.run_bulk(repos, "remove", jobs=2))
+
+    assert all(o.ok and o.result.patterns_affected for o in removed)
+    assert not any(gitignore.has_nexkit_section(repo / ".gitignore") for repo in repos)
+
+
+def test_run_bulk_reports_errors(workspace):
+    """Test a failing repository is reported without stopping the others."""
+    broken = workspace / "broken"
+    broken.mkdir()
+    (broken / ".git").write_text("gitdir: missing\n", encoding="utf-8")
+
+    outcomes = {o.repo: o for o in bulk.run_bulk(bulk.find_repositories(workspace), "status", jobs=2)}
+
+    assert not outcomes[broken].ok
+    assert "Not a git repository" in outcomes[broken].error
+    assert sum(o.ok for o in outcomes.values()) == 3
+
+
+def test_outcome_to_dict_is_json(workspace):
+    """Test outcomes serialise to JSON with paths as strings."""
+    outcome = bulk.process_repository(workspace / "svc-a", "status")
+
+    record = json.loads(json.dumps(bulk.outcome_to_dict(outcome)))
+
+    assert record["repo"] == (workspace / "svc-a").as_posix()
+    assert record["ok"] is True
+    assert record["result"]["tracked_files"] == ["specs/001/spec.md"]
+
+
+class CountingSlots:
+    """Context manager recording how many holders it had at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.entered = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.entered += 1
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+def test_git_process_limit(workspace):
+    """Test git processes started by gitignore hold the configured limit."""
+    slots = CountingSlots()
+    gitignore.set_git_process_limit(slots)
+    try:
+        # Split indexes are read by git ls-files, so add starts two git processes
+        subprocess.run(["git", "update-index", "--split-index"], cwd=workspace / "svc-a", check=True)
+        outcome = bulk.process_repository(workspace / "svc-a", "add", untrack=True)
+    finally:
+        gitignore.set_git_process_limit(None)
+
+    assert outcome.ok and outcome.untracked == 1
+    assert slots.entered == 2  # git ls-files and git rm
+    assert slots.active == 0
+
+
+def test_run_bulk_unknown_operation(workspace):
+    """Test invalid operations are rejected before any work starts."""
+    with pytest.raises(ValueError):
+        list(bulk.run_bulk([workspace / "svc-a"], "delete"))
@@ -0,0 +1,401 @@
+"""
+Unit tests for nexkit.cache module and its use by template downloads.
+
+Tests cover content addressing, LRU eviction, statistics, clearing,
+conditional release metadata requests and cache hits / offline fallback in
+download_template_from_github.
+"""
+
+import hashlib
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+import typer
+
+from nexkit import cache
+from nexkit.template import download_and_extract_template, download_template_from_github
+from nexkit.ui import StepTracker
+
+
+ASSET_NAME = "nexkit-template-copilot-sh-v1.0.0.zip"
+
+
+def make_zip(content: str = "hello") -> bytes:
+    """Build a small in-memory zip archive."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("nexkit-template/README.md", content)
+    return buffer.getvalue()
+
+
+# Fixtures
+@pytest.fixture
+def template_cache(tmp_path):
+    """Create an empty template cache in a temporary directory."""
+    return cache.TemplateCache(cache_dir=tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Create a downloaded archive file."""
+    def _make(name: str = "download.zip", content: str = "hello"):
+        path = tmp_path / name
+        path.write_bytes(make_zip(content))
+        return path
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the default cache location out of the user's cache directory."""
+    monkeypatch.setenv("NEXKIT_CACHE_DIR", str(tmp_path / "default-cache"))
+
+
+# Test: TemplateCache
+def test_store_and_lookup(template_cache, archive):
+    """Test storing an archive and looking it up by release and asset."""
+    source = archive()
+    expected_sha = cache.sha256_file(source)
+
+    entry = template_cache.store("v1.0.0", ASSET_NAME, source)
+
+    assert not source.exists()
+    assert entry.sha256 == expected_sha
+    assert entry.path == template_cache.blob_path(expected_sha)
+    hit = template_cache.lookup("v1.0.0", ASSET_NAME)
+    assert hit is not None
+    assert hit.path.read_bytes() == make_zip()
+
+
+def test_lookup_miss(template_cache):
+    """Test lookup of an unknown release."""
+    assert template_cache.lookup("v9.9.9", ASSET_NAME) is None
+
+
+def test_lookup_digest_mismatch(template_cache, archive):
+    """Test that an expected digest that does not match is a miss."""
+    template_cache.store("v1.0.0", ASSET_NAME, archive())
+    assert template_cache.lookup("v1.0.0", ASSET_NAME, sha256="0" * 64) is None
+
+
+def test_store_deduplicates_identical_content(template_cache, archive):
+    """Test that identical archives share one blob."""
+    template_cache.store("v1.0.0", ASSET_NAME, archive("a.zip"))
+    template_cache.store("v1.0.1", ASSET_NAME, archive("b.zip"))
+
+    stats = template_cache.stats()
+    assert stats.entries == 2
+    assert stats.blobs == 1
+
+
+def test_prune_evicts_least_recently_used(template_cache, archive):
+    """Test LRU eviction order."""
+    old = template_cache.store("v1.0.0", ASSET_NAME, archive("a.zip", "old"))
+    time.sleep(0.01)
+    new = template_cache.store("v1.0.1", ASSET_NAME, archive("b.zip", "new"))
+
+    evicted = template_cache.prune(max_bytes=new.size)
+
+    assert [e.release for e in evicted] == ["v1.0.0"]
+    assert not old.path.exists()
+    assert new.path.exists()
+
+
+def test_prune_respects_recent_lookup(template_cache, archive):
+    """Test that a lookup refreshes recency."""
+    template_cache.store("v1.0.0", ASSET_NAME, archive("a.zip", "old"))
+    time.sleep(0.01)
+    template_cache.store("v1.0.1", ASSET_NAME, archive("b.zip", "new"))
+    time.sleep(0.01)
+    template_cache.lookup("v1.0.0", ASSET_NAME)
+
+    evicted = template_cache.prune(max_bytes=1)
+
+    assert [e.release for e in evicted] == ["v1.0.1", "v1.0.0"]
+
+
+def test_store_prunes_to_limit(tmp_path, archive):
+    """Test that storing enforces the size limit but keeps the new archive."""
+    small_cache = cache.TemplateCache(cache_dir=tmp_path / "cache", max_bytes=1)
+    small_cache.store("v1.0.0", ASSET_NAME, archive("a.zip", "old"))
+    entry = small_cache.store("v1.0.1", ASSET_NAME, archive("b.zip", "new"))
+
+    assert entry.path.exists()
+    assert [e.release for e in small_cache.entries()] == ["v1.0.1"]
+
+
+def test_clear(template_cache, archive):
+    """Test clearing the cache."""
+    entry = template_cache.store("v1.0.0", ASSET_NAME, archive())
+
+    freed = template_cache.clear()
+
+    assert freed == entry.size
+    assert template_cache.stats().entries == 0
+    assert not template_cache.cache_dir.exists()
+
+
+def test_max_cache_bytes_from_env(monkeypatch):
+    """Test the size limit environment override."""
+    monkeypatch.setenv("NEXKIT_CACHE_MAX_MB", "2")
+    assert cache.get_max_cache_bytes() == 2 * 1024 * 1024
+
+
+def _store_in_process(cache_dir: str, release: str, content: str) -> None:
+    """Store one archive from a separate process (see test_concurrent_stores_keep_every_entry)."""
+    source = Path(cache_dir).parent / f"{release}.zip"
+    source.write_bytes(make_zip(content))
+    cache.TemplateCache(cache_dir=Path(cache_dir), max_bytes=10 * 1024 * 1024).store(release, ASSET_NAME, source)
+
+
+def test_concurrent_stores_keep_every_entry(tmp_path):
+    """Test processes storing at the same time do not drop each other's entries or blobs."""
+    cache_dir = tmp_path / "cache"
+    releases = [f"v1.0.{i}" for i in range(8)]
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_store_in_process, [str(cache_dir)] * len(releases), releases, releases))
+
+    template_cache = cache.TemplateCache(cache_dir=cache_dir)
+    assert sorted(e.release for e in template_cache.entries()) == releases
+    assert len(list(template_cache.blobs_dir.iterdir())) == len(releases)
+    assert not template_cache.lock_path.exists()
+
+
+def test_prune_keeps_blobs_newer_than_operation(template_cache, archive):
+    """Test unindexed blobs are only deleted when they predate the prune."""
+    entry = template_cache.store("v1.0.0", ASSET_NAME, archive())
+    stale = template_cache.blob_path("a" * 64)
+    stale.write_bytes(b"stale")
+    old = time.time() - 60
+    os.utime(stale, (old, old))
+    fresh = template_cache.blob_path("b" * 64)
+    fresh.write_bytes(b"being stored by another process")
+    future = time.time() + 60
+    os.utime(fresh, (future, future))
+
+    template_cache.prune()
+
+    assert entry.path.exists()
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_index_lock_timeout(template_cache, archive, monkeypatch):
+    """Test a held lock makes updates fail with TemplateCacheError instead of racing."""
+    monkeypatch.setattr(cache, "INDEX_LOCK_TIMEOUT_SECONDS", 0.1)
+    template_cache.cache_dir.mkdir(parents=True)
+    template_cache.lock_path.write_text("other process")
+
+    with pytest.raises(cache.TemplateCacheError):
+        template_cache.store("v1.0.0", ASSET_NAME, archive())
+
+
+def test_index_lock_stale_is_stolen(template_cache, archive):
+    """Test a lock left behind by a crashed process does not block the cache."""
+    template_cache.cache_dir.mkdir(parents=True)
+    template_cache.lock_path.write_text("crashed")
+    old = time.time() - cache.INDEX_LOCK_STALE_SECONDS - 1
+    os.utime(template_cache.lock_path, (old, old))
+
+    entry = template_cache.store("v1.0.0", ASSET_NAME, archive())
+
+    assert template_cache.lookup("v1.0.0", ASSET_NAME).sha256 == entry.sha256
+
+
+def test_evict(template_cache, archive):
+    """Test evicting one entry keeps archives shared with other entries."""
+    template_cache.store("v1.0.0", ASSET_NAME, archive("a.zip", "same"))
+    shared = template_cache.store("v1.0.1", ASSET_NAME, archive("b.zip", "same"))
+
+    assert template_cache.evict("v1.0.0", ASSET_NAME).release == "v1.0.0"
+    assert shared.path.exists()
+    template_cache.evict("v1.0.1", ASSET_NAME)
+    assert not shared.path.exists()
+    assert template_cache.evict("v1.0.1", ASSET_NAME) is None
+
+
+# Test: download_template_from_github with cache
+def make_client(zip_bytes: bytes, calls: list, api_status: int = 200, requests: list = None, digest: str = None):
+    """Create an httpx client serving a fake release (with an ETag) and asset."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if requests is not None:
+            requests.append(request)
+        if request.url.path.endswith("/releases/latest"):
+            if api_status != 200:
+                raise httpx.ConnectError("offline", request=request)
+            if request.headers.get("if-none-match") == '"release-etag"':
+                return httpx.Response(304, headers={"ETag": '"release-etag"'})
+            return httpx.Response(200, headers={"ETag": '"release-etag"'}, json={
+                "tag_name": "v1.0.0",
+                "assets": [{
+                    "name": ASSET_NAME,
+                    "size": len(zip_bytes),
+                    "browser_download_url": f"https://example.invalid/{ASSET_NAME}",
+                    **({"digest": f"sha256:{digest}"} if digest else {}),
+                }],
+            })
+        # Streamed like a real transport, so downloads read it with iter_raw()
+        return httpx.Response(200, headers={"Content-Length": str(len(zip_bytes))}, stream=httpx.ByteStream(zip_bytes))
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_download_stores_then_hits_cache(tmp_path):
+    """Test that a second init for the same release skips the download."""
+    zip_bytes = make_zip()
+    calls = []
+    client = make_client(zip_bytes, calls)
+
+    path1, meta1 = download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+    path2, meta2 = download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+
+    assert meta1["cache"] == "stored"
+    assert meta2["cache"] == "hit"
+    assert path1 == path2
+    assert path2.read_bytes() == zip_bytes
+    # One asset download in total
+    assert sum(1 for c in calls if c.endswith(ASSET_NAME)) == 1
+    # Nothing written to the download directory
+    assert list(tmp_path.glob("*.zip")) == []
+
+
+def test_download_offline_uses_cache(tmp_path, monkeypatch):
+    """Test that init works offline from the cache."""
+    monkeypatch.setenv("NEXKIT_RELEASE_TTL", "0")
+    zip_bytes = make_zip()
+    download_template_from_github("copilot", tmp_path, client=make_client(zip_bytes, []), verbose=False, show_progress=False)
+
+    path, meta = download_template_from_github(
+        "copilot", tmp_path, client=make_client(zip_bytes, [], api_status=503), verbose=False, show_progress=False
+    )
+
+    assert meta["cache"] == "offline"
+    assert path.read_bytes() == zip_bytes
+
+
+# Test: conditional release metadata requests
+def test_release_metadata_fresh_within_ttl(tmp_path):
+    """Test that repeat runs within the TTL skip the API call entirely."""
+    calls = []
+    client = make_client(make_zip(), calls)
+
+    download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+    _, meta = download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+
+    assert meta["release_source"] == "fresh"
+    assert sum(1 for c in calls if c.endswith("/releases/latest")) == 1
+
+
+def test_release_metadata_revalidated_with_etag(tmp_path, monkeypatch):
+    """Test that stale metadata is revalidated with If-None-Match and a 304 is a hit."""
+    monkeypatch.setenv("NEXKIT_RELEASE_TTL", "0")
+    requests = []
+    client = make_client(make_zip(), [], requests=requests)
+
+    download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+    _, meta = download_template_from_github("copilot", tmp_path, client=client, verbose=False, show_progress=False)
+
+    api_requests = [r for r in requests if r.url.path.endswith("/releases/latest")]
+    assert "if-none-match" not in api_requests[0].headers
+    assert api_requests[1].headers["if-none-match"] == '"release-etag"'
+    assert meta["release_source"] == "revalidated"
+    assert meta["cache"] == "hit"
+
+
+def test_release_metadata_persisted(template_cache):
+    """Test persisting release metadata with validators."""
+    template_cache.save_release("https://api.example/latest", {"tag_name": "v1"}, etag='"abc"', last_modified="Mon")
+
+    loaded = template_cache.load_release("https://api.example/latest")
+
+    assert loaded.payload == {"tag_name": "v1"}
+    assert loaded.etag == '"abc"'
+    assert loaded.last_modified == "Mon"
+    assert loaded.is_fresh(60)
+    assert not loaded.is_fresh(0)
+
+
+def test_download_offline_without_cache_fails(tmp_path):
+    """Test that a fetch failure without a cached template still exits."""
+    with pytest.raises(typer.Exit):
+        download_template_from_github(
+            "copilot", tmp_path, client=make_client(make_zip(), [], api_status=503), verbose=False, show_progress=False
+        )
+
+
+def test_download_no_cache(tmp_path):
+    """Test that use_cache=False downloads into the download directory."""
+    path, meta = download_template_from_github(
+        "copilot", tmp_path, client=make_client(make_zip(), []), verbose=False, show_progress=False, use_cache=False
+    )
+
+    assert meta["cache"] is None
+    assert path == tmp_path / ASSET_NAME
+
+
+def test_download_without_cache_or_directory_is_buffered(tmp_path, monkeypatch):
+    """Test that without a cache or download directory the archive stays in memory."""
+    monkeypatch.chdir(tmp_path)
+    zip_bytes = make_zip()
+
+    buffer, meta = download_template_from_github(
+        "copilot", None, client=make_client(zip_bytes, []), verbose=False, show_progress=False, use_cache=False
+    )
+
+    with buffer:
+        assert buffer.read() == zip_bytes
+    assert meta["sha256"] == hashlib.sha256(zip_bytes).hexdigest()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_without_cache_leaves_cwd_untouched(tmp_path, monkeypatch):
+    """Test that init --no-cache extracts from memory and writes nothing to the cwd."""
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+    project = tmp_path / "project"
+
+    download_and_extract_template(
+        project, "copilot", "sh", verbose=False, client=make_client(make_zip("body"), []), use_cache=False
+    )
+
+    assert (project / "README.md").read_text() == "body"
+    assert list(work_dir.iterdir()) == []
+
+
+def test_extract_reports_progress_to_tracker(tmp_path):
+    """Test download bytes and extracted files are tracked as nested progress."""
+    tracker = StepTracker("Init")
+    zip_bytes = make_zip("body")
+
+    download_and_extract_template(
+        tmp_path / "project", "copilot", "sh", verbose=False, tracker=tracker,
+        client=make_client(zip_bytes, []), use_cache=False,
+    )
+
+    steps = {s["key"]: s for s in tracker.snapshot()}
+    assert steps["download"]["progress"]["bytes"]["done"] == len(zip_bytes)
+    assert steps["extract"]["progress"]["files"] == {"done": 1, "total": 1}
+    assert steps["zip-list"]["parent"] == "extract"
+    assert steps["extract"]["status"] == "done"
+
+
+def test_download_sha_mismatch_is_not_cached(tmp_path, monkeypatch):
+    """Test an archive failing the published SHA-256 is evicted, so offline init cannot use it."""
+    monkeypatch.setenv("NEXKIT_RELEASE_TTL", "0")
+    zip_bytes = make_zip()
+
+    with pytest.raises(typer.Exit):
+        download_template_from_github(
+            "copilot", tmp_path, client=make_client(zip_bytes, [], digest="0" * 64), verbose=False, show_progress=False
+        )
+
+    assert cache.TemplateCache().entries() == []
+    assert list(cache.TemplateCache().blobs_dir.iterdir()) == []
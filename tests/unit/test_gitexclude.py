@@ -0,0 +1,152 @@
+"""
+Unit tests for nexkit.gitexclude module.
+
+Matcher decisions are compared with ``git check-ignore --no-index`` for
+every file and directory in trees built from each rule set.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from nexkit import gitexclude
+from nexkit.gitignore import get_nexkit_section_content
+
+
+TREE = [
+    "top.txt", "sub/top.txt",
+    "a.log", "keep.log", "logs/b.log", "logs/keep.log",
+    "build/out.o", "build/keep.txt", "src/build/x.o",
+    "docs/a.md", "docs/sub/b.md", "README.md",
+    "deep/x.py", "a/deep/y.py", "a/b/deep/z.py", "a/z", "a/m/n/z",
+    "file1.txt", "fileA.txt", "bx", "ax", "c.c", "cc.c",
+    "#hash", "!bang", "trailing ",
+    ".specify/memory/constitution.md", "specs/001/spec.md", "nested/specs/002/plan.md",
+    ".github/prompts/nexkit.plan.prompt.md", ".github/prompts/team.prompt.md",
+    ".github/chatmodes/reviewer.md",
+    "x.tmp", "important.tmp", "sub/y.tmp",
+]
+
+RULE_SETS = {
+    "negation": {".gitignore": "*.log\n!keep.log\n"},
+    "excluded-directory": {".gitignore": "build/\n!build/keep.txt\n"},
+    "nested-override": {".gitignore": "*.md\n", "docs/.gitignore": "!*.md\nsub/\n"},
+    "anchoring": {".gitignore": "/top.txt\ndocs/*.md\n**/deep/*.py\na/**/z\n"},
+    "wildcards": {".gitignore": "file[0-9].txt\n[!a]x\n?.c\n"},
+    "escapes": {".gitignore": "\\#hash\n\\!bang\ntrailing\\ \n# comment\n\n"},
+    "excludes-files": {"excludesfile": "*.tmp\n", ".git/info/exclude": "!important.tmp\n"},
+    "section-then-negation": {".gitignore": get_nexkit_section_content("copilot") + "!specs/\n"},
+    "nexkit-section": {".gitignore": "node_modules/\n" + get_nexkit_section_content("copilot")},
+}
+
+
+@pytest.fixture
+def isolated_git_config(tmp_path, monkeypatch):
+    """Keep the user's git configuration out of both git and the matcher."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(home / ".config"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+    return home
+
+
+def make_tree(root: Path, rules: dict) -> Path:
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    for name in TREE:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+    for name, content in rules.items():
+        if name == "excludesfile":
+            excludes = root.parent / "global-ignore"
+            excludes.write_text(content, encoding="utf-8")
+            subprocess.run(["git", "config", "core.excludesFile", str(excludes)], cwd=root, check=True)
+            continue
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return root
+
+
+def all_paths(root: Path) -> list:
+    paths = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != ".git"]
+        rel = Path(directory).relative_to(root).as_posix()
+        for name in dirnames + filenames:
+            paths.append((name if rel == "." else f"{rel}/{name}", name in dirnames))
+    return sorted(paths)
+
+
+def check_ignore(root: Path, paths: list) -> dict:
+    """Return path -> (ignored, line) as reported by git."""
+    result = subprocess.run(
+        ["git", "check-ignore", "--no-index", "--stdin", "-z", "-v", "-n"],
+        cwd=root, input=b"".join(os.fsencode(p) + b"\0" for p in paths), capture_output=True,
+    )
+    assert result.returncode in (0, 1), result.stderr
+    fields = result.stdout.split(b"\0")
+    decisions = {}
+    for i in range(0, len(fields) - 1, 4):
+        source, line, pattern, path = fields[i:i + 4]
+        decisions[os.fsdecode(path)] = (bool(source) and not pattern.startswith(b"!"), int(line) if line else None)
+    return decisions
+
+
+@pytest.mark.parametrize("rules", RULE_SETS.values(), ids=RULE_SETS.keys())
+def test_matches_git_check_ignore(tmp_path, isolated_git_config, rules):
+    """Test every path is decided exactly as git decides it."""
+    root = make_tree(tmp_path / "repo", rules)
+    paths = all_paths(root)
+    expected = check_ignore(root, [p for p, _ in paths])
+
+    matcher = gitexclude.IgnoreMatcher.for_repository(root, root / ".git")
+    actual = {}
+    for path, is_dir in paths:
+        ignored, rule = matcher.explain(path, is_dir)
+        actual[path] = (ignored, rule.line if rule else None)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("line, pattern, negated, directory_only", [
+    ("foo", "foo", False, False),
+    ("!foo/", "foo", True, True),
+    ("\\!foo", "!foo", False, False),
+    ("\\#foo", "#foo", False, False),
+    ("foo   ", "foo", False, False),
+    ("foo\\ ", "foo\\ ", False, False),
+])
+def test_compile_rule(line, pattern, negated, directory_only):
+    """Test prefixes, trailing slashes and trailing spaces are parsed like git."""
+    rule = gitexclude.compile_rule(line, Path(".gitignore"), 1)
+    assert (rule.pattern, rule.negated, rule.directory_only) == (pattern, negated, directory_only)
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# comment", "!", "/"])
+def test_compile_rule_skips_non_patterns(line):
+    """Test blank lines, comments and empty patterns produce no rule."""
+    assert gitexclude.compile_rule(line, Path(".gitignore"), 1) is None
+
+
+def test_excludes_file_from_config(tmp_path, isolated_git_config):
+    """Test core.excludesFile is read from config, with the XDG default otherwise."""
+    common_dir = tmp_path / ".git"
+    common_dir.mkdir()
+    assert gitexclude.get_excludes_file(common_dir) == isolated_git_config / ".config" / "git" / "ignore"
+
+    (isolated_git_config / ".gitconfig").write_text("[core]\n\texcludesFile = ~/global-ignore\n", encoding="utf-8")
+    assert gitexclude.get_excludes_file(common_dir) == isolated_git_config / "global-ignore"
+
+    (common_dir / "config").write_text('[user]\n\tname = x\n[core]\n\texcludesfile = "/repo ignore" ; note\n', encoding="utf-8")
+    assert gitexclude.get_excludes_file(common_dir) == Path("/repo ignore")
+
+
+def test_describe_relative_to_root(tmp_path):
+    """Test rules print like git check-ignore -v."""
+    rule = gitexclude.compile_rule("!specs/", tmp_path / "docs" / ".gitignore", 3)
+    assert rule.describe(tmp_path) == "docs/.gitignore:3:!specs/"
@@ -5,8 +5,11 @@ Tests cover git detection, exclusion patterns, file operations,
 error handling, and edge cases.
 """
 
+import os
 import pytest
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from nexkit import gitignore
@@ -149,11 +152,13 @@ def test_get_tracked_nexkit_files_not_git_repo(tmp_path):
         gitignore.get_tracked_nexkit_files(non_repo)
 
 
-@patch("subprocess.run", side_effect=FileNotFoundError)
-def test_get_tracked_nexkit_files_git_not_installed(mock_run, temp_repo):
-    """Test getting tracked files raises error when git not installed and verifies subprocess.run is called."""
-    with pytest.raises(gitignore.GitNotInstalledError):
-        gitignore.get_tracked_nexkit_files(temp_repo)
+def test_get_tracked_nexkit_files_git_not_installed(temp_repo):
+    """Test getting tracked files raises error when git is needed but not installed and verifies subprocess.run is called."""
+    # A split index can only be listed by git
+    subprocess.run(["git", "update-index", "--split-index"], cwd=temp_repo, check=True, capture_output=True)
+    with patch("subprocess.run", side_effect=FileNotFoundError) as mock_run:
+        with pytest.raises(gitignore.GitNotInstalledError):
+            gitignore.get_tracked_nexkit_files(temp_repo)
     # Assert that subprocess.run was called at least once
     assert mock_run.call_count > 0
     # Optionally, check the arguments of the first call
@@ -408,3 +413,382 @@ def test_add_nexkit_exclusions_atomic(temp_repo_with_gitignore):
     
     # Ensure temp file doesn't exist after (cleaned up)
     assert not temp_file.exists()
+
+
+# Test: Repository handle
+def test_open_repository(temp_repo):
+    """Test resolving a repository from a subdirectory."""
+    subdir = temp_repo / "a" / "b"
+    subdir.mkdir(parents=True)
+
+    repo = gitignore.open_repository(subdir)
+
+    assert repo.root == temp_repo.resolve()
+    assert repo.git_dir == temp_repo.resolve() / ".git"
+    assert repo.common_dir == repo.git_dir
+    assert repo.gitdir_file is None
+    assert repo.gitignore_path == temp_repo.resolve() / ".gitignore"
+
+
+def test_open_repository_not_git_repo(tmp_path):
+    """Test that a plain directory raises NotGitRepositoryError."""
+    with pytest.raises(gitignore.NotGitRepositoryError):
+        gitignore.open_repository(tmp_path)
+
+
+def test_open_repository_linked_worktree(temp_repo_with_nexkit_files, tmp_path):
+    """Test that a linked worktree (.git file) resolves its own and the common git dir."""
+    worktree = tmp_path / "worktree"
+    subprocess.run(
+        ["git", "worktree", "add", str(worktree)],
+        cwd=temp_repo_with_nexkit_files,
+        check=True,
+        capture_output=True
+    )
+
+    repo = gitignore.open_repository(worktree)
+
+    assert repo.root == worktree.resolve()
+    assert repo.gitdir_file == worktree.resolve() / ".git"
+    assert repo.common_dir == (temp_repo_with_nexkit_files / ".git").resolve()
+    assert repo.git_dir.parent == repo.common_dir / "worktrees"
+
+
+def test_open_repository_without_git_installed(temp_repo):
+    """Test that discovery works without starting git."""
+    with patch("subprocess.run", side_effect=FileNotFoundError):
+        assert gitignore.open_repository(temp_repo).root == temp_repo.resolve()
+
+
+# Test: Tracked file query
+@pytest.mark.parametrize("pattern, expected", [
+    (".specify/", [":(glob)**/.specify/**"]),
+    (".github/chatmodes/", [":(glob).github/chatmodes/**"]),
+    (".github/prompts/nexkit.*", [":(glob).github/prompts/nexkit.*", ":(glob).github/prompts/nexkit.*/**"]),
+    ("/build", [":(glob)build", ":(glob)build/**"]),
+    ("*.log", [":(glob)**/*.log", ":(glob)**/*.log/**"]),
+])
+def test_pattern_to_pathspecs(pattern, expected):
+    """Test translation of .gitignore patterns to glob pathspecs."""
+    assert gitignore.pattern_to_pathspecs(pattern) == expected
+
+
+def test_get_tracked_nexkit_files_without_git_installed(temp_repo_with_nexkit_files):
+    """Test tracked files are read from the index without starting git."""
+    expected = gitignore.get_tracked_nexkit_files(temp_repo_with_nexkit_files)
+    with patch("subprocess.run", side_effect=FileNotFoundError) as mock_run:
+        tracked = gitignore.get_tracked_nexkit_files(temp_repo_with_nexkit_files)
+    assert mock_run.call_count == 0
+    assert tracked and tracked == expected
+
+
+@pytest.mark.parametrize("pattern, matches, misses", [
+    (".specify/", [".specify/a.md", "sub/.specify/b/c.md"], [".specify", "x.specify/a.md"]),
+    (".github/prompts/nexkit.*", [".github/prompts/nexkit.plan.md", ".github/prompts/nexkit.x/y"],
+     ["sub/.github/prompts/nexkit.plan.md", ".github/prompts/nexkit/plan.md"]),
+    ("/build", ["build", "build/out.o"], ["src/build"]),
+    ("*.log", ["a.log", "logs/b.log"], ["a.log.txt"]),
+    ("a/**/b", ["a/b", "a/x/y/b"], ["ab", "x/a/b"]),
+    ("[!a]b", ["cb", "d/cb"], ["ab", "/b"]),
+])
+def test_pattern_to_regex(pattern, matches, misses):
+    """Test the regex translation matches what the pathspecs match."""
+    import re
+    regex = re.compile(gitignore.pattern_to_regex(pattern), re.DOTALL)
+    assert all(regex.fullmatch(path) for path in matches)
+    assert not any(regex.fullmatch(path) for path in misses)
+
+
+@pytest.mark.parametrize("index_args, git_calls", [
+    (["--index-version", "2"], 0),
+    (["--index-version", "4"], 0),
+    (["--split-index"], 1),
+])
+def test_get_tracked_nexkit_files_matches_patterns_exactly(temp_repo, index_args, git_calls):
+    """Test the index reader and the ls-files fallback match the section patterns exactly."""
+    files = [
+        ".specify/memory/constitution.md",
+        "specs/001/spec.md",
+        "docs/specs/nested.md",
+        ".github/prompts/nexkit.plan.prompt.md",
+        ".github/prompts/team.prompt.md",
+        ".github/chatmodes/reviewer.md",
+        'specs/odd "name"\nwith newline.md',
+    ]
+    for name in files:
+        path = temp_repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=temp_repo, check=True, capture_output=True)
+    subprocess.run(["git", "update-index", *index_args], cwd=temp_repo, check=True, capture_output=True)
+
+    with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+        tracked = gitignore.get_tracked_nexkit_files(temp_repo, "copilot")
+
+    assert mock_run.call_count == git_calls
+    assert sorted(map(str, tracked)) == sorted(f for f in files if f != ".github/prompts/team.prompt.md")
+
+
+# Test: Streaming section edits
+def test_add_nexkit_exclusions_appends_without_rewriting(temp_repo):
+    """Test existing bytes are left untouched, even when not valid UTF-8."""
+    gitignore_path = temp_repo / ".gitignore"
+    original = b"caf\xe9/\r\nno-newline"
+    gitignore_path.write_bytes(original)
+    
+    gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+    
+    content = gitignore_path.read_bytes()
+    assert content.startswith(original + b"\n\n" + gitignore.NEXKIT_SECTION_MARKER.encode())
+    assert content.endswith(gitignore.NEXKIT_SECTION_END_MARKER.encode() + b"\n")
+
+
+def test_find_nexkit_section(temp_repo):
+    """Test the section span covers the marker line through the end marker line."""
+    gitignore_path = temp_repo / ".gitignore"
+    section = gitignore.get_nexkit_section_content("copilot").lstrip("\n")
+    gitignore_path.write_text("node_modules/\n\n" + section + "dist/\n", encoding="utf-8")
+    
+    start, end = gitignore.find_nexkit_section(gitignore_path)
+    
+    assert gitignore_path.read_bytes()[start:end] == section.encode()
+    assert gitignore.find_nexkit_section(temp_repo / "missing") is None
+
+
+def test_remove_nexkit_exclusions_streams_bytes(temp_repo):
+    """Test removal keeps surrounding bytes (CRLF, non-UTF-8) and drops trailing blank lines."""
+    gitignore_path = temp_repo / ".gitignore"
+    before = b"caf\xe9/\r\n\r\nbuild/\r\n"
+    after = b"\n# mine\nvendor/\n\n\n"
+    gitignore_path.write_bytes(before + gitignore.get_nexkit_section_content("claude").encode() + after)
+    
+    gitignore.remove_nexkit_exclusions(temp_repo)
+    
+    # The blank line the section was appended after stays, as before
+    assert gitignore_path.read_bytes() == before + b"\n\n# mine\nvendor/\n"
+    assert not (temp_repo / ".gitignore.tmp").exists()
+
+
+def test_large_gitignore_memory_is_bounded(temp_repo):
+    """Test add and remove do not load a large .gitignore into memory."""
+    import tracemalloc
+    gitignore_path = temp_repo / ".gitignore"
+    vendored = b"".join(b"vendor/pkg-%06d/\n" % i for i in range(400_000))  # ~8 MB
+    gitignore_path.write_bytes(vendored)
+    
+    tracemalloc.start()
+    try:
+        gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+        assert gitignore.has_nexkit_section(gitignore_path)
+        gitignore.remove_nexkit_exclusions(temp_repo)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    assert gitignore_path.read_bytes() == vendored
+    assert peak < len(vendored) // 8
+
+
+# Test: Section upsert
+def test_add_nexkit_exclusions_unchanged_does_not_write(temp_repo):
+    """Test an up-to-date section leaves the file (and its mtime) untouched."""
+    gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+    gitignore_path = temp_repo / ".gitignore"
+    before = gitignore_path.stat()
+    
+    with patch.object(gitignore, "_replace_section") as replace, patch.object(gitignore, "_append_section") as append:
+        result = gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+    
+    assert result.already_configured and not result.updated
+    assert replace.call_count == 0 and append.call_count == 0
+    after = gitignore_path.stat()
+    assert (after.st_mtime_ns, after.st_ino) == (before.st_mtime_ns, before.st_ino)
+
+
+def test_add_nexkit_exclusions_switches_agent_in_place(temp_repo):
+    """Test an explicit agent replaces the section's patterns, keeping surrounding content."""
+    gitignore_path = temp_repo / ".gitignore"
+    gitignore_path.write_text("node_modules/\n", encoding="utf-8")
+    gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+    with open(gitignore_path, "a", encoding="utf-8") as f:
+        f.write("dist/\n")
+    
+    result = gitignore.add_nexkit_exclusions(temp_repo, "claude")
+    
+    assert result.updated
+    assert result.patterns_affected == gitignore.AGENT_MODE_PATTERNS["claude"]
+    assert result.patterns_removed == gitignore.AGENT_MODE_PATTERNS["copilot"]
+    content = gitignore_path.read_text(encoding="utf-8")
+    assert content == "node_modules/\n" + gitignore.get_nexkit_section_content("claude") + "dist/\n"
+
+
+def test_add_nexkit_exclusions_second_agent(temp_repo):
+    """Test several agents are covered by one section."""
+    gitignore.add_nexkit_exclusions(temp_repo, "copilot")
+    
+    result = gitignore.add_nexkit_exclusions(temp_repo, ["copilot", "claude"])
+    
+    section = gitignore.read_nexkit_section(temp_repo / ".gitignore")
+    assert result.patterns_affected == gitignore.AGENT_MODE_PATTERNS["claude"]
+    assert result.patterns_removed == []
+    assert section.agents == ["copilot", "claude"]
+    assert section.patterns == gitignore.get_patterns_for_agents(["copilot", "claude"])
+
+
+def test_add_nexkit_exclusions_detected_agent_only_adds(temp_repo):
+    """Test auto-detection adds the detected agent's patterns without dropping others."""
+    gitignore.add_nexkit_exclusions(temp_repo, "claude")
+    (temp_repo / ".github" / "prompts").mkdir(parents=True)
+    
+    result = gitignore.add_nexkit_exclusions(temp_repo)
+    
+    section = gitignore.read_nexkit_section(temp_repo / ".gitignore")
+    assert result.patterns_removed == []
+    assert section.agents == ["claude", "copilot"]
+    assert set(gitignore.AGENT_MODE_PATTERNS["claude"]) <= set(section.patterns)
+    assert set(gitignore.AGENT_MODE_PATTERNS["copilot"]) <= set(section.patterns)
+
+
+# Test: Untracking
+def test_untrack_files_single_process(temp_repo):
+    """Test many files, including glob characters and newlines, are untracked literally by one git rm."""
+    files = [f"specs/{i:04d}-{'x' * 40}.md" for i in range(2000)]
+    files += ["specs/star*.md", "specs/[abc].md", "specs/new\nline.md", "specs/keep.md"]
+    for name in files:
+        path = temp_repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+    (temp_repo / "specs" / "a.md").write_text("x", encoding="utf-8")  # Matched by the glob-like names if expanded
+    subprocess.run(["git", "add", "."], cwd=temp_repo, check=True, capture_output=True)
+    untrack = [Path(name) for name in files if name != "specs/keep.md"]
+    progress = []
+    
+    with patch("subprocess.Popen", wraps=subprocess.Popen) as popen:
+        removed = gitignore.untrack_files(temp_repo, untrack, on_progress=lambda done, total: progress.append((done, total)))
+    
+    assert popen.call_count == 1
+    assert removed == len(untrack)
+    assert progress[-1] == (len(untrack), len(untrack))
+    remaining = subprocess.run(["git", "ls-files", "-z"], cwd=temp_repo, check=True, capture_output=True).stdout
+    assert sorted(remaining.decode().split("\0")[:-1]) == ["specs/a.md", "specs/keep.md"]
+    assert all((temp_repo / f).exists() for f in untrack)
+
+
+def test_untrack_files_failure(temp_repo):
+    """Test git errors surface as GitIgnoreError."""
+    with pytest.raises(gitignore.GitIgnoreError, match="git rm --cached failed"):
+        gitignore.untrack_files(temp_repo, [Path("not-tracked.md")])
+
+
+def test_untrack_files_survives_stderr_flood(temp_repo, tmp_path, monkeypatch):
+    """Test a burst of git warnings larger than a pipe buffer cannot deadlock git rm."""
+    repo = gitignore.open_repository(temp_repo)
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    fake_git = fake_bin / "git"
+    fake_git.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "paths = sys.stdin.buffer.read().split(b'\\0')[:-1]\n"
+        "sys.stderr.write('warning: line ending will be replaced\\n' * 20000)\n"
+        "sys.stderr.flush()\n"
+        "for p in paths:\n"
+        "    sys.stdout.write(\"rm '%s'\\n\" % p.decode())\n",
+        encoding="utf-8",
+    )
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_bin}{os.pathsep}{os.environ['PATH']}")
+    outcome = []
+    
+    worker = threading.Thread(
+        target=lambda: outcome.append(gitignore.untrack_files(temp_repo, [Path("specs/a.md"), Path("specs/b.md")], repo=repo)),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=30)
+    
+    assert not worker.is_alive(), "git rm output handling deadlocked"
+    assert outcome == [2]
+
+
+def test_untrack_files_locked_index(temp_repo):
+    """Test git exiting on a held index.lock surfaces as GitIgnoreError, not BrokenPipeError."""
+    (temp_repo / ".git" / "index.lock").write_text("", encoding="utf-8")
+    # More than a pipe buffer of paths, so git can exit before reading them all
+    untrack = [Path(f"specs/{i:05d}-{'x' * 60}.md") for i in range(5000)]
+    
+    with pytest.raises(gitignore.GitIgnoreError, match="index.lock"):
+        gitignore.untrack_files(temp_repo, untrack)
+
+
+def test_untrack_files_git_exits_before_reading(temp_repo, tmp_path, monkeypatch):
+    """Test a git that rejects its options without reading stdin reports its own message."""
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    fake_git = fake_bin / "git"
+    fake_git.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "sys.stderr.write(\"error: unknown option `pathspec-from-file=-'\\n\")\n"
+        "sys.exit(129)\n",
+        encoding="utf-8",
+    )
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_bin}{os.pathsep}{os.environ['PATH']}")
+    untrack = [Path(f"specs/{i:05d}-{'x' * 60}.md") for i in range(5000)]
+    
+    with pytest.raises(gitignore.GitIgnoreError, match="unknown option"):
+        gitignore.untrack_files(temp_repo, untrack, repo=gitignore.open_repository(temp_repo))
+
+
+def test_format_cleanup_guidance_is_bounded(temp_repo):
+    """Test guidance for thousands of files shows a sample and a count, not every path."""
+    tracked_files = [Path(f"specs/file{i}.md") for i in range(5000)]
+    guidance = gitignore.format_cleanup_guidance(tracked_files, temp_repo)
+    
+    assert "Found 5000 tracked file(s)" in guidance
+    assert f"... and {5000 - gitignore.GUIDANCE_SAMPLE_SIZE} more" in guidance
+    assert "specs/file4999.md" not in guidance
+    assert "nexkit add-exclusion --untrack" in guidance
+    assert len(guidance) < 2000
+
+
+# Test: Agent detection
+def test_detect_agents_reports_all_with_evidence(temp_repo):
+    """Test every agent present is detected, with the paths that gave it away."""
+    for path in [".github/prompts", ".github/workflows", ".claude/commands", ".claude/modes", ".roo"]:
+        (temp_repo / path).mkdir(parents=True)
+    
+    detected = gitignore.detect_agents(temp_repo)
+    
+    assert detected == [
+        gitignore.DetectedAgent("copilot", [".github/prompts"]),
+        gitignore.DetectedAgent("claude", [".claude/commands", ".claude/modes"]),
+    ]
+    assert gitignore.detect_agent_from_project(temp_repo) == "copilot"
+
+
+def test_detect_agents_lists_only_present_directories(temp_repo):
+    """Test detection reads the root plus the agent directories present, without stat probes."""
+    (temp_repo / ".claude" / "commands").mkdir(parents=True)
+    (temp_repo / "src").mkdir()
+    
+    with patch("os.scandir", wraps=os.scandir) as scandir, patch.object(Path, "exists") as exists:
+        detected = gitignore.detect_agents(temp_repo)
+    
+    assert [found.agent for found in detected] == ["claude"]
+    assert [Path(c.args[0]) for c in scandir.call_args_list] == [temp_repo, temp_repo / ".claude"]
+    assert exists.call_count == 0
+
+
+def test_exclusions_cover_every_detected_agent(temp_repo):
+    """Test add-exclusion and status cover all detected agents, not just the first."""
+    (temp_repo / ".github" / "prompts").mkdir(parents=True)
+    (temp_repo / ".claude" / "commands").mkdir(parents=True)
+    
+    result = gitignore.add_nexkit_exclusions(temp_repo)
+    status = gitignore.check_exclusion_status(temp_repo)
+    
+    assert result.patterns_affected == gitignore.get_patterns_for_agents(["copilot", "claude"])
+    assert status.missing_patterns == []
+    assert [found.agent for found in status.agents] == ["copilot", "claude"]
@@ -0,0 +1,134 @@
+"""
+Unit tests for nexkit.gitindex module.
+
+The parser is checked against ``git ls-files`` for every supported index
+version, including v4 prefix compression and SHA-256 repositories.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from nexkit import gitindex
+
+
+FILES = [
+    ".specify/memory/constitution.md",
+    ".specify/scripts/bash/common.sh",
+    "README.md",
+    "docs/specs/nested.md",
+    "specs/001-feature/plan.md",
+    "specs/001-feature/spec.md",
+    "specs/002-other/spec.md",
+    "src/" + "deep/" * 20 + "module.py",
+    "src/" + "x" * 200 + ".py",
+    'specs/odd "name"\nwith newline.md',
+    "specs/ünïcode.md",
+]
+EVERYTHING = re.compile(rb".*", re.DOTALL)
+
+
+def git(repo: Path, *args: str) -> bytes:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True).stdout
+
+
+def ls_files(repo: Path) -> list:
+    return [name.decode("utf-8") for name in git(repo, "ls-files", "-z").split(b"\0") if name]
+
+
+def make_repo(path: Path, *init_args: str) -> Path:
+    path.mkdir()
+    git(path, "init", *init_args)
+    for name in FILES:
+        file = path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("x", encoding="utf-8")
+    git(path, "add", ".")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return make_repo(tmp_path / "repo")
+
+
+def index_version(repo: Path) -> int:
+    return int.from_bytes((repo / ".git" / "index").read_bytes()[4:8], "big")
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_matches_git_ls_files(repo, version):
+    """Test every index version lists the same paths as git."""
+    if version == 3:
+        # Extended flags (intent-to-add) are what make git write version 3
+        (repo / "later.md").write_text("x", encoding="utf-8")
+        git(repo, "add", "-N", "later.md")
+    git(repo, "update-index", "--index-version", str(version))
+    assert index_version(repo) == version
+
+    assert gitindex.read_matching_paths(repo / ".git" / "index", EVERYTHING) == ls_files(repo)
+
+
+@pytest.mark.parametrize("version", [2, 4])
+def test_filters_with_pattern(repo, version):
+    """Test only matching paths are returned."""
+    git(repo, "update-index", "--index-version", str(version))
+    pattern = re.compile(rb"specs/.*", re.DOTALL)
+
+    paths = gitindex.read_matching_paths(repo / ".git" / "index", pattern)
+
+    assert paths == [name for name in ls_files(repo) if name.startswith("specs/")]
+
+
+@pytest.mark.parametrize("version", [2, 4])
+def test_long_path(repo, version):
+    """Test paths longer than the 12-bit name length field."""
+    blob = git(repo, "hash-object", "-w", "README.md").decode().strip()
+    long_name = "long/" + "d" * 200 + "/" + "/".join(["segment"] * 520) + ".md"
+    git(repo, "update-index", "--add", "--cacheinfo", f"100644,{blob},{long_name}")
+    git(repo, "update-index", "--index-version", str(version))
+
+    paths = gitindex.read_matching_paths(repo / ".git" / "index", EVERYTHING)
+
+    assert len(long_name) > 0xFFF
+    assert long_name in paths
+    assert paths == ls_files(repo)
+
+
+def test_sha256_repository(tmp_path):
+    """Test object ids of SHA-256 repositories are skipped correctly."""
+    try:
+        repo = make_repo(tmp_path / "repo", "--object-format=sha256")
+    except subprocess.CalledProcessError:
+        pytest.skip("git does not support SHA-256 repositories")
+
+    paths = gitindex.read_matching_paths(repo / ".git" / "index", EVERYTHING, hash_size=32)
+
+    assert paths == ls_files(repo)
+
+
+def test_missing_index(tmp_path):
+    """Test a repository without an index has no tracked paths."""
+    assert gitindex.read_matching_paths(tmp_path / "index", EVERYTHING) == []
+
+
+def test_split_index_unsupported(repo):
+    """Test split indexes are left to git."""
+    git(repo, "update-index", "--split-index")
+    with pytest.raises(gitindex.UnsupportedIndexError, match="split index"):
+        gitindex.read_matching_paths(repo / ".git" / "index", EVERYTHING)
+
+
+@pytest.mark.parametrize("content, message", [
+    (b"DIRC", "truncated"),
+    (b"NOPE\x00\x00\x00\x02\x00\x00\x00\x00", "not a git index"),
+    (b"DIRC\x00\x00\x00\x05\x00\x00\x00\x00", "version 5"),
+])
+def test_invalid_index(tmp_path, content, message):
+    """Test malformed or unknown indexes are rejected."""
+    index = tmp_path / "index"
+    index.write_bytes(content)
+    with pytest.raises(gitindex.UnsupportedIndexError, match=message):
+        gitindex.read_matching_paths(index, EVERYTHING)
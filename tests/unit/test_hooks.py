@@ -0,0 +1,165 @@
+"""
+Unit tests for nexkit.hooks and the nexkit.precommit guard script.
+"""
+
+import io
+import re
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from nexkit import hooks, precommit
+from nexkit.gitignore import pattern_to_regex
+
+
+SAMPLE_PATHS = [
+    "README.md", "src/main.py",
+    ".specify", ".specify/memory/constitution.md", "x.specify/a", "a/.specify/b", "a/.specifyx",
+    "specs/001/spec.md", "specs", "docs/specs/plan.md", "specsx/a", "myspecs/a",
+    ".github/prompts/nexkit.plan.prompt.md", ".github/prompts/nexkit.", ".github/prompts/team.prompt.md",
+    ".github/prompts/nexkit.x/y", "a/.github/prompts/nexkit.plan.prompt.md",
+    ".github/chatmodes/reviewer.md", ".github/chatmodes", ".github/chatmodesx/a",
+    ".claude/commands/nexkit.specify.md", ".claude/modes/a.md", ".claude/commands/other.md",
+    "vendor", "a/vendor", "a/vendor/b", "vendorx", "build.log", "a/b.log", "a/b.logx",
+    "tmp-1/a", "a/tmp-2", "atmp-1", "doc/api/x.md", "x/doc/api/y.md", "data/raw[1]",
+]
+
+EXTRA_PATTERNS = ["vendor", "/build.log", "tmp-*", "*.log", "doc/api/", "data/raw[[]1]"]
+
+
+def guard(rules, paths):
+    """Return the paths the guard rejects."""
+    return [p for p in paths if precommit.Rules(rules).matches(p.encode("utf-8"))]
+
+
+@pytest.mark.parametrize("pattern", hooks.guard_patterns() + EXTRA_PATTERNS)
+def test_rules_match_pattern_regex(pattern):
+    """Test each pattern's rules reject exactly the paths pattern_to_regex matches."""
+    regex = re.compile(pattern_to_regex(pattern), re.DOTALL)
+    expected = [p for p in SAMPLE_PATHS if regex.fullmatch(p)]
+
+    assert guard(hooks.compile_guard_rules([pattern]), SAMPLE_PATHS) == expected
+
+
+def test_default_rules_need_no_regex():
+    """Test the default patterns compile to plain string rules."""
+    rules = hooks.compile_guard_rules()
+
+    assert rules
+    assert not [rule for rule in rules if rule.startswith("regex:")]
+    assert len(rules) == len(set(rules))
+
+
+def test_precommit_rejects_staged_nexkit_files(capsys):
+    """Test the guard fails and lists offending paths."""
+    stdin = io.BytesIO(b"README.md\0specs/001/spec.md\0.specify/memory/constitution.md\0")
+
+    assert precommit.main(hooks.compile_guard_rules(), stdin) == 1
+
+    err = capsys.readouterr().err
+    assert "2 file(s)" in err
+    assert "specs/001/spec.md" in err
+    assert "README.md" not in err
+    assert "--untrack" in err
+
+
+def test_precommit_samples_many_files(capsys):
+    """Test long lists are summarised."""
+    stdin = io.BytesIO(b"".join(b"specs/%d.md\0" % i for i in range(25)))
+
+    assert precommit.main(["prefix:specs/"], stdin) == 1
+
+    assert "... and 15 more" in capsys.readouterr().err
+
+
+def test_precommit_allows_other_files():
+    """Test the guard passes when nothing excluded is staged."""
+    stdin = io.BytesIO(b"README.md\0src/main.py\0")
+
+    assert precommit.main(hooks.compile_guard_rules(), stdin) == 0
+    assert precommit.main(hooks.compile_guard_rules(), io.BytesIO(b"")) == 0
+
+
+def test_precommit_invalid_rule(capsys):
+    """Test a malformed hook reports itself instead of passing silently."""
+    assert precommit.main(["specs/"], io.BytesIO(b"specs/a\0")) == 2
+    assert "nexkit hook install" in capsys.readouterr().err
+
+
+# Test: install/uninstall
+@pytest.fixture
+def repo(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+def test_install_and_uninstall(repo):
+    """Test the hook is written executable and removed again."""
+    result = hooks.install_precommit_hook(repo)
+
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    assert result.changed and result.hook_path == hook
+    assert result.chained_hook is None
+    assert hooks.HOOK_MARKER in hook.read_text(encoding="utf-8")
+    assert hook.stat().st_mode & 0o111
+
+    assert hooks.install_precommit_hook(repo).changed is False
+
+    assert hooks.uninstall_precommit_hook(repo).changed is True
+    assert not hook.exists()
+    assert hooks.uninstall_precommit_hook(repo).changed is False
+
+
+def test_install_chains_existing_hook(repo):
+    """Test a pre-existing hook is kept, run first and restored on uninstall."""
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    hook.parent.mkdir(exist_ok=True)
+    hook.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+
+    result = hooks.install_precommit_hook(repo)
+
+    chained = hook.with_name(hooks.CHAINED_HOOK_NAME)
+    assert result.chained_hook == chained
+    assert chained.read_text(encoding="utf-8") == "#!/bin/sh\nexit 0\n"
+
+    result = hooks.uninstall_precommit_hook(repo)
+
+    assert result.chained_hook == hook
+    assert hook.read_text(encoding="utf-8") == "#!/bin/sh\nexit 0\n"
+    assert not chained.exists()
+
+
+def test_install_refuses_to_overwrite_chained_hook(repo):
+    """Test an existing hook is never overwritten."""
+    hooks_dir = repo / ".git" / "hooks"
+    hooks_dir.mkdir(exist_ok=True)
+    (hooks_dir / "pre-commit").write_text("#!/bin/sh\n", encoding="utf-8")
+    (hooks_dir / hooks.CHAINED_HOOK_NAME).write_text("#!/bin/sh\n", encoding="utf-8")
+
+    with pytest.raises(hooks.HookError, match="remove one of them"):
+        hooks.install_precommit_hook(repo)
+
+
+def test_install_honours_core_hooks_path(repo):
+    """Test core.hooksPath is used instead of .git/hooks."""
+    subprocess.run(["git", "config", "core.hooksPath", ".githooks"], cwd=repo, check=True)
+
+    result = hooks.install_precommit_hook(repo)
+
+    assert result.hook_path == repo / ".githooks" / "pre-commit"
+    assert result.hook_path.exists()
+
+
+def test_guard_script_imports_only_sys():
+    """Test the guard script stays free of nexkit and third-party imports."""
+    import ast
+
+    tree = ast.parse(Path(precommit.__file__).read_text(encoding="utf-8"))
+    imported = {
+        alias.name
+        for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+        for alias in node.names
+    }
+    # re is imported only for regex: rules, which the default patterns never need
+    assert imported <= {"sys", "re"}
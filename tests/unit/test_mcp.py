@@ -0,0 +1,217 @@
+"""
+Unit tests for nexkit.mcp module.
+
+Tests cover argument tokenisation, the mtime/size-invalidated parse cache,
+project/user lookup order, and batch transactional writes of missing
+servers.
+"""
+
+import json
+import os
+
+import pytest
+
+import nexkit
+from nexkit import check_mcp_server, install_mcp_servers, mcp
+
+
+SEQUENTIAL_TOKENS = ["server-sequential-thinking", "sequential-thinking", "sequentialthinking"]
+
+
+@pytest.fixture(autouse=True)
+def mcp_dirs(tmp_path, monkeypatch):
+    """Use a temporary project directory and user-level VS Code folder."""
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+    mcp.invalidate()
+    yield tmp_path
+    mcp.invalidate()
+
+
+def write_config(path, servers):
+    """Write an mcp.json with the given servers."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"servers": servers}), encoding="utf-8")
+
+
+def npx_server(*args):
+    """Build an npx-launched stdio server entry."""
+    return {"type": "stdio", "command": "npx", "args": ["-y", *args]}
+
+
+# Test: tokenisation
+def test_arg_tokens_package_segments():
+    """Test that scoped names yield the name, scope and segment runs."""
+    tokens = mcp.arg_tokens("@upstash/context7-mcp@latest")
+
+    for expected in ["@upstash/context7-mcp@latest", "@upstash/context7-mcp", "upstash", "context7", "context7-mcp", "mcp"]:
+        assert expected in tokens
+
+
+def test_arg_tokens_option_value():
+    """Test that option values are split from their flag."""
+    assert "azure-devops" in mcp.arg_tokens("--package=@azure-devops/mcp")
+
+
+# Test: lookup
+def test_find_server_in_project_then_user(mcp_dirs):
+    """Test that the project config wins over the user config."""
+    write_config(mcp.get_project_mcp_path(), {"seq": npx_server("@modelcontextprotocol/server-sequential-thinking")})
+    write_config(mcp.get_user_mcp_path(), {"context7": npx_server("@upstash/context7-mcp")})
+
+    assert mcp.find_configured_server(SEQUENTIAL_TOKENS) == "project"
+    assert mcp.find_configured_server(["context7"]) == "user"
+    assert mcp.find_configured_server(["azure-devops"]) is None
+
+
+def test_check_mcp_server_uses_index(mcp_dirs):
+    """Test check_mcp_server resolves configured servers without npx."""
+    write_config(mcp.get_user_mcp_path(), {"ado": npx_server("@azure-devops/mcp", "contoso")})
+
+    assert check_mcp_server("@azure-devops/mcp", ["azure-devops"]) == (True, "user")
+
+
+def test_malformed_config_has_no_servers(mcp_dirs):
+    """Test that a malformed file is reported, not raised, by the index."""
+    path = mcp.get_project_mcp_path()
+    path.parent.mkdir(parents=True)
+    path.write_text("{ not json", encoding="utf-8")
+
+    config = mcp.load_mcp_config(path)
+
+    assert config.error
+    assert config.find_server(["context7"]) is None
+    with pytest.raises(mcp.McpConfigError):
+        config.editable_data()
+
+
+# Test: caching
+def test_config_parsed_once(mcp_dirs, monkeypatch):
+    """Test that repeated lookups reuse one parse of each file."""
+    write_config(mcp.get_project_mcp_path(), {"context7": npx_server("@upstash/context7-mcp")})
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(mcp.json, "load", lambda f: loads.append(f.name) or real_load(f))
+
+    for _ in range(3):
+        mcp.find_configured_server(["context7"])
+        mcp.find_configured_server(["missing"])
+
+    assert loads == [str(mcp.get_project_mcp_path())]
+
+
+def test_config_reparsed_when_changed(mcp_dirs):
+    """Test that a changed file (mtime/size) is parsed again."""
+    path = mcp.get_project_mcp_path()
+    write_config(path, {"context7": npx_server("@upstash/context7-mcp")})
+    assert mcp.find_configured_server(["sequential-thinking"]) is None
+
+    write_config(path, {"seq": npx_server("@modelcontextprotocol/server-sequential-thinking")})
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert mcp.find_configured_server(["sequential-thinking"]) == "project"
+
+
+def test_editable_data_is_a_copy(mcp_dirs):
+    """Test that callers mutating the data do not corrupt the cached parse."""
+    path = mcp.get_user_mcp_path()
+    write_config(path, {"context7": npx_server("@upstash/context7-mcp")})
+
+    data = mcp.load_mcp_config(path).editable_data()
+    data["servers"]["extra"] = {}
+
+    assert "extra" not in mcp.load_mcp_config(path).servers
+    assert data["inputs"] == []
+
+
+# Test: batch writes
+def plan(key, path, *args, inputs=None):
+    """Build a server plan for path."""
+    return mcp.McpServerPlan(key=key, entry=npx_server(*args), path=path, inputs=inputs or [])
+
+
+def test_write_mcp_servers_batch(mcp_dirs):
+    """Test that several servers are merged with one backup and no temp files left."""
+    path = mcp.get_user_mcp_path()
+    write_config(path, {"existing": npx_server("other-mcp")})
+    original = path.read_text(encoding="utf-8")
+
+    mcp.write_mcp_servers(path, [
+        plan("context7", path, "@upstash/context7-mcp"),
+        plan("seq", path, "@modelcontextprotocol/server-sequential-thinking",
+             inputs=[{"id": "token", "type": "promptString"}]),
+    ])
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert set(data["servers"]) == {"existing", "context7", "seq"}
+    assert [i["id"] for i in data["inputs"]] == ["token"]
+    assert path.with_suffix(".bak").read_text(encoding="utf-8") == original
+    assert sorted(p.name for p in path.parent.iterdir()) == ["mcp.bak", "mcp.json"]
+    # The index sees the new servers immediately
+    assert mcp.find_configured_server(["context7"]) == "user"
+
+
+def test_write_mcp_servers_creates_file(mcp_dirs):
+    """Test writing to a missing mcp.json creates it without a backup."""
+    path = mcp.get_project_mcp_path()
+
+    mcp.write_mcp_servers(path, [plan("context7", path, "@upstash/context7-mcp")])
+
+    assert json.loads(path.read_text(encoding="utf-8"))["inputs"] == []
+    assert not path.with_suffix(".bak").exists()
+
+
+def test_write_mcp_servers_keeps_concurrent_edit(mcp_dirs, monkeypatch):
+    """Test that a change made while merging (e.g. by VS Code) is merged, not lost."""
+    path = mcp.get_user_mcp_path()
+    write_config(path, {"existing": npx_server("other-mcp")})
+    real_merge = mcp._merge_plans
+    edits = []
+
+    def merge_with_concurrent_edit(data, plans):
+        real_merge(data, plans)
+        if not edits:
+            edits.append(True)
+            write_config(path, {"existing": npx_server("other-mcp"), "vscode-added": npx_server("new-mcp-server")})
+    monkeypatch.setattr(mcp, "_merge_plans", merge_with_concurrent_edit)
+
+    mcp.write_mcp_servers(path, [plan("context7", path, "@upstash/context7-mcp")])
+
+    assert set(json.loads(path.read_text(encoding="utf-8"))["servers"]) == {"existing", "vscode-added", "context7"}
+
+
+def test_write_mcp_servers_malformed(mcp_dirs):
+    """Test that a malformed mcp.json is left untouched."""
+    path = mcp.get_user_mcp_path()
+    path.parent.mkdir(parents=True)
+    path.write_text("{ not json", encoding="utf-8")
+
+    with pytest.raises(mcp.McpConfigError):
+        mcp.write_mcp_servers(path, [plan("context7", path, "@upstash/context7-mcp")])
+    assert path.read_text(encoding="utf-8") == "{ not json"
+
+
+def test_install_mcp_servers_one_write_per_file(mcp_dirs, monkeypatch):
+    """Test that install prompts for every server first, then writes each file once."""
+    monkeypatch.setattr(nexkit.typer, "confirm", lambda *a, **k: True)
+    monkeypatch.setattr(nexkit.typer, "prompt", lambda *a, **k: "")
+    writes = []
+    real_write = mcp.write_mcp_servers
+    monkeypatch.setattr(mcp, "write_mcp_servers", lambda path, plans: writes.append(path) or real_write(path, plans))
+
+    results = install_mcp_servers([
+        ("@azure-devops/mcp", "AzureDevOps", "Azure DevOps MCP Server"),
+        ("@upstash/context7-mcp", "context7", "Context7 MCP Server"),
+        ("@modelcontextprotocol/server-sequential-thinking", "sequentialthinking", "Sequential Thinking MCP Server"),
+    ])
+
+    assert results == {"AzureDevOps": True, "context7": True, "sequentialthinking": True}
+    assert sorted(writes) == sorted([mcp.get_project_mcp_path(), mcp.get_user_mcp_path()])
+    project = json.loads(mcp.get_project_mcp_path().read_text(encoding="utf-8"))
+    assert project["servers"]["AzureDevOps"]["args"][2] == "${input:ado_org}"
+    assert [i["id"] for i in project["inputs"]] == ["ado_org"]
+    user = json.loads(mcp.get_user_mcp_path().read_text(encoding="utf-8"))
+    assert set(user["servers"]) == {"context7", "sequentialthinking"}
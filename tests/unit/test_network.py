@@ -0,0 +1,225 @@
+"""
+Unit tests for resumable downloads in nexkit.network.
+
+A local HTTP stand-in server serves a payload with an ETag, honours (or
+ignores) Range requests and deliberately drops connections part-way through
+the body.
+"""
+
+import gzip
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from nexkit.network import download_resumable, download_to_spool
+
+
+PAYLOAD = bytes(range(256)) * 400  # 100 KiB
+ETAG = '"payload-v1"'
+
+
+class FlakyServer:
+    """Local server that drops the first `drops` responses after `cut` bytes."""
+
+    def __init__(self, drops: int = 1, cut: int = 30_000, honour_range: bool = True,
+                 gzip_when_accepted: bool = False, force_gzip: bool = False, wrong_range_start: bool = False):
+        self.drops = drops
+        self.cut = cut
+        self.honour_range = honour_range
+        self.gzip_when_accepted = gzip_when_accepted
+        self.force_gzip = force_gzip
+        self.wrong_range_start = wrong_range_start
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                start = 0
+                range_header = self.headers.get("Range")
+                if (server.honour_range and range_header
+                        and self.headers.get("If-Range") == ETAG):
+                    start = 0 if server.wrong_range_start else int(range_header.split("=")[1].rstrip("-"))
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+                else:
+                    self.send_response(200)
+                body = PAYLOAD[start:]
+                accepted = self.headers.get("Accept-Encoding", "gzip")
+                if server.force_gzip or (server.gzip_when_accepted and "gzip" in accepted):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                if server.drops > 0:
+                    server.drops -= 1
+                    self.wfile.write(body[:server.cut])
+                    self.wfile.flush()
+                    # Drop the connection mid-body
+                    self.connection.shutdown(2)
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/asset.zip"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    with httpx.Client() as c:
+        yield c
+
+
+def test_download_without_interruption(tmp_path, client):
+    """Test a plain download with no drops."""
+    with FlakyServer(drops=0) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert not (tmp_path / "asset.zip.part").exists()
+    assert not (tmp_path / "asset.zip.part.json").exists()
+
+
+def test_download_resumes_after_drop(tmp_path, client):
+    """Test that a dropped connection is resumed with Range and If-Range."""
+    with FlakyServer(drops=1, cut=30_000) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert "Range" not in server.requests[0]
+    assert server.requests[1]["Range"] == "bytes=30000-"
+    assert server.requests[1]["If-Range"] == ETAG
+
+
+def test_download_resumes_across_runs(tmp_path, client):
+    """Test that a .part file left by a failed run is resumed by the next one."""
+    with FlakyServer(drops=1, cut=50_000) as server:
+        with pytest.raises(RuntimeError):
+            download_resumable(client, server.url, tmp_path / "asset.zip", attempts=1)
+        assert (tmp_path / "asset.zip.part").stat().st_size == 50_000
+        assert (tmp_path / "asset.zip.part.json").exists()
+
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.requests[-1]["Range"] == "bytes=50000-"
+
+
+def test_download_falls_back_when_range_ignored(tmp_path, client):
+    """Test a full re-download when the server ignores Range."""
+    with FlakyServer(drops=1, honour_range=False) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert len(server.requests) == 2
+
+
+def test_download_gives_up_after_attempts(tmp_path, client):
+    """Test that repeated drops fail after the configured attempts."""
+    with FlakyServer(drops=5, cut=1_000) as server:
+        with pytest.raises(RuntimeError, match="after 2 attempt"):
+            download_resumable(client, server.url, tmp_path / "asset.zip", attempts=2)
+        assert len(server.requests) == 2
+
+
+def test_download_discards_partial_when_not_kept(tmp_path, client):
+    """Test keep_partial=False removes the .part file on failure."""
+    with FlakyServer(drops=5, cut=1_000) as server:
+        with pytest.raises(RuntimeError):
+            download_resumable(client, server.url, tmp_path / "asset.zip", attempts=1, keep_partial=False)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_requests_identity_encoding(tmp_path, client):
+    """Test the body is requested unencoded so byte counts match Content-Length."""
+    with FlakyServer(drops=0, gzip_when_accepted=True) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.requests[0]["Accept-Encoding"] == "identity"
+
+
+def test_download_decodes_when_server_encodes_anyway(tmp_path, client):
+    """Test a server ignoring identity still yields the decoded file without a size mismatch."""
+    with FlakyServer(drops=0, force_gzip=True) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip", attempts=1)
+
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_download_restarts_when_resumed_at_wrong_offset(tmp_path, client):
+    """Test a 206 whose Content-Range does not start at our offset is not appended."""
+    with FlakyServer(drops=1, cut=30_000, wrong_range_start=True) as server:
+        dest = download_resumable(client, server.url, tmp_path / "asset.zip")
+
+    assert dest.read_bytes() == PAYLOAD
+    assert server.requests[1]["Range"] == "bytes=30000-"
+    assert "Range" not in server.requests[2]
+
+
+# Test: download_to_spool
+def test_spool_download_resumes_and_hashes(tmp_path, client, monkeypatch):
+    """Test an in-memory download that resumes after a drop and writes nothing to the cwd."""
+    monkeypatch.chdir(tmp_path)
+    with FlakyServer(drops=1, cut=30_000) as server:
+        spool, sha256 = download_to_spool(client, server.url)
+
+    with spool:
+        assert spool.read() == PAYLOAD
+    assert sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert server.requests[1]["Range"] == "bytes=30000-"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_download_restarts_hash_when_range_ignored(client):
+    """Test that a full re-download resets the buffer and the digest."""
+    with FlakyServer(drops=1, honour_range=False) as server:
+        spool, sha256 = download_to_spool(client, server.url, max_memory=1024)
+
+    with spool:
+        assert spool.read() == PAYLOAD
+    assert sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_spool_download_counts_raw_bytes(client):
+    """Test spooled downloads request identity encoding and still decode a forced encoding."""
+    with FlakyServer(drops=0, gzip_when_accepted=True) as server:
+        spool, sha256 = download_to_spool(client, server.url)
+    with spool:
+        assert spool.read() == PAYLOAD
+    assert server.requests[0]["Accept-Encoding"] == "identity"
+
+    with FlakyServer(drops=0, force_gzip=True) as server:
+        spool, sha256 = download_to_spool(client, server.url, attempts=1)
+    with spool:
+        assert spool.read() == PAYLOAD
+    assert sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_spool_download_restarts_when_resumed_at_wrong_offset(client):
+    """Test a 206 at the wrong offset resets the buffer instead of appending."""
+    with FlakyServer(drops=1, cut=30_000, wrong_range_start=True) as server:
+        spool, sha256 = download_to_spool(client, server.url)
+
+    with spool:
+        assert spool.read() == PAYLOAD
+    assert sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert "Range" not in server.requests[2]
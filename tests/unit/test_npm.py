@@ -0,0 +1,97 @@
+"""
+Unit tests for nexkit.npm module.
+
+Tests cover npm configuration lookup (.npmrc and environment) and offline
+resolution from the global node_modules, the _npx cache and the npm cache
+index, without running any subprocess.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+
+import pytest
+
+from nexkit import npm
+
+
+PACKAGE = "@upstash/context7-mcp"
+
+
+@pytest.fixture(autouse=True)
+def npm_env(tmp_path, monkeypatch):
+    """Point npm's prefix and cache at temporary directories."""
+    for name in list(os.environ):
+        if name.lower().startswith("npm_config_"):
+            monkeypatch.delenv(name)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path / "home"))
+    monkeypatch.setenv("npm_config_prefix", str(tmp_path / "prefix"))
+    monkeypatch.setenv("npm_config_cache", str(tmp_path / "cache"))
+    npm._npm_config.cache_clear()
+    yield tmp_path
+    npm._npm_config.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(monkeypatch):
+    """Fail the test if resolution tries to start a process."""
+    def forbidden(*args, **kwargs):
+        raise AssertionError("subprocess started during offline resolution")
+    monkeypatch.setattr(subprocess, "run", forbidden)
+    monkeypatch.setattr(subprocess, "Popen", forbidden)
+
+
+def write_package(package_dir):
+    """Create a minimal installed package."""
+    package_dir.mkdir(parents=True)
+    (package_dir / "package.json").write_text(json.dumps({"name": PACKAGE}))
+
+
+def test_not_found(npm_env):
+    """Test that an empty prefix and cache resolve nothing."""
+    assert npm.resolve_package_offline(PACKAGE) is None
+
+
+def test_global_package(npm_env):
+    """Test resolution from the global node_modules."""
+    lib = "node_modules" if os.name == "nt" else "lib/node_modules"
+    write_package(npm_env / "prefix" / lib / PACKAGE)
+
+    assert npm.resolve_package_offline(PACKAGE) == "global"
+
+
+def test_npx_cache_package(npm_env):
+    """Test resolution from a previous npx install."""
+    write_package(npm_env / "cache" / "_npx" / "3f2a1b" / "node_modules" / PACKAGE)
+
+    assert npm.resolve_package_offline(PACKAGE) == "npx-cache"
+
+
+def test_npm_cache_index(npm_env):
+    """Test resolution from the cached registry metadata."""
+    key = "make-fetch-happen:request-cache:https://registry.npmjs.org/@upstash%2fcontext7-mcp"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    bucket = npm_env / "cache" / "_cacache" / "index-v5" / digest[:2] / digest[2:4] / digest[4:]
+    bucket.parent.mkdir(parents=True)
+    bucket.write_text("entry")
+
+    assert npm.resolve_package_offline(PACKAGE) == "npm-cache"
+
+
+def test_npmrc_prefix_and_registry(npm_env, monkeypatch):
+    """Test that .npmrc settings are used when the environment does not set them."""
+    monkeypatch.delenv("npm_config_prefix")
+    home = npm_env / "home"
+    home.mkdir()
+    (home / ".npmrc").write_text(
+        "; comment\n"
+        f"prefix=${{NPM_TEST_ROOT}}/custom\n"
+        "registry=https://npm.example.com\n"
+    )
+    monkeypatch.setenv("NPM_TEST_ROOT", str(npm_env))
+    npm._npm_config.cache_clear()
+
+    assert npm.get_npm_prefix() == npm_env / "custom"
+    assert npm._packument_cache_key("a/b").endswith("https://npm.example.com/a%2fb")
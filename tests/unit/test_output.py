@@ -0,0 +1,90 @@
+"""
+Unit tests for nexkit.output module and StepTracker snapshots.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from nexkit.output import emit, error_record, to_jsonable
+from nexkit.ui import StepTracker
+
+
+@dataclass
+class Sample:
+    path: Path
+    items: List[Path] = field(default_factory=list)
+    pair: tuple = (1, Path("a/b"))
+
+    @property
+    def count(self) -> int:
+        return len(self.items)
+
+
+def test_to_jsonable_dataclass():
+    """Test dataclasses keep their fields and properties, paths become strings."""
+    sample = Sample(Path("/repo"), [Path("specs/spec.md")])
+
+    assert to_jsonable(sample) == {
+        "path": "/repo",
+        "items": ["specs/spec.md"],
+        "pair": [1, "a/b"],
+        "count": 1,
+    }
+
+
+def test_to_jsonable_nested():
+    """Test dictionaries and lists are converted recursively."""
+    assert to_jsonable({"x": [Sample(Path("p"))], 1: None}) == {
+        "x": [{"path": "p", "items": [], "pair": [1, "a/b"], "count": 0}],
+        "1": None,
+    }
+
+
+def test_emit_writes_one_line(capsys):
+    """Test each document is a single line of JSON."""
+    emit({"ok": True, "path": Path("a\nb")})
+
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert json.loads(out) == {"ok": True, "path": "a\nb"}
+
+
+def test_error_record():
+    """Test errors are reported with their type."""
+    assert error_record(FileNotFoundError("missing")) == {
+        "ok": False,
+        "error": {"type": "FileNotFoundError", "message": "missing"},
+    }
+    assert error_record("bad")["error"] == {"type": "Error", "message": "bad"}
+
+
+def test_tracker_snapshot_durations():
+    """Test steps report the monotonic time between start and finish."""
+    tracker = StepTracker("Test")
+    tracker.add("fetch", "Fetch")
+    tracker.add("pending", "Pending")
+    tracker.start("fetch")
+    time.sleep(0.02)
+    tracker.complete("fetch", "ok")
+    tracker.complete("instant", "done without start")
+
+    steps = {step["key"]: step for step in tracker.snapshot()}
+
+    assert steps["fetch"]["status"] == "done"
+    assert steps["fetch"]["detail"] == "ok"
+    assert 0.02 <= steps["fetch"]["duration"] < 1
+    assert steps["pending"]["duration"] is None
+    assert steps["instant"]["duration"] is None
+    assert json.loads(json.dumps(tracker.snapshot())) == tracker.snapshot()
+
+
+def test_tracker_snapshot_running_step():
+    """Test a running step reports the time elapsed so far."""
+    tracker = StepTracker("Test")
+    tracker.start("download")
+    time.sleep(0.01)
+
+    assert tracker.snapshot()[0]["duration"] >= 0.01
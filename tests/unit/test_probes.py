@@ -0,0 +1,78 @@
+"""
+Unit tests for nexkit.probes module.
+
+Tests cover concurrent execution, the global deadline, probe failures and
+tracker updates.
+"""
+
+import threading
+import time
+
+from nexkit.probes import remaining_time, run_probes
+from nexkit.ui import StepTracker
+
+
+def sleeper(seconds: float, ok: bool = True):
+    """Build a probe that sleeps, bounded by its deadline like a subprocess probe."""
+    def probe(deadline: float):
+        time.sleep(min(seconds, remaining_time(deadline, minimum=0)))
+        return ok, f"slept {seconds}"
+    return probe
+
+
+def test_probes_run_concurrently():
+    """Test that wall time is set by the slowest probe, not the sum."""
+    probes = {f"p{i}": sleeper(0.2) for i in range(6)}
+
+    start = time.monotonic()
+    results = run_probes(probes, max_workers=6)
+    elapsed = time.monotonic() - start
+
+    assert all(r.ok for r in results.values())
+    assert elapsed < 0.6
+
+
+def test_results_keep_probe_order():
+    """Test that results are returned in probe order, not completion order."""
+    probes = {"slow": sleeper(0.1), "fast": sleeper(0)}
+
+    assert list(run_probes(probes)) == ["slow", "fast"]
+
+
+def test_deadline_times_out_slow_probes():
+    """Test that probes still running at the deadline are reported as timed out."""
+    release = threading.Event()
+    probes = {"fast": sleeper(0), "slow": lambda deadline: (release.wait(5), "late")}
+
+    start = time.monotonic()
+    results = run_probes(probes, deadline_seconds=0.3)
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert results["fast"].ok
+    assert results["slow"].timed_out
+    assert not results["slow"].ok
+    assert elapsed < 1.0
+
+
+def test_probe_exception_is_an_error():
+    """Test that a probe raising is reported as a failure, not propagated."""
+    def broken(deadline):
+        raise OSError("boom")
+
+    results = run_probes({"broken": broken})
+
+    assert not results["broken"].ok
+    assert "boom" in results["broken"].detail
+
+
+def test_tracker_updated_per_probe():
+    """Test that each probe's outcome lands on its tracker step."""
+    tracker = StepTracker("Check")
+    tracker.add("yes", "Present")
+    tracker.add("no", "Missing")
+
+    run_probes({"yes": sleeper(0, ok=True), "no": sleeper(0, ok=False)}, tracker)
+
+    status = {s["key"]: s["status"] for s in tracker.steps}
+    assert status == {"yes": "done", "no": "error"}
@@ -0,0 +1,218 @@
+"""
+Unit tests for template extraction in nexkit.template.
+
+Tests cover stripping the archive's common root directory, merge and
+overwrite semantics for existing projects, rejection of unsafe member
+paths and execute bits applied during extraction.
+"""
+
+import io
+import os
+import shutil
+import stat
+import subprocess
+import zipfile
+
+import pytest
+
+from nexkit.template import extract_template_archive
+
+
+def make_archive(members: dict, modes: dict = None) -> zipfile.ZipFile:
+    """Build an in-memory zip archive from a {name: content} mapping.
+
+    Members listed in modes get Unix permission bits; all others are stored
+    without any, as archives created on Windows are.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            info = zipfile.ZipInfo(name)
+            if modes and name in modes:
+                info.create_system = 3
+                info.external_attr = modes[name] << 16
+            else:
+                info.create_system = 0
+            zf.writestr(info, content)
+    return zipfile.ZipFile(buffer)
+
+
+def is_executable(path) -> bool:
+    """Return whether the owner execute bit is set."""
+    return bool(path.stat().st_mode & stat.S_IXUSR)
+
+
+def test_strips_common_root(tmp_path):
+    """Test that a single root directory is flattened in one pass."""
+    archive = make_archive({
+        "nexkit-template/README.md": "readme",
+        "nexkit-template/.nexkit/scripts/setup.sh": "#!/bin/sh\n",
+    })
+
+    result = extract_template_archive(archive, tmp_path / "project")
+
+    assert result.root_prefix == "nexkit-template/"
+    assert result.files == 2
+    assert (tmp_path / "project" / "README.md").read_text() == "readme"
+    assert (tmp_path / "project" / ".nexkit" / "scripts" / "setup.sh").exists()
+    assert not (tmp_path / "project" / "nexkit-template").exists()
+
+
+def test_keeps_multiple_roots(tmp_path):
+    """Test that archives without a single root directory are extracted as-is."""
+    archive = make_archive({"a/one.txt": "1", "b/two.txt": "2"})
+
+    result = extract_template_archive(archive, tmp_path)
+
+    assert result.root_prefix == ""
+    assert (tmp_path / "a" / "one.txt").exists()
+    assert (tmp_path / "b" / "two.txt").exists()
+
+
+def test_lone_file_is_not_a_root(tmp_path):
+    """Test that a single top-level file is not treated as a root directory."""
+    archive = make_archive({"README.md": "readme"})
+
+    result = extract_template_archive(archive, tmp_path)
+
+    assert result.root_prefix == ""
+    assert (tmp_path / "README.md").read_text() == "readme"
+
+
+def test_merges_into_existing_directory(tmp_path):
+    """Test --here semantics: existing directories are merged and files overwritten."""
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / "keep.md").write_text("mine")
+    (tmp_path / "README.md").write_text("old")
+    archive = make_archive({
+        "root/.github/agent.md": "agent",
+        "root/README.md": "new",
+        "root/NEW.md": "added",
+    })
+
+    result = extract_template_archive(archive, tmp_path)
+
+    assert (tmp_path / ".github" / "keep.md").read_text() == "mine"
+    assert (tmp_path / ".github" / "agent.md").read_text() == "agent"
+    assert (tmp_path / "README.md").read_text() == "new"
+    assert result.merged_dirs == [".github/"]
+    assert result.overwritten == ["README.md"]
+    assert result.created == 2
+    assert result.summary() == "3 files (2 new, 1 overwritten)"
+
+
+def test_new_directories_are_not_reported_as_merged(tmp_path):
+    """Test that directories created by the extraction itself are not merges."""
+    archive = make_archive({"root/docs/a.md": "a", "root/docs/b.md": "b"})
+
+    result = extract_template_archive(archive, tmp_path)
+
+    assert result.merged_dirs == []
+    assert result.overwritten == []
+
+
+@pytest.mark.parametrize("name", ["../evil.txt", "root/../../evil.txt", "/etc/evil.txt"])
+def test_rejects_unsafe_paths(tmp_path, name):
+    """Test that members escaping the destination are rejected."""
+    archive = make_archive({name: "x", "other/file.txt": "y"})
+
+    with pytest.raises(ValueError):
+        extract_template_archive(archive, tmp_path / "project")
+    assert not (tmp_path / "evil.txt").exists()
+
+
+# Test: permission bits
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+
+
+@posix_only
+def test_applies_archive_exec_bits(tmp_path):
+    """Test that execute bits stored in the archive are honoured."""
+    archive = make_archive(
+        {"root/tool": "binary", "root/run.sh": "no shebang\n"},
+        modes={"root/tool": 0o755, "root/run.sh": 0o750},
+    )
+
+    result = extract_template_archive(archive, tmp_path)
+
+    assert is_executable(tmp_path / "tool")
+    assert is_executable(tmp_path / "run.sh")
+    assert result.executables == 2
+
+
+@posix_only
+def test_shebang_fallback_for_non_executable_archive_modes(tmp_path):
+    """Test scripts zipped from 100644 git checkouts still become executable."""
+    archive = make_archive(
+        {
+            "root/.nexkit/scripts/bash/setup.sh": "#!/usr/bin/env bash\n",
+            "root/.nexkit/scripts/bash/lib.sh": "# sourced, no shebang\n",
+            "root/README.md": "#!not a script",
+        },
+        modes={
+            "root/.nexkit/scripts/bash/setup.sh": 0o644,
+            "root/.nexkit/scripts/bash/lib.sh": 0o644,
+            "root/README.md": 0o644,
+        },
+    )
+
+    result = extract_template_archive(archive, tmp_path)
+
+    scripts = tmp_path / ".nexkit" / "scripts" / "bash"
+    assert is_executable(scripts / "setup.sh")
+    assert not is_executable(scripts / "lib.sh")
+    assert not is_executable(tmp_path / "README.md")
+    assert result.executables == 1
+
+
+@posix_only
+def test_zip_r_archive_scripts_are_executable(tmp_path):
+    """Test an archive built like the release assets (zip -r, 100644 scripts)."""
+    zip_tool = shutil.which("zip")
+    if not zip_tool:
+        pytest.skip("zip is not installed")
+    source = tmp_path / "nexkit-template"
+    (source / ".nexkit" / "scripts").mkdir(parents=True)
+    script = source / ".nexkit" / "scripts" / "setup.sh"
+    script.write_text("#!/usr/bin/env bash\n")
+    script.chmod(0o644)
+    subprocess.run([zip_tool, "-qr", "template.zip", "nexkit-template"], cwd=tmp_path, check=True)
+
+    with zipfile.ZipFile(tmp_path / "template.zip") as archive:
+        result = extract_template_archive(archive, tmp_path / "project")
+
+    assert is_executable(tmp_path / "project" / ".nexkit" / "scripts" / "setup.sh")
+    assert result.executables == 1
+
+
+@posix_only
+def test_shebang_fallback_without_archive_modes(tmp_path):
+    """Test the shebang heuristic for members without Unix permissions."""
+    archive = make_archive({
+        "root/.nexkit/scripts/setup.sh": "#!/usr/bin/env bash\n",
+        "root/.nexkit/scripts/lib.sh": "# sourced, no shebang\n",
+        "root/README.md": "#!not a script",
+    })
+
+    result = extract_template_archive(archive, tmp_path)
+
+    scripts = tmp_path / ".nexkit" / "scripts"
+    assert is_executable(scripts / "setup.sh")
+    assert not is_executable(scripts / "lib.sh")
+    assert not is_executable(tmp_path / "README.md")
+    assert result.executables == 1
+
+
+def test_reports_progress_per_file(tmp_path):
+    """Test the progress callback receives every written file and the total."""
+    archive = make_archive({
+        "root/": "",
+        "root/a.md": "a",
+        "root/docs/b.md": "b",
+        "root/docs/c.md": "c",
+    })
+    calls = []
+
+    extract_template_archive(archive, tmp_path, on_progress=lambda done, total: calls.append((done, total)))
+
+    assert calls == [(1, 3), (2, 3), (3, 3)]
@@ -0,0 +1,262 @@
+"""
+Unit tests for the StepTracker in nexkit.ui module.
+"""
+
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from rich.console import Console
+from rich.live import Live
+from rich.text import Text
+
+from nexkit import ui
+from nexkit.ui import StepTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_steps_keep_insertion_order():
+    """Test steps are listed in the order they were first added."""
+    tracker = StepTracker("Test")
+    tracker.add("b", "Second")
+    tracker.add("a", "First")
+    tracker.complete("c", "implicit")
+    tracker.add("b", "Renamed")  # existing keys are not replaced
+
+    assert [(s["key"], s["label"]) for s in tracker.steps] == [("b", "Second"), ("a", "First"), ("c", "c")]
+
+
+def test_render_is_cached_until_dirty():
+    """Test the tree is only rebuilt after an update."""
+    tracker = StepTracker("Test")
+    tracker.add("a", "A")
+
+    first = tracker.render()
+    assert not tracker.dirty
+    assert tracker.render() is first
+
+    tracker.start("a")
+    assert tracker.dirty
+    assert tracker.render() is not first
+
+
+def test_refresh_rate_limited(monkeypatch):
+    """Test bursts of updates trigger at most one refresh per frame, plus a final flush."""
+    clock = FakeClock()
+    monkeypatch.setattr(ui.time, "monotonic", clock)
+    tracker = StepTracker("Test")
+    calls = []
+    tracker.attach_refresh(lambda: calls.append(tracker.render()))
+
+    for i in range(100):
+        tracker.add(f"s{i}", f"Step {i}")
+    assert len(calls) == 1
+
+    clock.now += StepTracker.FRAME_INTERVAL
+    tracker.complete("s1")
+    assert len(calls) == 2
+
+    tracker.complete("s2")
+    assert len(calls) == 2 and tracker.dirty
+
+    tracker.flush()
+    assert len(calls) == 3 and not tracker.dirty
+    tracker.flush()
+    assert len(calls) == 3
+
+
+def test_live_renders_tracker_lazily():
+    """Test the tracker can be handed to Live directly."""
+    output = io.StringIO()
+    console = Console(file=output, force_terminal=True, width=80)
+    tracker = StepTracker("Live Test")
+    tracker.add("a", "Alpha")
+
+    with Live(tracker, console=console, auto_refresh=False) as live:
+        tracker.complete("a", "finished")
+        live.refresh()
+
+    assert "finished" in output.getvalue()
+
+
+# Wall-clock comparisons are noisy on shared runners; opt in with NEXKIT_BENCHMARK=1.
+benchmark = pytest.mark.skipif(not os.getenv("NEXKIT_BENCHMARK"), reason="set NEXKIT_BENCHMARK=1 to run")
+
+
+def make_benchmark_tracker() -> StepTracker:
+    tracker = StepTracker("Benchmark")
+    for i in range(20):
+        tracker.add(f"s{i}", f"Step {i}")
+    return tracker
+
+
+def test_coalesced_updates_render_once_per_frame(monkeypatch):
+    """Test 10k updates cost one render per elapsed frame plus the final flush."""
+    clock = FakeClock()
+    monkeypatch.setattr(ui.time, "monotonic", clock)
+    tracker = make_benchmark_tracker()
+    renders = []
+    tracker.attach_refresh(lambda: renders.append(tracker.render()))
+
+    for i in range(10_000):
+        tracker.start(f"s{i % 20}", str(i))
+    assert len(renders) == 1
+
+    for i in range(10_000):
+        if i % 1_000 == 0:
+            clock.now += StepTracker.FRAME_INTERVAL
+        tracker.start(f"s{i % 20}", str(i))
+    assert len(renders) == 11
+
+    tracker.flush()
+    assert len(renders) == 12
+
+
+@benchmark
+def test_benchmark_coalesced_updates():
+    """Micro-benchmark: 10k coalesced updates cost far less than 10k renders."""
+    updates = 10_000
+    sink = Console(file=io.StringIO(), width=100)
+
+    def paint(tracker):
+        sink.print(tracker.render())
+
+    # Previous behaviour: every update re-renders the tree. That takes
+    # seconds for 10k updates, so time a sample and extrapolate.
+    sample = 500
+    eager = make_benchmark_tracker()
+    eager.attach_refresh(lambda: paint(eager), frame_interval=0)
+    start = time.perf_counter()
+    for i in range(sample):
+        eager.start(f"s{i % 20}", str(i))
+    eager_seconds = (time.perf_counter() - start) * updates / sample
+
+    coalesced = make_benchmark_tracker()
+    coalesced.attach_refresh(lambda: paint(coalesced))
+    start = time.perf_counter()
+    for i in range(updates):
+        coalesced.start(f"s{i % 20}", str(i))
+    coalesced.flush()
+    coalesced_seconds = time.perf_counter() - start
+
+    assert coalesced_seconds * 10 < eager_seconds, (coalesced_seconds, eager_seconds)
+
+
+def plain(label) -> str:
+    """Return a rendered tree label without markup."""
+    return Text.from_markup(str(label)).plain
+
+
+def test_nested_steps_render_under_parent():
+    """Test sub-steps are drawn as branches of their parent."""
+    tracker = StepTracker("Nested")
+    tracker.add("extract", "Extract")
+    tracker.add("list", "List", parent="extract")
+    tracker.add("git", "Git")
+    tracker.add("chmod", "Chmod", parent="extract")
+
+    tree = tracker.render()
+
+    assert [plain(c.label) for c in tree.children] == ["○ Extract", "○ Git"]
+    assert [plain(c.label) for c in tree.children[0].children] == ["○ List", "○ Chmod"]
+    assert {s["key"]: s["parent"] for s in tracker.snapshot()} == {
+        "extract": None, "list": "extract", "git": None, "chmod": "extract",
+    }
+
+
+def test_starting_sub_step_starts_parent():
+    """Test a parent is timed from its first running sub-step."""
+    tracker = StepTracker("Nested")
+    tracker.add("probe", "Probe")
+    tracker.add("probe-a", "A", parent="probe")
+
+    tracker.start("probe-a")
+
+    steps = {s["key"]: s for s in tracker.snapshot()}
+    assert steps["probe"]["status"] == "running"
+    assert steps["probe"]["duration"] is not None
+
+
+def test_progress_counters():
+    """Test counters are set, advanced, keep their total and are rendered."""
+    tracker = StepTracker("Progress")
+    tracker.add("download", "Download")
+
+    tracker.set_progress("download", "bytes", 512 * 1024, 2 * 1024 * 1024)
+    tracker.set_progress("download", "bytes", 1024 * 1024)
+    tracker.advance("download", "files")
+    tracker.advance("download", "files", 2)
+
+    step = tracker.snapshot()[0]
+    assert step["status"] == "running"  # first progress report starts the step
+    assert step["progress"] == {
+        "bytes": {"done": 1024 * 1024, "total": 2 * 1024 * 1024},
+        "files": {"done": 3, "total": None},
+    }
+    assert plain(tracker.render().children[0].label) == "○ Download (1.0/2.0 MB, 3 files)"
+
+
+def test_step_context_manager():
+    """Test blocks are timed as steps and failures are recorded."""
+    tracker = StepTracker("Blocks")
+
+    with tracker.step("ok", "Works"):
+        pass
+    with tracker.step("skipped", "Skipped"):
+        tracker.skip("skipped", "not needed")
+    try:
+        with tracker.step("fails", "Fails"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    steps = {s["key"]: s for s in tracker.snapshot()}
+    assert steps["ok"]["status"] == "done" and steps["ok"]["duration"] >= 0
+    assert steps["skipped"]["status"] == "skipped"
+    assert (steps["fails"]["status"], steps["fails"]["detail"]) == ("error", "boom")
+
+
+def test_concurrent_updates_from_worker_threads():
+    """Test worker threads can update their own sub-steps while the tree is rendered."""
+    tracker = StepTracker("Workers")
+    tracker.add("pool", "Pool")
+    workers, files = 8, 500
+    stop = threading.Event()
+
+    def draw():
+        while not stop.is_set():
+            tracker.render()
+            tracker.snapshot()
+
+    def work(n):
+        key = f"worker-{n}"
+        with tracker.step(key, f"Worker {n}", parent="pool"):
+            for _ in range(files):
+                tracker.advance(key, "files")
+                tracker.advance("pool", "files")
+
+    renderer = threading.Thread(target=draw)
+    renderer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(work, range(workers)))
+    finally:
+        stop.set()
+        renderer.join()
+
+    steps = {s["key"]: s for s in tracker.snapshot()}
+    assert steps["pool"]["progress"]["files"]["done"] == workers * files
+    assert all(steps[f"worker-{n}"]["progress"]["files"]["done"] == files for n in range(workers))
+    assert all(steps[f"worker-{n}"]["status"] == "done" for n in range(workers))
+    assert len(tracker.render().children[0].children) == workers
@@ -1,14 +1,17 @@
 """Unit tests for version display functionality."""
 import unittest
 from unittest.mock import patch, MagicMock
+import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from nexkit import get_version, get_git_tag
+from nexkit import buildinfo
 
 
 class TestVersionFunctions(unittest.TestCase):
@@ -69,5 +72,72 @@ class TestVersionFunctions(unittest.TestCase):
             self.assertEqual(git_tag, "v1.2.3-4-gabcdef")
 
 
+class TestBuildTag(unittest.TestCase):
+    """Test cached build identifier resolution."""
+
+    def setUp(self):
+        buildinfo.get_build_tag.cache_clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "build-info.json"
+        patcher = patch.object(buildinfo, "get_build_cache_path", return_value=self.cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(buildinfo.get_build_tag.cache_clear)
+
+    def test_get_build_tag_without_git_dir_spawns_nothing(self):
+        """Test that installed copies (no .git) resolve without a subprocess."""
+        with patch.object(buildinfo, "find_git_dir", return_value=None), \
+             patch('subprocess.run') as mock_run:
+            self.assertEqual(buildinfo.get_build_tag(), "unknown")
+            mock_run.assert_not_called()
+
+    def test_get_build_tag_uses_cache(self):
+        """Test that git describe runs once and later runs hit the cache."""
+        git_dir = Path(self.temp_dir.name) / ".git"
+        (git_dir / "refs" / "tags").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "v1.2.3\n"
+
+        with patch.object(buildinfo, "find_git_dir", return_value=git_dir), \
+             patch('subprocess.run', return_value=mock_result) as mock_run:
+            self.assertEqual(buildinfo.get_build_tag(), "v1.2.3")
+            buildinfo.get_build_tag.cache_clear()
+            self.assertEqual(buildinfo.get_build_tag(), "v1.2.3")
+            self.assertEqual(mock_run.call_count, 1)
+        self.assertTrue(self.cache_path.exists())
+
+    def test_get_build_tag_invalidated_by_git_changes(self):
+        """Test that a change to HEAD invalidates the cached build."""
+        git_dir = Path(self.temp_dir.name) / ".git"
+        git_dir.mkdir()
+        head = git_dir / "HEAD"
+        head.write_text("ref: refs/heads/main\n")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "v1.2.3\n"
+
+        with patch.object(buildinfo, "find_git_dir", return_value=git_dir), \
+             patch('subprocess.run', return_value=mock_result) as mock_run:
+            buildinfo.get_build_tag()
+            buildinfo.get_build_tag.cache_clear()
+            stat = head.stat()
+            os.utime(head, (stat.st_atime, stat.st_mtime + 10))
+            buildinfo.get_build_tag()
+            self.assertEqual(mock_run.call_count, 2)
+
+    def test_get_build_tag_prefers_stamped_build(self):
+        """Test that a build stamped at build time wins over git."""
+        stamped = MagicMock(BUILD_TAG="v9.9.9")
+        with patch.dict(sys.modules, {"nexkit._build": stamped}), \
+             patch('subprocess.run') as mock_run:
+            self.assertEqual(buildinfo.get_build_tag(), "v9.9.9")
+            mock_run.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()